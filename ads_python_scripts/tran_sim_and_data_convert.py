@@ -3,6 +3,7 @@ from keysight.ads.de import db_uu as db
 from keysight.ads.de.db import LayerId
 from keysight.edatoolbox import ads
 import os
+import json
 import keysight.ads.dataset as dataset
 import matplotlib.pyplot as plt
 from IPython.core import getipython
@@ -24,6 +25,14 @@ print("Please enter schematic_name:/n")
 lib_name = "SOA_Tran_Check.lib"
 schematic_name = "TB_EF_Tran"
 
+# --- Export Format ---
+# "csv": <schematic_name>.csv (default; text, readable in spreadsheets)
+# "npy": <schematic_name>_npy/ with one float64 .npy file per column plus manifest.json,
+#        the binary dataset layout of the analyzer (core/dataset.py). The analyzer
+#        memory-maps it instead of parsing text: open manifest.json with "Load CSV Data",
+#        or pass the directory to `python main.py batch`.
+export_format = "csv"
+
 # --- Open Design ---
 # Open the design using the standard ADS format: "Library:Cell:View"
 design = db.open_design(f"{lib_name}:{schematic_name}:schematic")
@@ -70,11 +79,36 @@ for data_block in output_data.find_varblocks_with_var_name("time"):
 # 3. Use reset_index() to move the index (likely 'time') into a standard column.
 mydata = output_data[time_block_name].to_dataframe().reset_index()
 
-# --- Export to CSV ---
-# Define the file path for the CSV output
-csv_file_path = os.path.join(target_output_dir, f"{schematic_name}" + ".csv")
+if export_format == "npy":
+    # --- Export as binary dataset ---
+    npy_dir = os.path.join(target_output_dir, f"{schematic_name}" + "_npy")
+    manifest_path = os.path.join(npy_dir, "manifest.json")
+    os.makedirs(npy_dir, exist_ok=True)
+    # The manifest is written last, so an interrupted export is never picked up as complete
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    columns = [str(col) for col in mydata.columns]
+    files = [f"c{i}.npy" for i in range(len(columns))]
+    for col, file_name in zip(mydata.columns, files):
+        values = np.ascontiguousarray(mydata[col].to_numpy(dtype=np.float64))
+        np.save(os.path.join(npy_dir, file_name), values, allow_pickle=False)
+
+    manifest = {
+        "source": os.path.join(target_output_dir, f"{schematic_name}" + ".ds"),
+        "rows": len(mydata),
+        "columns": columns,
+        "files": files,
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    print("Ds is converted to binary dataset:", npy_dir)
+else:
+    # --- Export to CSV ---
+    # Define the file path for the CSV output
+    csv_file_path = os.path.join(target_output_dir, f"{schematic_name}" + ".csv")
 
-# Write the DataFrame to a CSV file
-mydata.to_csv(csv_file_path)
+    # Write the DataFrame to a CSV file (without the row index, which is not a signal)
+    mydata.to_csv(csv_file_path, index=False)
 
-print("Ds is converted to Dataframe.")
\ No newline at end of file
+    print("Ds is converted to Dataframe.")
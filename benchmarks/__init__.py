@@ -0,0 +1 @@
+"""Synthetic ADS-style datasets and timing benchmarks for ADS SOA Analyzer."""
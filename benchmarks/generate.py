@@ -0,0 +1,116 @@
+"""
+Generate ADS-like transient CSV exports of configurable size.
+
+Column layout follows what `tran_sim_and_data_convert.py` writes (no index
+column): `time`, then per-BJT terminal/internal node voltages and branch
+currents with hierarchical names (e.g. `Testbench.X3.Q12.Q12.c`), resistor
+contact currents, source currents and `tranorder`.
+
+Usage:
+    python -m benchmarks.generate out.csv --bjts 200 --resistors 50 --rows 20000 --density 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+
+def generate_frame(
+    n_bjt: int = 200,
+    n_res: int = 50,
+    n_rows: int = 20_000,
+    density: float = 0.01,
+    n_sub: int = 8,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Build a synthetic transient dataset.
+
+    `density` is the fraction of samples per device that exceed the default
+    limits of `soa_limits_ex.json` (VCE, IC and resistor current).
+    """
+    rng = np.random.default_rng(seed)
+    # ADS adaptive stepping: non-uniform time axis
+    dt = rng.lognormal(mean=np.log(1e-11), sigma=0.6, size=n_rows)
+    t = np.concatenate(([0.0], np.cumsum(dt[:-1])))
+    span = t[-1] if n_rows > 1 else 1.0
+    # sin(x) > cos(pi * density) for a fraction `density` of each period
+    threshold = np.cos(np.pi * density)
+
+    def phase(count: int) -> np.ndarray:
+        freq = rng.uniform(2.0, 20.0, size=(count, 1)) / span
+        return 2 * np.pi * freq * t[None, :] + rng.uniform(0, 2 * np.pi, size=(count, 1))
+
+    cols: Dict[str, np.ndarray] = {"time": t}
+
+    ph = phase(n_bjt)
+    over = np.sin(ph) > threshold
+    vc = 1.2 + 0.4 * np.cos(ph) + 2.5 * over
+    vb = 0.75 + 0.05 * np.sin(3 * ph)
+    ve = 0.02 * np.sin(5 * ph)
+    ic = 0.005 + 0.002 * np.cos(ph) + 0.02 * over
+    ib = ic / 100.0
+    ie = -(ic + ib)
+    temp = 27.0 + 40.0 * (1 + np.cos(ph))
+    for k in range(n_bjt):
+        q = f"Q{k}"
+        p = f"Testbench.X{k % n_sub}.{q}"
+        cols[f"{p}.bi"] = ib[k]
+        cols[f"{p}.ci"] = ic[k]
+        cols[f"{p}.{q}.t"] = temp[k]
+        cols[f"{p}.{q}.c"] = vc[k]
+        cols[f"{p}.{q}.cx"] = vc[k] - 1e-3
+        cols[f"{p}.{q}.ci"] = ic[k]
+        cols[f"{p}.{q}.b"] = vb[k]
+        cols[f"{p}.{q}.bx"] = vb[k] - 1e-3
+        cols[f"{p}.{q}.bi"] = ib[k]
+        cols[f"{p}.e"] = ve[k]
+        cols[f"{p}.{q}.e"] = ve[k]
+        cols[f"{p}.{q}.ei"] = ie[k]
+
+    ph = phase(n_res)
+    ir = 0.005 * np.cos(ph) + 0.01 * (np.sin(ph) > threshold)
+    for k in range(n_res):
+        cols[f"Testbench.X{k % n_sub}.R{k}.R_contact.i"] = ir[k]
+
+    cols["SRC1.i"] = -ic.sum(axis=0) if n_bjt else np.zeros(n_rows)
+    cols["SRC2.i"] = np.full(n_rows, -9.6e-5)
+    cols["tranorder"] = np.ones(n_rows)
+    return pd.DataFrame(cols)
+
+
+def write_csv(path: str, **kwargs) -> pd.DataFrame:
+    """Generate a dataset and write it the way the ADS conversion script does (without index column)."""
+    df = generate_frame(**kwargs)
+    df.to_csv(path, index=False)
+    return df
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("out", help="output CSV path")
+    ap.add_argument("--bjts", type=int, default=200)
+    ap.add_argument("--resistors", type=int, default=50)
+    ap.add_argument("--rows", type=int, default=20_000)
+    ap.add_argument("--density", type=float, default=0.01, help="fraction of violating samples per device")
+    ap.add_argument("--subcircuits", type=int, default=8, help="number of X* hierarchy instances")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+    write_csv(
+        args.out,
+        n_bjt=args.bjts,
+        n_res=args.resistors,
+        n_rows=args.rows,
+        density=args.density,
+        n_sub=args.subcircuits,
+        seed=args.seed,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,201 @@
+"""
+Timed benchmarks for the load / discovery / analysis / GUI pipeline.
+
+Generates a synthetic ADS-like CSV (see benchmarks.generate), times each stage
+and writes a JSON results file. Pass `--compare` with an earlier results file
+to print per-benchmark speed ratios between versions.
+
+Usage:
+    python -m benchmarks.run --bjts 500 --rows 50000 --out bench.json
+    python -m benchmarks.run --out new.json --compare old.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.generate import write_csv  # noqa: E402
+from core.analysis import analyze_all  # noqa: E402
+from core.config import load_limits  # noqa: E402
+from core.parser import load_csv_columns, read_csv_header, required_columns, scan_columns, scan_csv_columns  # noqa: E402
+
+DEFAULT_LIMITS = os.path.join(ROOT, "soa_limits_ex.json")
+
+
+def timeit(fn: Callable[[], object], repeat: int) -> Dict:
+    """Best-of-`repeat` wall time of `fn`."""
+    runs: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return {"seconds": min(runs), "runs": runs}
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=ROOT, capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_core(path: str, limits_path: str, repeat: int) -> Dict[str, Dict]:
+    defaults, overrides = load_limits(limits_path)
+    results: Dict[str, Dict] = {}
+
+    results["read_csv_full"] = timeit(lambda: pd.read_csv(path), repeat)
+    df_full = pd.read_csv(path)
+    results["scan_csv_columns"] = timeit(lambda: scan_csv_columns(df_full, defaults, overrides), repeat)
+    results["scan_header"] = timeit(lambda: scan_columns(read_csv_header(path), defaults, overrides), repeat)
+
+    bjt, res, time_col = scan_csv_columns(df_full, defaults, overrides)
+    cols = required_columns(bjt, res, time_col)
+    results["read_csv_selected"] = timeit(lambda: load_csv_columns(path, cols), repeat)
+    df = load_csv_columns(path, cols)
+
+    for engine in ("serial", "batched"):
+        results[f"analyze_all_{engine}"] = timeit(lambda: analyze_all(df, bjt, res, time_col, engine=engine), repeat)
+    results["analyze_all_episodes"] = timeit(lambda: analyze_all(df, bjt, res, time_col, episodes=True), repeat)
+    return results
+
+
+def run_gui(path: str, limits_path: str, repeat: int) -> Dict[str, Dict]:
+    """Table population and plot rendering on an offscreen Qt platform."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt6 import QtWidgets
+    except ImportError:
+        return {"gui": {"skipped": "PyQt6 not installed"}}
+
+    from gui.main_window import MainWindow
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    win = MainWindow()
+    defaults, overrides = load_limits(limits_path)
+    win.state.defaults, win.state.overrides = defaults, overrides
+    win.state.df = load_csv_columns(path, required_columns(*scan_columns(read_csv_header(path), {}, {})))
+    win.refresh_devices_and_analysis()
+    win.wait_for_jobs()
+    app.processEvents()
+
+    results: Dict[str, Dict] = {}
+    results["populate_device_tree"] = timeit(win.populate_device_tree, repeat)
+    results["populate_violation_table"] = timeit(win.populate_violation_table, repeat)
+    if win.state.bjt_devices:
+        name = win.state.bjt_devices[0].name
+        results["show_bjt_plots"] = timeit(lambda: (win.clear_plot_cache(), win.show_bjt_plots(name)), repeat)
+        results["show_bjt_plots_cached"] = timeit(lambda: win.show_bjt_plots(name), repeat)
+    if win.state.res_devices:
+        name = win.state.res_devices[0].name
+        results["show_res_plots"] = timeit(lambda: (win.clear_plot_cache(), win.show_res_plots(name)), repeat)
+        results["show_res_plots_cached"] = timeit(lambda: win.show_res_plots(name), repeat)
+    win.close()
+    return results
+
+
+def run_startup(repeat: int) -> Dict[str, Dict]:
+    """Wall time of `python main.py --profile-startup` (fresh interpreter to first painted window, then exit)."""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    cmd = [sys.executable, os.path.join(ROOT, "main.py"), "--profile-startup"]
+    try:
+        result = timeit(lambda: subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, timeout=120, check=True), repeat)
+    except (OSError, subprocess.SubprocessError) as e:
+        return {"startup_first_window": {"skipped": str(e)}}
+    return {"startup_first_window": result}
+
+
+def compare(current: Dict, baseline: Dict) -> str:
+    lines = [f"{'benchmark':<30}{'baseline s':>12}{'current s':>12}{'speedup':>10}"]
+    for name, cur in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or "seconds" not in base or "seconds" not in cur:
+            continue
+        ratio = base["seconds"] / cur["seconds"] if cur["seconds"] > 0 else float("inf")
+        lines.append(f"{name:<30}{base['seconds']:>12.4f}{cur['seconds']:>12.4f}{ratio:>9.2f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--bjts", type=int, default=200)
+    ap.add_argument("--resistors", type=int, default=50)
+    ap.add_argument("--rows", type=int, default=20_000)
+    ap.add_argument("--density", type=float, default=0.01)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--limits", default=DEFAULT_LIMITS)
+    ap.add_argument("--csv", help="benchmark an existing CSV instead of generating one")
+    ap.add_argument("--no-gui", action="store_true", help="skip Qt table/plot benchmarks")
+    ap.add_argument("--out", default="bench_results.json")
+    ap.add_argument("--compare", help="earlier results JSON to compare against")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="ads_soa_bench_") as tmp:
+        path = args.csv
+        if not path:
+            path = os.path.join(tmp, "bench.csv")
+            start = time.perf_counter()
+            write_csv(
+                path, n_bjt=args.bjts, n_res=args.resistors, n_rows=args.rows, density=args.density, seed=args.seed
+            )
+            print(f"generated {path} in {time.perf_counter() - start:.2f}s")
+
+        results = run_core(path, args.limits, args.repeat)
+        if not args.no_gui:
+            results.update(run_startup(args.repeat))
+            results.update(run_gui(path, args.limits, args.repeat))
+
+        report = {
+            "meta": {
+                "revision": _git_revision(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "pandas": pd.__version__,
+                "platform": platform.platform(),
+                "csv_bytes": os.path.getsize(path),
+                "params": {
+                    "bjts": args.bjts,
+                    "resistors": args.resistors,
+                    "rows": args.rows,
+                    "density": args.density,
+                    "seed": args.seed,
+                    "repeat": args.repeat,
+                    "csv": args.csv,
+                },
+            },
+            "results": results,
+        }
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for name, res in results.items():
+        print(f"{name:<30}{res['seconds']:>10.4f}s" if "seconds" in res else f"{name:<30}{res}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print(compare(report, json.load(f)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,17 +1,242 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
-from .models import BJTDevice, ResistorDevice
+from .models import BJTDevice, PulseTable, ResistorDevice
+from .parser import required_columns
+from .pulse import evaluate_pulse, pulse_rules
+from .soa import boundary_distance
+from .thermal import ThermalState, foster_temperature
 
 
-def analyze_bjt(df: pd.DataFrame, dev: BJTDevice, time_col: str) -> pd.DataFrame:
+VIOLATION_COLUMNS = ["Device Name", "Time", "Sample Index", "Parameter", "Value", "Limit", "Violation Type"]
+EPISODE_COLUMNS = [
+    "Device Name",
+    "Parameter",
+    "Start Time",
+    "End Time",
+    "Duration",
+    "Entry Time",
+    "Exit Time",
+    "Time Above",
+    "Peak Value",
+    "Peak Time",
+    "Overshoot Integral",
+    "Samples",
+    "Start Index",
+    "End Index",
+    "Peak Index",
+    "Limit",
+    "Violation Type",
+]
+
+
+def empty_violations(episodes: bool = False) -> pd.DataFrame:
+    return pd.DataFrame(columns=EPISODE_COLUMNS if episodes else VIOLATION_COLUMNS)
+
+
+def find_runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Locate contiguous True runs in a boolean mask by edge detection.
+    Returns (starts, stops) index arrays; `stops` is exclusive.
+    """
+    padded = np.zeros(len(mask) + 2, dtype=np.int8)
+    padded[1:-1] = mask
+    edges = np.diff(padded)
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def _run_peaks(magnitude: np.ndarray, starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Index of the first maximum of `magnitude` inside each [start, stop) run."""
+    if len(starts) == 0:
+        return np.empty(0, dtype=np.intp)
+    lengths = stops - starts
+    offsets = np.cumsum(lengths) - lengths
+    sel = np.arange(lengths.sum()) + np.repeat(starts - offsets, lengths)
+    mag = magnitude[sel]
+    run_max = np.maximum.reduceat(mag, offsets)
+    hits = np.flatnonzero(mag == np.repeat(run_max, lengths))
+    return sel[hits[np.searchsorted(hits, offsets)]]
+
+
+# Parameters compared as value rather than |value| against their limit.
+_UNSIGNED_PARAMETERS = ("POWER", "TEMP", "SOA")
+
+
+def _excursion_crossings(
+    t: np.ndarray, magnitude: np.ndarray, limit: np.ndarray, rows: np.ndarray, starts: np.ndarray, stops: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sub-sample timing of the runs [start, stop) in `rows` of (rows, n)
+    `magnitude` against `limit` (same shape, may be a broadcast view), all
+    runs at once. Entry and exit are where the straight line between a run's
+    edge sample and its neighbour outside the run crosses the edge sample's
+    limit; runs at the ends of the data, or whose neighbour is not below
+    the limit (pulse rules), start and end at their edge samples. The
+    overshoot integral is the trapezoidal integral of magnitude - limit
+    from entry to exit. Returns (entry, exit, overshoot).
+    """
+    if len(starts) == 0:
+        return np.empty(0), np.empty(0), np.empty(0)
+    n = magnitude.shape[1]
+    last = stops - 1
+    before = np.maximum(starts - 1, 0)
+    after = np.minimum(stops, n - 1)
+    first_excess = magnitude[rows, starts] - limit[rows, starts]
+    last_excess = magnitude[rows, last] - limit[rows, last]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        below = magnitude[rows, before] - limit[rows, starts]
+        frac = np.where((starts > 0) & (below < 0), first_excess / (first_excess - below), 0.0)
+        entry = t[starts] - frac * (t[starts] - t[before])
+        below = magnitude[rows, after] - limit[rows, last]
+        frac = np.where((stops < n) & (below < 0), last_excess / (last_excess - below), 0.0)
+        exit_time = t[last] + frac * (t[after] - t[last])
+
+    # Trapezoids between consecutive samples of each run, then the triangles out to the crossings.
+    lengths = stops - starts
+    offsets = np.cumsum(lengths) - lengths
+    cols = np.arange(lengths.sum()) + np.repeat(starts - offsets, lengths)
+    sel = np.repeat(rows, lengths)
+    excess = magnitude[sel, cols] - limit[sel, cols]
+    area = np.zeros(len(cols))
+    area[1:] = 0.5 * (excess[1:] + excess[:-1]) * np.diff(t[cols])
+    area[offsets] = 0.0
+    overshoot = np.add.reduceat(area, offsets)
+    overshoot += 0.5 * first_excess * (t[starts] - entry) + 0.5 * last_excess * (exit_time - t[last])
+    return entry, exit_time, overshoot
+
+
+def _violation_frame(
+    name: str,
+    violation_type: str,
+    t: np.ndarray,
+    checks: List[Tuple[str, np.ndarray, np.ndarray, Union[float, np.ndarray]]],
+) -> pd.DataFrame:
+    """
+    Build the violation records of one device directly from column arrays.
+
+    `checks` holds (parameter, mask, values, limit) tuples, where the limit
+    is a scalar or a per-sample array; rows are emitted per check in time
+    order, matching the former per-sample record layout.
+    """
+    idxs = [np.flatnonzero(mask) for _, mask, _, _ in checks]
+    counts = np.array([len(i) for i in idxs], dtype=np.intp)
+    total = int(counts.sum())
+    if total == 0:
+        return empty_violations()
+
+    params = [param for param, _, _, _ in checks]
+    idx = np.concatenate(idxs)
+    values = np.concatenate([np.asarray(vals, dtype=float)[i] for (_, _, vals, _), i in zip(checks, idxs)])
+    limits = np.concatenate([_limit_at(lim, mask, i) for (_, mask, _, lim), i in zip(checks, idxs)])
+    codes = np.repeat(np.arange(len(checks), dtype=np.int8), counts)
+
+    return pd.DataFrame(
+        {
+            "Device Name": pd.Categorical.from_codes(np.zeros(total, dtype=np.int8), categories=[name]),
+            "Time": t[idx],
+            "Sample Index": idx.astype(np.int64),
+            "Parameter": pd.Categorical.from_codes(codes, categories=params),
+            "Value": values,
+            "Limit": limits,
+            "Violation Type": pd.Categorical.from_codes(np.zeros(total, dtype=np.int8), categories=[violation_type]),
+        }
+    )
+
+
+def _episode_frame(
+    name: str,
+    violation_type: str,
+    t: np.ndarray,
+    checks: List[Tuple[str, np.ndarray, np.ndarray, Union[float, np.ndarray]]],
+) -> pd.DataFrame:
+    """
+    Collapse each contiguous run of a violation mask into one excursion row
+    (start/end time, duration, interpolated entry/exit time and time above
+    the limit, peak value and time, overshoot integral, sample count).
+    Per-sample limits are reported at the peak.
+    """
+    runs = [find_runs(mask) for _, mask, _, _ in checks]
+    counts = np.array([len(starts) for starts, _ in runs], dtype=np.intp)
+    total = int(counts.sum())
+    if total == 0:
+        return empty_violations(episodes=True)
+
+    params = [param for param, _, _, _ in checks]
+    starts = np.concatenate([s for s, _ in runs])
+    stops = np.concatenate([e for _, e in runs])
+    peak_values: List[np.ndarray] = []
+    peak_idxs: List[np.ndarray] = []
+    peak_limits: List[np.ndarray] = []
+    crossings: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    for (param, mask, vals, lim), (s, e) in zip(checks, runs):
+        vals = np.asarray(vals, dtype=float)
+        idx = _run_peaks(np.abs(vals), s, e)
+        peak_idxs.append(idx)
+        peak_values.append(vals[idx])
+        peak_limits.append(_limit_at(lim, mask, idx))
+        magnitude = vals if param in _UNSIGNED_PARAMETERS else np.abs(vals)
+        limit = np.broadcast_to(np.asarray(lim, dtype=float), mask.shape)
+        crossings.append(_excursion_crossings(t, magnitude[None], limit[None], np.zeros(len(s), dtype=np.intp), s, e))
+    peak_idx = np.concatenate(peak_idxs)
+    limits = np.concatenate(peak_limits)
+    entry, exit_time, overshoot = (np.concatenate(cols) for cols in zip(*crossings))
+    codes = np.repeat(np.arange(len(checks), dtype=np.int8), counts)
+
+    start_time = t[starts]
+    end_time = t[stops - 1]
+    return pd.DataFrame(
+        {
+            "Device Name": pd.Categorical.from_codes(np.zeros(total, dtype=np.int8), categories=[name]),
+            "Parameter": pd.Categorical.from_codes(codes, categories=params),
+            "Start Time": start_time,
+            "End Time": end_time,
+            "Duration": end_time - start_time,
+            "Entry Time": entry,
+            "Exit Time": exit_time,
+            "Time Above": exit_time - entry,
+            "Peak Value": np.concatenate(peak_values),
+            "Peak Time": t[peak_idx],
+            "Overshoot Integral": overshoot,
+            "Samples": stops - starts,
+            "Start Index": starts.astype(np.int64),
+            "End Index": (stops - 1).astype(np.int64),
+            "Peak Index": peak_idx.astype(np.int64),
+            "Limit": limits,
+            "Violation Type": pd.Categorical.from_codes(np.zeros(total, dtype=np.int8), categories=[violation_type]),
+        }
+    )
+
+
+def _limit_at(limit: Union[float, np.ndarray], mask: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """Limit of a check at the sample positions `idx`, for scalar or per-sample limits."""
+    return np.broadcast_to(np.asarray(limit, dtype=float), mask.shape)[idx]
+
+
+def _pulse_check(
+    param: str, t: np.ndarray, values: np.ndarray, dc: Optional[float], table: PulseTable, mean: bool = False
+) -> Tuple[str, np.ndarray, np.ndarray, np.ndarray]:
+    """Duration-dependent check of one device (see core.pulse); limits and, for power, values are per sample."""
+    values = np.asarray(values, dtype=float)[None, :]
+    magnitude = values if mean else np.abs(values)
+    reported, limit, ratio = evaluate_pulse(t, values, magnitude, pulse_rules(table, dc, mean))
+    return param, ratio[0] > 1, reported[0], limit[0]
+
+
+def analyze_bjt(df: pd.DataFrame, dev: BJTDevice, time_col: str, episodes: bool = False) -> pd.DataFrame:
     """
     Compute VCE, VBE, VBC, currents, power, temp and flag violations.
-    Returns a DataFrame with violation records for this device.
+    Returns a DataFrame with violation records for this device, or one row
+    per contiguous excursion when `episodes` is set. Without an exported
+    temperature, TEMP is checked on the Foster estimate (device_temperature).
+    SOA reports the signed distance to SOA_BOUNDARY (see core.soa), limit 0.
     """
     t = df[time_col].to_numpy()
     vc = df[dev.col_vc].to_numpy()
@@ -25,87 +250,646 @@ def analyze_bjt(df: pd.DataFrame, dev: BJTDevice, time_col: str) -> pd.DataFrame
     ib = df[dev.col_ib].to_numpy() if dev.col_ib and dev.col_ib in df.columns else None
     ic = df[dev.col_ic].to_numpy() if dev.col_ic and dev.col_ic in df.columns else None
     ie = df[dev.col_ie].to_numpy() if dev.col_ie and dev.col_ie in df.columns else None
-    temp = df[dev.col_temp].to_numpy() if dev.col_temp and dev.col_temp in df.columns else None
-
-    records: List[Dict] = []
-
-    def add_violations(mask: np.ndarray, param: str, values: np.ndarray, limit_val: float):
-        idxs = np.nonzero(mask)[0]
-        for i in idxs:
-            records.append(
-                {
-                    "Device Name": dev.name,
-                    "Time": t[i],
-                    "Parameter": param,
-                    "Value": float(values[i]),
-                    "Limit": float(limit_val),
-                    "Violation Type": "BJT",
-                }
-            )
-
-    if np.isfinite(dev.limits.MAX_VCE):
-        add_violations(np.abs(vce) > dev.limits.MAX_VCE, "VCE", vce, dev.limits.MAX_VCE)
+    p = np.abs(vce * ic) + np.abs(vbe * ib) if ic is not None and ib is not None else None
+    temp = device_temperature(df, dev, time_col, p)
+
+    checks: List[Tuple[str, np.ndarray, np.ndarray, float]] = []
+
+    if dev.limits.PULSE_VCE:
+        checks.append(_pulse_check("VCE", t, vce, dev.limits.MAX_VCE, dev.limits.PULSE_VCE))
+    elif np.isfinite(dev.limits.MAX_VCE):
+        checks.append(("VCE", np.abs(vce) > dev.limits.MAX_VCE, vce, dev.limits.MAX_VCE))
 
     if np.isfinite(dev.limits.MAX_VBE):
-        add_violations(np.abs(vbe) > dev.limits.MAX_VBE, "VBE", vbe, dev.limits.MAX_VBE)
+        checks.append(("VBE", np.abs(vbe) > dev.limits.MAX_VBE, vbe, dev.limits.MAX_VBE))
 
     if dev.limits.MAX_VBC is not None:
-        add_violations(np.abs(vbc) > dev.limits.MAX_VBC, "VBC", vbc, dev.limits.MAX_VBC)
+        checks.append(("VBC", np.abs(vbc) > dev.limits.MAX_VBC, vbc, dev.limits.MAX_VBC))
 
     if dev.limits.MAX_IB is not None and ib is not None:
-        add_violations(np.abs(ib) > dev.limits.MAX_IB, "IB", ib, dev.limits.MAX_IB)
+        checks.append(("IB", np.abs(ib) > dev.limits.MAX_IB, ib, dev.limits.MAX_IB))
 
-    if dev.limits.MAX_IC is not None and ic is not None:
-        add_violations(np.abs(ic) > dev.limits.MAX_IC, "IC", ic, dev.limits.MAX_IC)
+    if dev.limits.PULSE_IC and ic is not None:
+        checks.append(_pulse_check("IC", t, ic, dev.limits.MAX_IC, dev.limits.PULSE_IC))
+    elif dev.limits.MAX_IC is not None and ic is not None:
+        checks.append(("IC", np.abs(ic) > dev.limits.MAX_IC, ic, dev.limits.MAX_IC))
 
     if dev.limits.MAX_IE is not None and ie is not None:
-        add_violations(np.abs(ie) > dev.limits.MAX_IE, "IE", ie, dev.limits.MAX_IE)
+        checks.append(("IE", np.abs(ie) > dev.limits.MAX_IE, ie, dev.limits.MAX_IE))
 
-    if dev.limits.MAX_POWER is not None and ic is not None and ib is not None:
-        p = np.abs(vce * ic) + np.abs(vbe * ib)
-        add_violations(p > dev.limits.MAX_POWER, "POWER", p, dev.limits.MAX_POWER)
+    if (dev.limits.MAX_POWER is not None or dev.limits.PULSE_POWER) and p is not None:
+        if dev.limits.PULSE_POWER:
+            checks.append(_pulse_check("POWER", t, p, dev.limits.MAX_POWER, dev.limits.PULSE_POWER, mean=True))
+        else:
+            checks.append(("POWER", p > dev.limits.MAX_POWER, p, dev.limits.MAX_POWER))
 
     if dev.limits.MAX_TEMP is not None and temp is not None:
-        add_violations(temp > dev.limits.MAX_TEMP, "TEMP", temp, dev.limits.MAX_TEMP)
+        checks.append(("TEMP", temp > dev.limits.MAX_TEMP, temp, dev.limits.MAX_TEMP))
 
-    return pd.DataFrame.from_records(records)
+    if dev.limits.SOA_BOUNDARY and ic is not None:
+        dist = boundary_distance(vce, ic, dev.limits.SOA_BOUNDARY, dev.limits.SOA_SCALE)
+        checks.append(("SOA", dist > 0, dist, 0.0))
 
+    build = _episode_frame if episodes else _violation_frame
+    return build(dev.name, "BJT", t, checks)
 
-def analyze_resistor(df: pd.DataFrame, dev: ResistorDevice, time_col: str) -> pd.DataFrame:
+
+def analyze_resistor(df: pd.DataFrame, dev: ResistorDevice, time_col: str, episodes: bool = False) -> pd.DataFrame:
     t = df[time_col].to_numpy()
     ir = df[dev.col_ir].to_numpy()
 
-    records: List[Dict] = []
     mask = np.abs(ir) > dev.limits.MAX_RES_CURRENT
-    idxs = np.nonzero(mask)[0]
-    for i in idxs:
-        records.append(
-            {
-                "Device Name": dev.name,
-                "Time": t[i],
-                "Parameter": "IR",
-                "Value": float(ir[i]),
-                "Limit": float(dev.limits.MAX_RES_CURRENT),
-                "Violation Type": "RESISTOR",
-            }
+    build = _episode_frame if episodes else _violation_frame
+    return build(dev.name, "RESISTOR", t, [("IR", mask, ir, dev.limits.MAX_RES_CURRENT)])
+
+
+# ---------------- Batched engine ----------------
+BJT_PARAMETERS = ["VCE", "VBE", "VBC", "IB", "IC", "IE", "POWER", "TEMP", "SOA"]
+RESISTOR_PARAMETERS = ["IR"]
+PARAMETERS = BJT_PARAMETERS + RESISTOR_PARAMETERS
+VIOLATION_TYPES = ["BJT", "RESISTOR"]
+
+# Upper bound on elements per (devices x samples) block held by the batched engine.
+BLOCK_ELEMENTS = 1 << 20
+
+ColumnData = Union[pd.DataFrame, Mapping[str, np.ndarray]]
+
+
+class CheckBlock(NamedTuple):
+    """One parameter check evaluated for a block of devices (rows) over all samples (columns)."""
+
+    param: int  # index into PARAMETERS
+    devices: np.ndarray  # global device index per row
+    values: np.ndarray  # (n_devices, n_samples)
+    limits: np.ndarray  # (n_devices,), or (n_devices, n_samples) with pulse tables; NaN where disabled
+    mask: np.ndarray  # (n_devices, n_samples) violation flags
+    peaks: np.ndarray  # (n_devices,) largest checked magnitude, NaN without data
+
+
+def _gather(data: ColumnData, cols: Sequence[Optional[str]], n: int) -> np.ndarray:
+    """Stack columns into a (len(cols), n) float array; absent columns become NaN rows."""
+    out = np.full((len(cols), n), np.nan)
+    for row, col in enumerate(cols):
+        if col and col in data:
+            out[row] = np.asarray(data[col], dtype=float)
+    return out
+
+
+def _limit_vector(devices: Sequence, attr: str) -> np.ndarray:
+    vals = [getattr(dev.limits, attr) for dev in devices]
+    return np.array([np.nan if v is None else v for v in vals], dtype=float)
+
+
+def _check(param: str, devices: np.ndarray, values: np.ndarray, limits: np.ndarray, signed: bool = True) -> CheckBlock:
+    magnitude = np.abs(values) if signed else values
+    with np.errstate(invalid="ignore"):
+        mask = magnitude > limits[:, None]
+    # fmax skips NaN, so devices without the column keep the NaN initial value.
+    peaks = np.fmax.reduce(magnitude, axis=1, initial=np.nan)
+    return CheckBlock(PARAMETERS.index(param), devices, values, limits, mask, peaks)
+
+
+# (parameter, limit attribute, compare |value| rather than value)
+_BJT_CHECKS = [
+    ("VCE", "MAX_VCE", True),
+    ("VBE", "MAX_VBE", True),
+    ("VBC", "MAX_VBC", True),
+    ("IB", "MAX_IB", True),
+    ("IC", "MAX_IC", True),
+    ("IE", "MAX_IE", True),
+    ("POWER", "MAX_POWER", False),
+    ("TEMP", "MAX_TEMP", False),
+]
+
+
+# Checks whose limits may depend on pulse duration: parameter -> (table attribute, table bounds the window mean).
+_PULSE_CHECKS = {"VCE": ("PULSE_VCE", False), "IC": ("PULSE_IC", False), "POWER": ("PULSE_POWER", True)}
+
+
+def _with_pulse_tables(
+    block: CheckBlock, devices: Sequence[BJTDevice], t: np.ndarray, values: np.ndarray, lead: int, attr: str, mean: bool
+) -> CheckBlock:
+    """
+    Re-evaluate the rows of devices that have a pulse table for this check,
+    one group per distinct (table, DC limit). The block's limits become per
+    sample; power rows report the window mean that broke the limit.
+    """
+    tables = [getattr(dev.limits, attr) for dev in devices]
+    if not any(tables):
+        return block
+    groups: Dict[Tuple[PulseTable, Optional[float]], List[int]] = {}
+    for row, (table, dc) in enumerate(zip(tables, block.limits.tolist())):
+        if table:
+            groups.setdefault((table, None if np.isnan(dc) else dc), []).append(row)
+
+    reported = np.array(block.values, dtype=float)
+    limits = np.repeat(block.limits[:, None], reported.shape[1], axis=1)
+    mask = block.mask.copy()
+    for (table, dc), rows in groups.items():
+        sel = values[rows]
+        value, limit, ratio = evaluate_pulse(t, sel, sel if mean else np.abs(sel), pulse_rules(table, dc, mean))
+        reported[rows] = value[:, lead:]
+        limits[rows] = limit[:, lead:]
+        mask[rows] = ratio[:, lead:] > 1
+    return block._replace(values=reported, limits=limits, mask=mask)
+
+
+def bjt_signals(data: ColumnData, devices: Sequence[BJTDevice], n: int) -> Dict[str, np.ndarray]:
+    """
+    Derived (devices x samples) quantities of a block of BJTs, keyed by
+    parameter name (VCE, VBE, VBC, IB, IC, IE, POWER, TEMP). Rows are NaN
+    where a device has no such column.
+    """
+    vc = _gather(data, [d.col_vc for d in devices], n)
+    vb = _gather(data, [d.col_vb for d in devices], n)
+    ve = _gather(data, [d.col_ve for d in devices], n)
+    vce = vc - ve
+    vbe = vb - ve
+    vbc = vb - vc
+    del vc, vb, ve
+
+    ib = _gather(data, [d.col_ib for d in devices], n)
+    ic = _gather(data, [d.col_ic for d in devices], n)
+    ie = _gather(data, [d.col_ie for d in devices], n)
+    temp = _gather(data, [d.col_temp for d in devices], n)
+    power = np.abs(vce * ic) + np.abs(vbe * ib)
+    return {"VCE": vce, "VBE": vbe, "VBC": vbc, "IB": ib, "IC": ic, "IE": ie, "POWER": power, "TEMP": temp}
+
+
+def device_temperature(
+    data: ColumnData, dev: BJTDevice, time_col: str, power: Optional[np.ndarray] = None
+) -> Optional[np.ndarray]:
+    """
+    Junction temperature of one BJT: its exported `.t` column, else the
+    estimate of the Foster network in its limits (see core.thermal) from
+    the instantaneous power (`power` when the caller already has it), else
+    None.
+    """
+    if dev.col_temp and dev.col_temp in data:
+        return np.asarray(data[dev.col_temp], dtype=float)
+    lim = dev.limits
+    if lim is None or not lim.THERMAL_R:
+        return None
+    t = np.asarray(data[time_col], dtype=float)
+    power = bjt_signals(data, [dev], len(t))["POWER"] if power is None else np.asarray(power, dtype=float)[None]
+    if np.isnan(power).all():
+        return None
+    temp, _ = foster_temperature(t, power, lim.THERMAL_R, lim.THERMAL_C, np.array([lim.T_AMBIENT]))
+    return temp[0]
+
+
+def _with_thermal(
+    signals: Dict[str, np.ndarray],
+    devices: Sequence[BJTDevice],
+    idx: np.ndarray,
+    t: np.ndarray,
+    lead: int,
+    thermal: Optional[Dict[int, ThermalState]],
+) -> Dict[str, np.ndarray]:
+    """
+    Fill the TEMP rows of devices with a Foster network but no exported
+    temperature from their power, one vectorized pass per distinct network.
+    `thermal` (device index -> state at the last sample) carries the
+    networks from one row chunk to the next; lead rows were already covered.
+    """
+    groups: Dict[Tuple[Tuple[float, ...], Tuple[float, ...]], List[int]] = {}
+    for row, dev in enumerate(devices):
+        if dev.limits.THERMAL_R and not dev.col_temp:
+            groups.setdefault((dev.limits.THERMAL_R, dev.limits.THERMAL_C), []).append(row)
+    if not groups:
+        return signals
+
+    temp = signals["TEMP"].copy()  # signals may be cached by the caller
+    for (r, c), rows in groups.items():
+        ids = [int(idx[row]) for row in rows]
+        initial: Optional[ThermalState] = None
+        if thermal and ids[0] in thermal:
+            states = [thermal[i] for i in ids]
+            initial = (states[0][0], np.array([s[1] for s in states]), np.array([s[2] for s in states]))
+        ambient = np.array([devices[row].limits.T_AMBIENT for row in rows])
+        estimate, (t_end, p_end, theta_end) = foster_temperature(
+            t[lead:], signals["POWER"][rows, lead:], r, c, ambient, initial
         )
-    return pd.DataFrame.from_records(records)
+        temp[rows, lead:] = estimate
+        if thermal is not None:
+            for k, i in enumerate(ids):
+                thermal[i] = (t_end, p_end[k], theta_end[k])
+    return {**signals, "TEMP": temp}
+
+
+def _soa_check(signals: Dict[str, np.ndarray], devices: Sequence[BJTDevice], idx: np.ndarray, lead: int) -> CheckBlock:
+    """
+    Signed distance of every (VCE, IC) sample to the device's SOA boundary,
+    positive outside, one vectorized evaluation per distinct boundary. The
+    limit is 0 for devices with a boundary and NaN otherwise.
+    """
+    n = signals["VCE"].shape[1] - lead
+    dist = np.full((len(devices), n), np.nan)
+    limits = np.full(len(devices), np.nan)
+    groups: Dict[Tuple[Tuple[Tuple[float, float], ...], str], List[int]] = {}
+    for row, dev in enumerate(devices):
+        if dev.limits.SOA_BOUNDARY:
+            groups.setdefault((dev.limits.SOA_BOUNDARY, dev.limits.SOA_SCALE), []).append(row)
+    for (points, scale), rows in groups.items():
+        dist[rows] = boundary_distance(signals["VCE"][rows, lead:], signals["IC"][rows, lead:], points, scale)
+        limits[rows] = 0.0
+    return _check("SOA", idx, dist, limits, signed=False)
+
+
+def resistor_signals(data: ColumnData, devices: Sequence[ResistorDevice], n: int) -> Dict[str, np.ndarray]:
+    return {"IR": _gather(data, [d.col_ir for d in devices], n)}
+
+
+def _bjt_checks(
+    signals: Dict[str, np.ndarray],
+    devices: Sequence[BJTDevice],
+    idx: np.ndarray,
+    t: np.ndarray,
+    lead: int = 0,
+    thermal: Optional[Dict[int, ThermalState]] = None,
+) -> List[CheckBlock]:
+    """
+    Evaluate every BJT check for a block of devices with broadcasting.
+    `signals` and `t` may start with `lead` samples of history that only the
+    pulse-duration checks look at; the blocks cover the samples after it.
+    Estimated temperatures continue from the `thermal` states, if given.
+    """
+    signals = _with_thermal(signals, devices, idx, t, lead, thermal)
+    blocks: List[CheckBlock] = []
+    for param, attr, signed in _BJT_CHECKS:
+        values = signals[param]
+        block = _check(param, idx, values[:, lead:], _limit_vector(devices, attr), signed)
+        if param in _PULSE_CHECKS:
+            block = _with_pulse_tables(block, devices, t, values, lead, *_PULSE_CHECKS[param])
+        blocks.append(block)
+    blocks.append(_soa_check(signals, devices, idx, lead))
+    return blocks
+
+
+def _resistor_checks(signals: Dict[str, np.ndarray], devices: Sequence[ResistorDevice], idx: np.ndarray) -> List[CheckBlock]:
+    return [_check("IR", idx, signals["IR"], _limit_vector(devices, "MAX_RES_CURRENT"))]
+
+
+def _sample_parts(blocks: List[CheckBlock], t: np.ndarray, offset: int = 0) -> dict:
+    """Scatter the violating (device, sample) pairs of each block into flat record columns."""
+    devs, params, idxs, values, limits = [], [], [], [], []
+    for b in blocks:
+        rows, cols = np.nonzero(b.mask)
+        devs.append(b.devices[rows])
+        params.append(np.full(len(rows), b.param, dtype=np.int8))
+        idxs.append(cols)
+        values.append(b.values[rows, cols])
+        limits.append(b.limits[rows, cols] if b.limits.ndim == 2 else b.limits[rows])
+    dev = np.concatenate(devs)
+    param = np.concatenate(params)
+    # Serial layout: device, then parameter, then time.
+    order = np.lexsort((param, dev))
+    idx = np.concatenate(idxs)[order]
+    return {
+        "dev": dev[order],
+        "param": param[order],
+        "index": idx + offset,
+        "Time": t[idx],
+        "Value": np.concatenate(values)[order],
+        "Limit": np.concatenate(limits)[order],
+    }
+
+
+def _episode_parts(blocks: List[CheckBlock], t: np.ndarray, offset: int = 0) -> dict:
+    """Detect excursions along the sample axis of every block at once."""
+    n = len(t)
+    devs, params, starts, stops, peaks, peak_values, limits = [], [], [], [], [], [], []
+    entries, exits, overshoots = [], [], []
+    for b in blocks:
+        padded = np.zeros((b.mask.shape[0], n + 2), dtype=np.int8)
+        padded[:, 1:-1] = b.mask
+        edges = np.diff(padded, axis=1)
+        rows, start = np.nonzero(edges == 1)
+        _, stop = np.nonzero(edges == -1)
+        # Runs never cross rows thanks to the padding, so flat offsets are safe.
+        peak = _run_peaks(np.abs(b.values).ravel(), rows * n + start, rows * n + stop) - rows * n
+        devs.append(b.devices[rows])
+        params.append(np.full(len(rows), b.param, dtype=np.int8))
+        starts.append(start)
+        stops.append(stop)
+        peaks.append(peak)
+        peak_values.append(b.values[rows, peak])
+        limits.append(b.limits[rows, peak] if b.limits.ndim == 2 else b.limits[rows])
+        magnitude = b.values if PARAMETERS[b.param] in _UNSIGNED_PARAMETERS else np.abs(b.values)
+        limit = np.broadcast_to(b.limits if b.limits.ndim == 2 else b.limits[:, None], b.values.shape)
+        entry, exit_time, overshoot = _excursion_crossings(t, magnitude, limit, rows, start, stop)
+        entries.append(entry)
+        exits.append(exit_time)
+        overshoots.append(overshoot)
+    dev = np.concatenate(devs)
+    param = np.concatenate(params)
+    order = np.lexsort((param, dev))
+    entry = np.concatenate(entries)[order]
+    exit_time = np.concatenate(exits)[order]
+    start = np.concatenate(starts)[order]
+    stop = np.concatenate(stops)[order]
+    peak = np.concatenate(peaks)[order]
+    start_time = t[start]
+    end_time = t[stop - 1]
+    return {
+        "dev": dev[order],
+        "param": param[order],
+        "start": start + offset,
+        "stop": stop + offset,
+        "peak": peak + offset,
+        "Start Time": start_time,
+        "End Time": end_time,
+        "Duration": end_time - start_time,
+        "Entry Time": entry,
+        "Exit Time": exit_time,
+        "Time Above": exit_time - entry,
+        "Peak Value": np.concatenate(peak_values)[order],
+        "Peak Time": t[peak],
+        "Overshoot Integral": np.concatenate(overshoots)[order],
+        "Samples": stop - start,
+        "Limit": np.concatenate(limits)[order],
+    }
+
+
+def summary_part(blocks: List[CheckBlock]) -> dict:
+    """
+    Per-device peaks and limits of a block as (n_devices, len(PARAMETERS))
+    arrays, NaN for parameters the block does not check. Per-sample (pulse)
+    limits are reduced to the limit that gives the peak the margin of the
+    worst sample.
+    """
+    devices = blocks[0].devices
+    peaks = np.full((len(devices), len(PARAMETERS)), np.nan)
+    limits = np.full((len(devices), len(PARAMETERS)), np.nan)
+    for b in blocks:
+        peaks[:, b.param] = b.peaks
+        if b.limits.ndim == 2:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                worst = np.fmax.reduce(np.abs(b.values) / b.limits, axis=1, initial=np.nan)
+                limits[:, b.param] = np.where(worst > 0, b.peaks / worst, np.nan)
+        else:
+            limits[:, b.param] = b.limits
+    return {"dev": devices, "peaks": peaks, "limits": limits}
+
+
+def concat_parts(parts: List[dict]) -> dict:
+    """Concatenate flat record columns produced by analysis_parts."""
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+
+
+def assemble_violations(parts: List[dict], names: List[str], n_bjt: int, episodes: bool = False) -> pd.DataFrame:
+    """
+    Turn flat record columns with integer device/parameter codes into the
+    violation schema; the global sample positions become the index columns.
+    """
+    parts = [p for p in parts if len(p["dev"])]
+    if not parts:
+        return empty_violations(episodes)
+    merged = concat_parts(parts) if len(parts) > 1 else parts[0]
+    dev = merged["dev"]
+
+    name_codes, categories = pd.factorize(pd.Index(names))
+    labels = {
+        "Device Name": pd.Categorical.from_codes(name_codes[dev], categories=categories),
+        "Parameter": pd.Categorical.from_codes(merged["param"], categories=PARAMETERS),
+        "Violation Type": pd.Categorical.from_codes((dev >= n_bjt).astype(np.int8), categories=VIOLATION_TYPES),
+    }
+    if episodes:
+        labels["Start Index"] = merged["start"].astype(np.int64)
+        labels["End Index"] = merged["stop"].astype(np.int64) - 1
+        labels["Peak Index"] = merged["peak"].astype(np.int64)
+    else:
+        labels["Sample Index"] = merged["index"].astype(np.int64)
+    columns = EPISODE_COLUMNS if episodes else VIOLATION_COLUMNS
+    return pd.DataFrame({col: labels[col] if col in labels else merged[col] for col in columns}, copy=False)
+
+
+def analysis_parts(
+    data: ColumnData,
+    bjt_devices: List[BJTDevice],
+    res_devices: List[ResistorDevice],
+    time_col: str,
+    episodes: bool = False,
+    offset: int = 0,
+    lead: int = 0,
+    thermal: Optional[Dict[int, ThermalState]] = None,
+) -> List[dict]:
+    """
+    Run the batched checks and return flat record columns (one dict per device
+    block) keyed by integer device index ("dev", BJTs first, then resistors)
+    and parameter code ("param", into PARAMETERS). Sample positions are
+    reported relative to `offset`, which lets callers stitch row chunks.
+    The first `lead` rows of `data` are history from the previous chunk:
+    they feed the pulse-duration checks but produce no records. `thermal`
+    carries the estimated junction temperatures across chunks. Episodes
+    also cover the last history row, so that crossings at the chunk start
+    are interpolated and a run ending there reports its exit; its excursion
+    overlaps the previous chunk's by that one sample (see
+    core.streaming.merge_episode_parts).
+    """
+    t = np.asarray(data[time_col])
+    n = len(t)
+    block = max(1, BLOCK_ELEMENTS // max(n, 1))
+    build = _episode_parts if episodes else _sample_parts
+    if episodes and lead > 0:
+        lead -= 1
+        offset -= 1
+
+    parts: List[dict] = []
+    for start in range(0, len(bjt_devices), block):
+        devs = bjt_devices[start : start + block]
+        idx = np.arange(start, start + len(devs))
+        blocks = _bjt_checks(bjt_signals(data, devs, n), devs, idx, t, lead, thermal)
+        parts.append(build(blocks, t[lead:], offset))
+    base = len(bjt_devices)
+    for start in range(0, len(res_devices), block):
+        devs = res_devices[start : start + block]
+        idx = np.arange(base + start, base + start + len(devs))
+        signals = {param: arr[:, lead:] for param, arr in resistor_signals(data, devs, n).items()}
+        parts.append(build(_resistor_checks(signals, devs, idx), t[lead:], offset))
+    return parts
+
+
+def analyze_batched(
+    data: ColumnData,
+    bjt_devices: List[BJTDevice],
+    res_devices: List[ResistorDevice],
+    time_col: str,
+    episodes: bool = False,
+) -> pd.DataFrame:
+    """
+    Evaluate all devices with one set of 2-D array operations per device block.
+
+    `data` may be a DataFrame or any mapping of column name to 1-D array.
+    Devices are processed in blocks of at most BLOCK_ELEMENTS values so that
+    the temporaries stay bounded; output matches the serial per-device path.
+    """
+    parts = analysis_parts(data, bjt_devices, res_devices, time_col, episodes=episodes)
+    names = [d.name for d in bjt_devices] + [d.name for d in res_devices]
+    return assemble_violations(parts, names, len(bjt_devices), episodes)
+
+
+# ---------------- Device summaries ----------------
+# (summary column, parameter) pairs reported as peaks; POWER and TEMP are checked unsigned,
+# SOA is the largest signed distance to the boundary (negative: the whole trajectory is inside).
+SUMMARY_PEAKS = [
+    ("Peak |VCE|", "VCE"),
+    ("Peak |VBE|", "VBE"),
+    ("Peak |IC|", "IC"),
+    ("Peak Power", "POWER"),
+    ("Max Temp", "TEMP"),
+    ("SOA Distance", "SOA"),
+    ("Peak |IR|", "IR"),
+]
+SUMMARY_COLUMNS = (
+    ["Device Name", "Violation Type"]
+    + [col for col, _ in SUMMARY_PEAKS]
+    + ["Worst Margin", "Worst Parameter", "Violations"]
+)
+
+
+def device_summary(
+    peaks: np.ndarray, limits: np.ndarray, counts: np.ndarray, names: List[str], n_bjt: int
+) -> pd.DataFrame:
+    """
+    One row per device from stacked summary parts (see summary_part) and
+    violation row counts, in one set of array operations over all devices.
+
+    Worst Margin is min over checked parameters of (limit - peak) / limit:
+    0.25 means 25 % headroom, negative values are over the limit. Worst
+    Parameter names the parameter it comes from. The SOA boundary has no
+    relative margin and is reported through SOA Distance instead.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        margins = np.where(limits > 0, (limits - peaks) / limits, np.nan)
+    ranked = np.where(np.isnan(margins), np.inf, margins)
+    worst = np.argmin(ranked, axis=1)
+    worst_margin = ranked[np.arange(len(names)), worst]
+    has_margin = np.isfinite(worst_margin)
+
+    data = {
+        "Device Name": pd.Categorical(names),
+        "Violation Type": pd.Categorical.from_codes(
+            (np.arange(len(names)) >= n_bjt).astype(np.int8), categories=VIOLATION_TYPES
+        ),
+    }
+    for col, param in SUMMARY_PEAKS:
+        data[col] = peaks[:, PARAMETERS.index(param)]
+    data["Worst Margin"] = np.where(has_margin, worst_margin, np.nan)
+    data["Worst Parameter"] = pd.Categorical.from_codes(np.where(has_margin, worst, -1), categories=PARAMETERS)
+    data["Violations"] = np.asarray(counts, dtype=np.int64)
+    return pd.DataFrame(data)
+
+
+# ---------------- Parallel execution ----------------
+def _shard_worker(args: Tuple[str, List[str], str, str, list, bool]) -> List[dict]:
+    """Analyze one device shard against the memory-mapped signal block."""
+    path, columns, time_col, kind, devices, episodes = args
+    block = np.load(path, mmap_mode="r")
+    data = {col: block[i] for i, col in enumerate(columns)}
+    if kind == "bjt":
+        return analysis_parts(data, devices, [], time_col, episodes)
+    return analysis_parts(data, [], devices, time_col, episodes)
+
+
+def _shards(devices: Sequence, size: int) -> List[Tuple[int, list]]:
+    return [(start, list(devices[start : start + size])) for start in range(0, len(devices), size)]
+
+
+def analyze_parallel(
+    data: ColumnData,
+    bjt_devices: List[BJTDevice],
+    res_devices: List[ResistorDevice],
+    time_col: str,
+    episodes: bool = False,
+    workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Split the device lists into shards and analyze them in a process pool.
+
+    The referenced columns are written once to a memory-mapped .npy file that
+    every worker maps read-only, so the signal data is never pickled. Shard
+    results are merged in submission order, which makes the output identical
+    to analyze_batched. `workers` defaults to the CPU count.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(bjt_devices) + len(res_devices) <= 1:
+        return analyze_batched(data, bjt_devices, res_devices, time_col, episodes=episodes)
+
+    columns = required_columns(bjt_devices, res_devices, time_col)
+    n = len(data[time_col])
+    size = max(1, -(-(len(bjt_devices) + len(res_devices)) // (workers * 4)))
+    shards = [("bjt", start, devs) for start, devs in _shards(bjt_devices, size)]
+    shards += [("res", start, devs) for start, devs in _shards(res_devices, size)]
+
+    with tempfile.TemporaryDirectory(prefix="ads_soa_") as tmp:
+        path = os.path.join(tmp, "signals.npy")
+        block = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(len(columns), n))
+        for i, col in enumerate(columns):
+            block[i] = np.asarray(data[col], dtype=float) if col in data else np.nan
+        block.flush()
+        del block
+
+        jobs = [(path, columns, time_col, kind, devs, episodes) for kind, _, devs in shards]
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_shard_worker, jobs))
+
+    parts: List[dict] = []
+    for (kind, start, _), shard_parts in zip(shards, results):
+        shift = start if kind == "bjt" else len(bjt_devices) + start
+        for p in shard_parts:
+            p["dev"] = p["dev"] + shift
+            parts.append(p)
+    names = [d.name for d in bjt_devices] + [d.name for d in res_devices]
+    return assemble_violations(parts, names, len(bjt_devices), episodes)
 
 
 def analyze_all(
-    df: pd.DataFrame, bjt_devices: List[BJTDevice], res_devices: List[ResistorDevice], time_col: str
+    df: pd.DataFrame,
+    bjt_devices: List[BJTDevice],
+    res_devices: List[ResistorDevice],
+    time_col: str,
+    episodes: bool = False,
+    engine: str = "batched",
+    workers: Optional[int] = None,
 ) -> pd.DataFrame:
+    """
+    Run all device checks. With `episodes` set, consecutive violating samples
+    are compressed into one row per excursion (see EPISODE_COLUMNS).
+
+    `engine` selects "batched" (all devices per block in one pass, see
+    analyze_batched), "parallel" (device shards across `workers` processes,
+    see analyze_parallel) or "serial" (one analyze_bjt/analyze_resistor call
+    per device).
+    """
+    if engine == "batched":
+        return analyze_batched(df, bjt_devices, res_devices, time_col, episodes=episodes)
+    if engine == "parallel":
+        return analyze_parallel(df, bjt_devices, res_devices, time_col, episodes=episodes, workers=workers)
+    if engine != "serial":
+        raise ValueError(f"Unknown analysis engine: {engine!r}")
+
     frames: List[pd.DataFrame] = []
     for dev in bjt_devices:
-        frames.append(analyze_bjt(df, dev, time_col))
+        frames.append(analyze_bjt(df, dev, time_col, episodes=episodes))
     for dev in res_devices:
-        frames.append(analyze_resistor(df, dev, time_col))
+        frames.append(analyze_resistor(df, dev, time_col, episodes=episodes))
+    frames = [f for f in frames if not f.empty]
     if not frames:
-        return pd.DataFrame(columns=["Device Name", "Time", "Parameter", "Value", "Limit", "Violation Type"])
-    out = pd.concat(frames, ignore_index=True)
-    if out.empty:
-        out = pd.DataFrame(columns=["Device Name", "Time", "Parameter", "Value", "Limit", "Violation Type"])
-    return out
+        return empty_violations(episodes)
+    return _concat_violations(frames)
+
+
+def _concat_violations(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate per-device frames, keeping the label columns categorical."""
+    data = {}
+    for col in frames[0].columns:
+        parts = [f[col] for f in frames]
+        if all(isinstance(p.dtype, pd.CategoricalDtype) for p in parts):
+            data[col] = union_categoricals(parts)
+        else:
+            data[col] = np.concatenate([p.to_numpy() for p in parts])
+    return pd.DataFrame(data)
 
 
 def violated_device_names(violations_df: Optional[pd.DataFrame]) -> set[str]:
@@ -113,3 +897,63 @@ def violated_device_names(violations_df: Optional[pd.DataFrame]) -> set[str]:
         return set()
     return set(violations_df["Device Name"].astype(str))
 
+
+class ViolationIndex:
+    """
+    Row positions of a violations frame grouped by (device, parameter).
+
+    Built once per analysis with a single lexsort, so per-device drill-downs
+    and plot markers slice their rows instead of filtering the whole frame,
+    and read sample positions from the index columns instead of matching
+    back by float time.
+    """
+
+    def __init__(self, violations_df: Optional[pd.DataFrame]) -> None:
+        self.df = violations_df if violations_df is not None else empty_violations()
+        self._groups: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self._params: Dict[str, List[str]] = {}
+        self._order = np.empty(0, dtype=np.intp)
+        if self.df.empty:
+            return
+
+        dev_codes, dev_labels = _label_codes(self.df["Device Name"])
+        param_codes, param_labels = _label_codes(self.df["Parameter"])
+        order = np.lexsort((param_codes, dev_codes))
+        dev_sorted = dev_codes[order]
+        param_sorted = param_codes[order]
+        bounds = np.flatnonzero((np.diff(dev_sorted) != 0) | (np.diff(param_sorted) != 0)) + 1
+        starts = np.concatenate(([0], bounds))
+        stops = np.concatenate((bounds, [len(order)]))
+        for a, b in zip(starts.tolist(), stops.tolist()):
+            key = (dev_labels[dev_sorted[a]], param_labels[param_sorted[a]])
+            self._groups[key] = (a, b)
+            self._params.setdefault(key[0], []).append(key[1])
+        self._order = order
+
+    def rows(self, device: str, params: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Frame row positions of `device` (optionally only `params`), in frame order per parameter."""
+        if params is None:
+            params = self._params.get(device, [])
+        spans = [self._groups[(device, p)] for p in params if (device, p) in self._groups]
+        if not spans:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate([self._order[a:b] for a, b in spans])
+
+    def sample_indices(self, device: str, params: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Data sample positions of the violations of `device`: every violating
+        sample, or the peak sample of each episode for episode results.
+        """
+        col = "Peak Index" if "Peak Index" in self.df.columns else "Sample Index"
+        return self.df[col].to_numpy()[self.rows(device, params)].astype(np.intp)
+
+    def devices(self) -> set[str]:
+        return set(self._params)
+
+
+def _label_codes(col: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Integer codes and their labels for a categorical or plain label column."""
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return col.cat.codes.to_numpy(), col.cat.categories.astype(str).to_numpy(dtype=object)
+    codes, labels = pd.factorize(col)
+    return codes, np.asarray(labels.astype(str), dtype=object)
@@ -0,0 +1,282 @@
+"""
+Headless batch analysis of many ADS CSV exports (no Qt/Matplotlib).
+
+Every matched file is analyzed in a process pool; CSVs above --stream-mb are
+read in row chunks (core.streaming), so peak memory does not grow with the
+number of workers times the file size. Each file gets a violation
+report `<name>_violations.csv`, and all files are summarized in
+`summary.csv` and `summary.json` in the output directory.
+
+With --sweep the files are treated as corners of one sweep (identical
+headers, see core.sweep): they are written to one `sweep_violations.csv`
+with a Run column plus a device x run `sweep_matrix.csv`.
+
+Binary datasets (core.dataset) can be given instead of CSVs, as their
+directory or their manifest.json; reports are named after the directory.
+
+Exit status: 0 when every file passes, 1 when any file has violations,
+2 when a file could not be analyzed or nothing matched.
+
+Usage:
+    python main.py batch "runs/**/*.csv" --limits soa_limits_ex.json --out reports
+    python main.py batch "pvt/*/tran.csv" --sweep --out pvt_reports
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Sequence
+
+from .analysis import analyze_batched
+from .config import load_limits
+from .dataset import dataset_dir, is_dataset
+from .parser import load_csv_columns, required_columns, scan_csv_header
+from .streaming import analyze_csv_chunked
+from .sweep import SweepResult, analyze_sweep
+
+EXIT_PASS = 0
+EXIT_VIOLATIONS = 1
+EXIT_ERROR = 2
+
+# CSVs larger than this are analyzed in row chunks instead of being loaded whole.
+STREAM_BYTES = 256 * 1024**2
+
+SUMMARY_FIELDS = ["file", "status", "rows", "bjts", "resistors", "violations", "failed_devices", "report", "seconds", "error"]
+
+
+def expand_paths(patterns: Sequence[str]) -> List[str]:
+    """Files or dataset directories matching any of the glob patterns (recursive `**` allowed), deduplicated, in sorted order."""
+    paths: Dict[str, None] = {}
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+        for path in sorted(matches):
+            if os.path.isfile(path) or is_dataset(path):
+                paths.setdefault(os.path.normpath(path), None)
+    return list(paths)
+
+
+def report_names(paths: Sequence[str]) -> List[str]:
+    """Per-file report file names; identical base names from different directories get a numeric suffix."""
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(dataset_dir(path) or path))[0]
+        n = seen.get(stem, 0)
+        seen[stem] = n + 1
+        names.append(f"{stem}_violations.csv" if n == 0 else f"{stem}_{n}_violations.csv")
+    return names
+
+
+def analyze_file(
+    path: str, defaults: Dict, overrides: Dict, report: str, episodes: bool = False, stream_bytes: int = STREAM_BYTES
+) -> Dict:
+    """
+    Analyze one CSV, write its violation report and return its summary
+    record. CSVs larger than `stream_bytes` are analyzed in row chunks;
+    binary datasets are memory-mapped and always analyzed whole.
+    """
+    start = time.perf_counter()
+    record: Dict = {"file": path, "status": "ERROR"}
+    try:
+        if not is_dataset(path) and os.path.getsize(path) > stream_bytes:
+            rows = [0]
+
+            def count(stage: str, done: int, total: int) -> None:
+                rows[0] = done
+
+            violations, bjt_devices, res_devices, _ = analyze_csv_chunked(
+                path, defaults, overrides, episodes=episodes, progress=count
+            )
+            n_rows = rows[0]
+        else:
+            bjt_devices, res_devices, time_col = scan_csv_header(path, defaults, overrides)
+            df = load_csv_columns(path, required_columns(bjt_devices, res_devices, time_col))
+            violations = analyze_batched(df, bjt_devices, res_devices, time_col, episodes=episodes)
+            n_rows = len(df)
+        violations.to_csv(report, index=False)
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        record["seconds"] = round(time.perf_counter() - start, 3)
+        return record
+
+    by_device = violations.groupby("Device Name", observed=True).size() if len(violations) else {}
+    by_parameter = violations.groupby("Parameter", observed=True).size() if len(violations) else {}
+    record.update(
+        {
+            "status": "FAIL" if len(violations) else "PASS",
+            "report": report,
+            "rows": n_rows,
+            "bjts": len(bjt_devices),
+            "resistors": len(res_devices),
+            "violations": len(violations),
+            "failed_devices": len(by_device),
+            "devices": {str(k): int(v) for k, v in dict(by_device).items()},
+            "parameters": {str(k): int(v) for k, v in dict(by_parameter).items()},
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+    )
+    return record
+
+
+def _analyze_file_job(args) -> Dict:
+    return analyze_file(*args)
+
+
+def run_batch(
+    paths: Sequence[str],
+    limits_path: str,
+    out_dir: str,
+    episodes: bool = False,
+    workers: Optional[int] = None,
+    log=None,
+    stream_bytes: int = STREAM_BYTES,
+) -> List[Dict]:
+    """
+    Analyze `paths` in a process pool, write the per-file reports plus
+    summary.csv/summary.json into `out_dir` and return the summary records
+    in the order of `paths`. `log(record, done, total)` is called as files
+    finish. CSVs larger than `stream_bytes` are analyzed in row chunks.
+    """
+    defaults, overrides = load_limits(limits_path)
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [
+        (path, defaults, overrides, os.path.join(out_dir, name), episodes, stream_bytes)
+        for path, name in zip(paths, report_names(paths))
+    ]
+
+    records: List[Optional[Dict]] = [None] * len(jobs)
+    workers = min(workers or os.cpu_count() or 1, max(len(jobs), 1))
+    if workers <= 1:
+        for i, job in enumerate(jobs):
+            records[i] = _analyze_file_job(job)
+            if log:
+                log(records[i], i + 1, len(jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_analyze_file_job, job): i for i, job in enumerate(jobs)}
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                records[i] = future.result()
+                if log:
+                    log(records[i], done, len(jobs))
+
+    write_summary(records, out_dir, limits_path)  # type: ignore[arg-type]
+    return records  # type: ignore[return-value]
+
+
+def write_summary(records: List[Dict], out_dir: str, limits_path: str) -> None:
+    with open(os.path.join(out_dir, "summary.csv"), "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(records)
+
+    totals = {status: sum(r["status"] == status for r in records) for status in ("PASS", "FAIL", "ERROR")}
+    summary = {
+        "limits": os.path.abspath(limits_path),
+        "files": len(records),
+        **{k.lower(): v for k, v in totals.items()},
+        "violations": sum(r.get("violations", 0) for r in records),
+        "results": records,
+    }
+    with open(os.path.join(out_dir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+
+
+def exit_status(records: Sequence[Dict]) -> int:
+    if not records or any(r["status"] == "ERROR" for r in records):
+        return EXIT_ERROR
+    if any(r["status"] == "FAIL" for r in records):
+        return EXIT_VIOLATIONS
+    return EXIT_PASS
+
+
+def run_sweep(
+    paths: Sequence[str], limits_path: str, out_dir: str, episodes: bool = False, workers: Optional[int] = None
+) -> SweepResult:
+    """Analyze `paths` as one sweep and write sweep_violations.csv and sweep_matrix.csv into `out_dir`."""
+    defaults, overrides = load_limits(limits_path)
+    result = analyze_sweep(paths, defaults, overrides, episodes=episodes, workers=workers)
+    os.makedirs(out_dir, exist_ok=True)
+    result.violations.to_csv(os.path.join(out_dir, "sweep_violations.csv"), index=False)
+    result.pass_fail_matrix().to_csv(os.path.join(out_dir, "sweep_matrix.csv"), index=False)
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="main.py batch", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    ap.add_argument("patterns", nargs="+", help="CSV files, binary datasets or glob patterns (quote them to use recursive **)")
+    ap.add_argument("--limits", default="soa_limits_ex.json", help="SOA limits JSON")
+    ap.add_argument("--out", default="soa_reports", help="output directory for reports")
+    ap.add_argument("--episodes", action="store_true", help="report one row per excursion instead of per sample")
+    ap.add_argument("--sweep", action="store_true", help="analyze the files as corners of one sweep (identical headers)")
+    ap.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    ap.add_argument(
+        "--stream-mb",
+        type=float,
+        default=STREAM_BYTES / 1024**2,
+        help="analyze CSVs larger than this many MB in row chunks (0: every CSV)",
+    )
+    ap.add_argument("-q", "--quiet", action="store_true", help="only print the final summary line")
+    args = ap.parse_args(argv)
+
+    paths = expand_paths(args.patterns)
+    if not paths:
+        print("没有匹配的 CSV 文件", file=sys.stderr)
+        return EXIT_ERROR
+    try:
+        load_limits(args.limits)
+    except Exception as e:
+        print(f"无法读取限值配置 {args.limits}: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    if args.sweep:
+        try:
+            result = run_sweep(paths, args.limits, args.out, episodes=args.episodes, workers=args.workers)
+        except Exception as e:
+            print(f"扫描分析失败: {type(e).__name__}: {e}", file=sys.stderr)
+            return EXIT_ERROR
+        failing = result.counts.sum(axis=0) > 0
+        if not args.quiet:
+            for run, count in zip(result.runs, result.counts.sum(axis=0)):
+                print(f"{'FAIL' if count else 'PASS':<5} {run} ({count} violations)")
+        print(
+            f"{len(result.runs)} runs: {int((~failing).sum())} pass, {int(failing.sum())} fail, "
+            f"{int(result.counts.any(axis=1).sum())} failing devices -> {os.path.join(args.out, 'sweep_matrix.csv')}"
+        )
+        return EXIT_VIOLATIONS if failing.any() else EXIT_PASS
+
+    def log(record: Dict, done: int, total: int) -> None:
+        if args.quiet:
+            return
+        detail = record.get("error") or f"{record['violations']} violations"
+        print(f"[{done}/{total}] {record['status']:<5} {record['file']} ({detail})", flush=True)
+
+    records = run_batch(
+        paths,
+        args.limits,
+        args.out,
+        episodes=args.episodes,
+        workers=args.workers,
+        log=log,
+        stream_bytes=int(args.stream_mb * 1024**2),
+    )
+    code = exit_status(records)
+    totals = {s: sum(r["status"] == s for r in records) for s in ("PASS", "FAIL", "ERROR")}
+    print(
+        f"{len(records)} files: {totals['PASS']} pass, {totals['FAIL']} fail, {totals['ERROR']} error "
+        f"-> {os.path.join(args.out, 'summary.csv')}"
+    )
+    return code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
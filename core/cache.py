@@ -0,0 +1,181 @@
+"""
+Persistent binary cache of parsed simulation data.
+
+Each cached CSV is stored as one `.npy` file per column plus a JSON manifest
+(the dataset layout of core.dataset), in a directory named after the source
+fingerprint (path + size + mtime, and optionally a content hash). Cached
+columns are memory-mapped on read, and the cache is trimmed
+least-recently-used first once it exceeds its size cap.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .catalog import DeviceCatalog
+from .dataset import MANIFEST, is_dataset, load_dataset_columns, read_columns, write_columns
+from .parser import ProgressCallback, load_csv_columns
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ads_soa_analyzer")
+DEFAULT_MAX_BYTES = 8 * 1024**3
+CATALOG = "catalog.json"
+
+
+def fingerprint(path: str, content_hash: bool = False) -> str:
+    """Key a source file by absolute path, size and mtime (plus a SHA-1 of its bytes if requested)."""
+    st = os.stat(path)
+    h = hashlib.sha1(f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}".encode("utf-8"))
+    if content_hash:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    return h.hexdigest()
+
+
+class DataCache:
+    """Column cache keyed by source-file fingerprint, with an LRU size cap."""
+
+    def __init__(self, root: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES, content_hash: bool = False) -> None:
+        self.root = root or os.environ.get("ADS_SOA_CACHE_DIR") or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.content_hash = content_hash
+
+    def _entry_dir(self, path: str) -> str:
+        return os.path.join(self.root, fingerprint(path, self.content_hash))
+
+    def _read_manifest(self, entry: str) -> Optional[Dict]:
+        try:
+            with open(os.path.join(entry, MANIFEST), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load_arrays(self, path: str, columns: Optional[Sequence[str]] = None, mmap: bool = True) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Return {column: array} for `path` if every requested column is cached,
+        else None. Arrays are read-only memory maps unless `mmap` is False.
+        """
+        entry = self._entry_dir(path)
+        manifest = self._read_manifest(entry)
+        if manifest is None:
+            return None
+        arrays = read_columns(entry, manifest, columns, mmap)
+        if arrays is None:
+            return None
+        # Touch the manifest so eviction sees this entry as recently used.
+        os.utime(os.path.join(entry, MANIFEST))
+        return arrays
+
+    def load(self, path: str, columns: Optional[Sequence[str]] = None, mmap: bool = True) -> Optional[pd.DataFrame]:
+        arrays = self.load_arrays(path, columns, mmap)
+        if arrays is None:
+            return None
+        return pd.DataFrame(arrays, copy=False)
+
+    def load_catalog(self, path: str) -> Optional[DeviceCatalog]:
+        """Device catalog stored alongside the cached columns of `path`, if any."""
+        try:
+            with open(os.path.join(self._entry_dir(path), CATALOG), "r", encoding="utf-8") as f:
+                return DeviceCatalog.from_json(f.read())
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(self, path: str, df: pd.DataFrame, catalog: Optional[DeviceCatalog] = None) -> None:
+        """
+        Write every column of `df` (and optionally the discovered device
+        catalog) as the cache entry for `path`, replacing any older entry.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        entry = self._entry_dir(path)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=self.root)
+        try:
+            manifest = {"source": os.path.abspath(path), **write_columns(tmp, df), "created": time.time()}
+            with open(os.path.join(tmp, MANIFEST), "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            if catalog is not None:
+                with open(os.path.join(tmp, CATALOG), "w", encoding="utf-8") as f:
+                    f.write(catalog.to_json())
+            shutil.rmtree(entry, ignore_errors=True)
+            os.replace(tmp, entry)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        self.evict()
+
+    def entries(self) -> List[Dict]:
+        """Manifests of all cache entries, each with its directory and last-use time."""
+        out: List[Dict] = []
+        if not os.path.isdir(self.root):
+            return out
+        for name in os.listdir(self.root):
+            entry = os.path.join(self.root, name)
+            if name.startswith(".") or not os.path.isdir(entry):
+                continue
+            manifest = self._read_manifest(entry)
+            if manifest is None:
+                continue
+            manifest["dir"] = entry
+            manifest["last_used"] = os.path.getmtime(os.path.join(entry, MANIFEST))
+            out.append(manifest)
+        return out
+
+    def evict(self) -> None:
+        """Drop least-recently-used entries until the cache fits in `max_bytes`."""
+        entries = sorted(self.entries(), key=lambda m: m["last_used"])
+        total = sum(m["bytes"] for m in entries)
+        for manifest in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(manifest["dir"], ignore_errors=True)
+            total -= manifest["bytes"]
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Remove the cached data of `path` (any version of it), or the whole cache when None."""
+        source = os.path.abspath(path) if path is not None else None
+        for manifest in self.entries():
+            if source is None or manifest["source"] == source:
+                shutil.rmtree(manifest["dir"], ignore_errors=True)
+
+
+def load_csv_cached(
+    path: str,
+    columns: Optional[Sequence[str]] = None,
+    cache: Optional[DataCache] = None,
+    catalog: Optional[DeviceCatalog] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> pd.DataFrame:
+    """
+    load_csv_columns with a persistent cache in front of it: the first load
+    parses the CSV and stores the columns (plus `catalog`, when given), later
+    loads map them from disk. `progress` is passed to load_csv_columns on a miss.
+    Binary datasets (core.dataset) are already stored this way and are
+    mapped directly, without a cache entry.
+    """
+    if is_dataset(path):
+        return load_dataset_columns(path, columns)
+    cache = cache or DataCache()
+    try:
+        df = cache.load(path, columns)
+    except OSError:
+        df = None
+    if df is not None:
+        return df
+
+    df = load_csv_columns(path, columns, progress=progress)
+    if progress is not None:
+        progress("Caching columns", 0, 1)
+    try:
+        cache.store(path, df, catalog)
+    except (OSError, ValueError):
+        # A read-only or full cache directory (or an object column) must not break loading.
+        pass
+    return df
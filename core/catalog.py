@@ -0,0 +1,206 @@
+"""Indexed device catalog built in one pass over CSV headers."""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import asdict, dataclass, field, replace
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from .config import bjt_limits, resistor_limits
+from .models import BJTDevice, BJTLimits, ResistorDevice, ResistorLimits
+
+BJT_SUFFIXES = frozenset(("c", "b", "e", "bi", "ci", "ei", "t"))
+RESISTOR_SUFFIX = ".R_contact.i"
+# A device token is any hierarchy level starting with Q or R (see short_name_from_column).
+_DEVICE_TOKEN = re.compile(r"[QR]")
+
+Device = Union[BJTDevice, ResistorDevice]
+
+
+def short_name(path: str) -> str:
+    """
+    Short device name from a hierarchical path: the last level that starts
+    with Q or R, else the second to last level.
+    """
+    parts = path.split(".")
+    for token in reversed(parts):
+        if _DEVICE_TOKEN.match(token):
+            return token
+    if len(parts) >= 2:
+        return parts[-2]
+    return path
+
+
+@dataclass
+class DeviceCatalog:
+    """
+    Discovered devices with constant-time lookups by name, type and
+    hierarchical path (the column name without its signal suffix, e.g.
+    'Testbench.X3.Q12.Q12'). Devices may or may not carry limits; use
+    with_limits to merge a limits config into a new catalog.
+    """
+
+    time_col: str
+    bjts: List[BJTDevice] = field(default_factory=list)
+    resistors: List[ResistorDevice] = field(default_factory=list)
+    bjt_paths: List[str] = field(default_factory=list)
+    resistor_paths: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._bjt_by_name: Dict[str, BJTDevice] = {}
+        for dev in self.bjts:
+            self._bjt_by_name.setdefault(dev.name, dev)
+        self._res_by_name: Dict[str, ResistorDevice] = {}
+        for dev in self.resistors:
+            self._res_by_name.setdefault(dev.name, dev)
+        self._by_path: Dict[str, Device] = dict(zip(self.bjt_paths, self.bjts))
+        self._by_path.update(zip(self.resistor_paths, self.resistors))
+        self._children: Optional[Dict[str, List[Device]]] = None
+
+    # ---------------- Construction ----------------
+    @classmethod
+    def from_columns(cls, columns: Iterable[str]) -> "DeviceCatalog":
+        """Discover BJTs (.c/.b/.e with optional .bi/.ci/.ei/.t) and resistors (.R_contact.i) in one pass."""
+        columns = list(columns)
+        # 'time' has no hierarchy separator, so it never matches the suffix rules below.
+        time_col = next((c for c in columns if c.lower() == "time"), None)
+        if not time_col:
+            raise ValueError("CSV 中缺少 'time' 列")
+
+        groups: Dict[str, Dict[str, str]] = {}
+        res_cols: List[str] = []
+        suffixes = BJT_SUFFIXES
+        for col in columns:
+            base, sep, suf = col.rpartition(".")
+            if not sep:
+                continue
+            if suf in suffixes:
+                grp = groups.get(base)
+                if grp is None:
+                    groups[base] = grp = {}
+                grp[suf] = col
+            elif suf == "i" and col.endswith(RESISTOR_SUFFIX):
+                res_cols.append(col)
+
+        bjts: List[BJTDevice] = []
+        bjt_paths: List[str] = []
+        for base, grp in groups.items():
+            if "c" not in grp or "b" not in grp or "e" not in grp:
+                continue
+            bjts.append(
+                BJTDevice(
+                    name=short_name(base),
+                    col_vc=grp["c"],
+                    col_vb=grp["b"],
+                    col_ve=grp["e"],
+                    col_ib=grp.get("bi"),
+                    col_ic=grp.get("ci"),
+                    col_ie=grp.get("ei"),
+                    col_temp=grp.get("t"),
+                )
+            )
+            bjt_paths.append(base)
+
+        resistors = [ResistorDevice(name=short_name(col), col_ir=col, limits=None) for col in res_cols]  # type: ignore[arg-type]
+        resistor_paths = [col[: -len(".i")] for col in res_cols]
+        return cls(time_col, bjts, resistors, bjt_paths, resistor_paths)
+
+    def with_limits(self, defaults: Dict, overrides: Dict) -> "DeviceCatalog":
+        """Copy of the catalog with the defaults/overrides limits merged into every device."""
+        return DeviceCatalog(
+            self.time_col,
+            [replace(dev, limits=bjt_limits(dev.name, defaults, overrides)) for dev in self.bjts],
+            [replace(dev, limits=resistor_limits(dev.name, defaults, overrides)) for dev in self.resistors],
+            self.bjt_paths,
+            self.resistor_paths,
+        )
+
+    # ---------------- Lookup ----------------
+    def bjt(self, name: str) -> Optional[BJTDevice]:
+        return self._bjt_by_name.get(name)
+
+    def resistor(self, name: str) -> Optional[ResistorDevice]:
+        return self._res_by_name.get(name)
+
+    def get(self, kind: str, name: str) -> Optional[Device]:
+        """Lookup by type ("BJT" or "RES") and short name."""
+        return self.bjt(name) if kind == "BJT" else self.resistor(name)
+
+    def by_path(self, path: str) -> Optional[Device]:
+        return self._by_path.get(path)
+
+    def under(self, prefix: str) -> List[Device]:
+        """All devices below a hierarchy level, e.g. under('Testbench.X3')."""
+        if self._children is None:
+            children: Dict[str, List[Device]] = {}
+            for path, dev in self._by_path.items():
+                parts = path.split(".")
+                for depth in range(1, len(parts)):
+                    children.setdefault(".".join(parts[:depth]), []).append(dev)
+            self._children = children
+        return list(self._children.get(prefix, []))
+
+    def __len__(self) -> int:
+        return len(self.bjts) + len(self.resistors)
+
+    def columns(self) -> List[str]:
+        """Time column plus every column referenced by the devices, in first-seen order."""
+        return required_columns(self.bjts, self.resistors, self.time_col)
+
+    # ---------------- Serialization ----------------
+    def to_dict(self) -> Dict:
+        def limits(dev: Device) -> Optional[Dict]:
+            return asdict(dev.limits) if dev.limits is not None else None
+
+        return {
+            "time_col": self.time_col,
+            "bjts": [
+                {**{k: v for k, v in asdict(dev).items() if k != "limits"}, "path": path, "limits": limits(dev)}
+                for dev, path in zip(self.bjts, self.bjt_paths)
+            ],
+            "resistors": [
+                {"name": dev.name, "col_ir": dev.col_ir, "path": path, "limits": limits(dev)}
+                for dev, path in zip(self.resistors, self.resistor_paths)
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DeviceCatalog":
+        bjts: List[BJTDevice] = []
+        bjt_paths: List[str] = []
+        for item in data.get("bjts", []):
+            item = dict(item)
+            bjt_paths.append(item.pop("path"))
+            lim = item.pop("limits", None)
+            bjts.append(BJTDevice(**item, limits=BJTLimits(**lim) if lim else None))  # type: ignore[arg-type]
+        resistors: List[ResistorDevice] = []
+        resistor_paths: List[str] = []
+        for item in data.get("resistors", []):
+            lim = item.get("limits")
+            resistors.append(
+                ResistorDevice(
+                    name=item["name"], col_ir=item["col_ir"], limits=ResistorLimits(**lim) if lim else None  # type: ignore[arg-type]
+                )
+            )
+            resistor_paths.append(item["path"])
+        return cls(data["time_col"], bjts, resistors, bjt_paths, resistor_paths)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text: str) -> "DeviceCatalog":
+        return cls.from_dict(json.loads(text))
+
+
+def required_columns(bjt_devices: Sequence[BJTDevice], res_devices: Sequence[ResistorDevice], time_col: str) -> List[str]:
+    """Time column plus every column referenced by the discovered devices, in first-seen order."""
+    cols: Dict[str, None] = {time_col: None}
+    for dev in bjt_devices:
+        for col in (dev.col_vc, dev.col_vb, dev.col_ve, dev.col_ib, dev.col_ic, dev.col_ie, dev.col_temp):
+            if col:
+                cols[col] = None
+    for dev in res_devices:
+        cols[dev.col_ir] = None
+    return list(cols)
@@ -1,14 +1,111 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, Tuple
+import math
+from typing import Dict, Optional, Tuple
+
+from .models import SOA_SCALES, BJTLimits, PulseTable, ResistorLimits, SoaBoundary
 
 
 def load_limits(path: str) -> Tuple[Dict, Dict]:
-    """Load JSON limits and split into defaults and overrides."""
+    """
+    Load JSON limits and split into defaults and overrides. Pulse tables,
+    thermal networks and SOA boundaries are validated here, so a malformed config fails when
+    it is loaded rather than during analysis.
+    """
     with open(path, "r", encoding="utf-8") as f:
         cfg = json.load(f)
     defaults = cfg.get("defaults", {})
     overrides = cfg.get("overrides", {})
+    for name in ["", *overrides]:
+        try:
+            bjt_limits(name, defaults, overrides)
+        except ValueError as e:
+            raise ValueError(f"{name or 'defaults.BJT'}: {e}") from None
     return defaults, overrides
 
+
+def pulse_table(rows, key: str = "PULSE") -> Optional[PulseTable]:
+    """
+    Parse a pulse limit table given as [[pulse width (s), limit], ...]
+    into rows sorted by width; raises ValueError on malformed tables.
+    """
+    if rows is None:
+        return None
+    try:
+        table = tuple(sorted((float(width), float(limit)) for width, limit in rows))
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} 应为 [[脉宽(s), 限值], ...] 形式的列表") from None
+    if not table:
+        raise ValueError(f"{key} 至少需要一行 [脉宽(s), 限值]")
+    if any(not (math.isfinite(w) and w > 0 and math.isfinite(v) and v > 0) for w, v in table):
+        raise ValueError(f"{key} 的脉宽与限值必须为正的有限数")
+    if len({w for w, _ in table}) != len(table):
+        raise ValueError(f"{key} 中存在重复的脉宽")
+    return table
+
+
+def thermal_network(r, c) -> Tuple[Optional[Tuple[float, ...]], Optional[Tuple[float, ...]]]:
+    """Parse the Foster branches THERMAL_R (K/W) and THERMAL_C (J/K); raises ValueError unless both match."""
+    if r is None and c is None:
+        return None, None
+    try:
+        r = tuple(float(v) for v in r)
+        c = tuple(float(v) for v in c)
+    except (TypeError, ValueError):
+        raise ValueError("THERMAL_R 与 THERMAL_C 应为同样长度的数值列表") from None
+    if not r or len(r) != len(c):
+        raise ValueError("THERMAL_R 与 THERMAL_C 应为同样长度的数值列表")
+    if any(not (math.isfinite(v) and v > 0) for v in r + c):
+        raise ValueError("THERMAL_R 与 THERMAL_C 必须为正的有限数")
+    return r, c
+
+
+def soa_boundary(points, scale) -> Tuple[Optional[SoaBoundary], str]:
+    """Parse SOA_BOUNDARY [[VCE, IC], ...] and SOA_SCALE; raises ValueError on malformed boundaries."""
+    scale = "loglog" if scale is None else scale
+    if scale not in SOA_SCALES:
+        raise ValueError(f"SOA_SCALE 应为 {' 或 '.join(SOA_SCALES)}")
+    if points is None:
+        return None, scale
+    try:
+        boundary = tuple((float(vce), float(ic)) for vce, ic in points)
+    except (TypeError, ValueError):
+        raise ValueError("SOA_BOUNDARY 应为 [[VCE, IC], ...] 形式的列表") from None
+    if len(boundary) < 2:
+        raise ValueError("SOA_BOUNDARY 至少需要两个拐点")
+    if any(not (math.isfinite(v) and v > 0 and math.isfinite(i) and i > 0) for v, i in boundary):
+        raise ValueError("SOA_BOUNDARY 的 VCE 与 IC 必须为正的有限数")
+    if any(b[0] <= a[0] for a, b in zip(boundary, boundary[1:])):
+        raise ValueError("SOA_BOUNDARY 的 VCE 必须严格递增")
+    return boundary, scale
+
+
+def bjt_limits(name: str, defaults: Dict, overrides: Dict) -> BJTLimits:
+    """Merge the BJT defaults with the per-device override of `name`."""
+    merged = {**defaults.get("BJT", {}), **overrides.get(name, {})}
+    thermal_r, thermal_c = thermal_network(merged.get("THERMAL_R"), merged.get("THERMAL_C"))
+    boundary, scale = soa_boundary(merged.get("SOA_BOUNDARY"), merged.get("SOA_SCALE"))
+    return BJTLimits(
+        MAX_VCE=merged.get("MAX_VCE", float("inf")),
+        MAX_VBE=merged.get("MAX_VBE", float("inf")),
+        MAX_VBC=merged.get("MAX_VBC"),
+        MAX_IB=merged.get("MAX_IB"),
+        MAX_IC=merged.get("MAX_IC"),
+        MAX_IE=merged.get("MAX_IE"),
+        MAX_POWER=merged.get("MAX_POWER"),
+        MAX_TEMP=merged.get("MAX_TEMP"),
+        PULSE_VCE=pulse_table(merged.get("PULSE_VCE"), "PULSE_VCE"),
+        PULSE_IC=pulse_table(merged.get("PULSE_IC"), "PULSE_IC"),
+        PULSE_POWER=pulse_table(merged.get("PULSE_POWER"), "PULSE_POWER"),
+        THERMAL_R=thermal_r,
+        THERMAL_C=thermal_c,
+        T_AMBIENT=float(merged.get("T_AMBIENT", 25.0)),
+        SOA_BOUNDARY=boundary,
+        SOA_SCALE=scale,
+    )
+
+
+def resistor_limits(name: str, defaults: Dict, overrides: Dict) -> ResistorLimits:
+    merged = {**defaults.get("RESISTOR", {}), **overrides.get(name, {})}
+    return ResistorLimits(MAX_RES_CURRENT=merged.get("MAX_RES_CURRENT", float("inf")))
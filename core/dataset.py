@@ -0,0 +1,106 @@
+"""
+Binary column datasets.
+
+A dataset is a directory with one `.npy` file per column and a JSON
+manifest, {"rows": n, "columns": [...], "files": [...], ...}. The ADS
+conversion script (ads_python_scripts/tran_sim_and_data_convert.py) can
+export simulations in this layout, and the entries of core.cache use it
+too. Columns are memory-mapped on read, so loading costs no text parsing
+and no float conversion.
+
+A dataset is referred to by its directory or by its manifest file (which
+is what a file dialog can pick).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = "manifest.json"
+
+
+def dataset_dir(path: str) -> Optional[str]:
+    """Directory of the dataset at `path` (its directory or manifest file), or None if it is not one."""
+    if os.path.basename(path) == MANIFEST and os.path.isfile(path):
+        return os.path.dirname(path) or "."
+    if os.path.isdir(path) and os.path.isfile(os.path.join(path, MANIFEST)):
+        return path
+    return None
+
+
+def is_dataset(path: str) -> bool:
+    return dataset_dir(path) is not None
+
+
+def read_manifest(directory: str) -> Dict:
+    """Manifest of the dataset in `directory`; raises ValueError when it is malformed."""
+    with open(os.path.join(directory, MANIFEST), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    columns, files = manifest.get("columns"), manifest.get("files")
+    if not isinstance(columns, list) or not isinstance(files, list) or len(columns) != len(files):
+        raise ValueError(f"{directory}: {MANIFEST} 中的 columns 与 files 应为等长列表")
+    return manifest
+
+
+def read_columns(
+    directory: str, manifest: Dict, columns: Optional[Sequence[str]] = None, mmap: bool = True
+) -> Optional[Dict[str, np.ndarray]]:
+    """
+    {column: array} for `columns` (all when None) of the dataset in
+    `directory`, or None if any is missing. Arrays are read-only memory maps
+    unless `mmap` is False.
+    """
+    files = dict(zip(manifest["columns"], manifest["files"]))
+    wanted = list(columns) if columns is not None else manifest["columns"]
+    if any(col not in files for col in wanted):
+        return None
+    mode = "r" if mmap else None
+    return {col: np.load(os.path.join(directory, files[col]), mmap_mode=mode, allow_pickle=False) for col in wanted}
+
+
+def write_columns(directory: str, df: pd.DataFrame) -> Dict:
+    """
+    Write every column of `df` into the existing `directory` and return the
+    manifest fields describing them (rows, columns, files, bytes); the
+    caller adds its own fields and writes the manifest.
+    """
+    columns: List[str] = [str(c) for c in df.columns]
+    files = [f"c{i}.npy" for i in range(len(columns))]
+    nbytes = 0
+    for col, fname in zip(df.columns, files):
+        arr = np.ascontiguousarray(df[col].to_numpy())
+        np.save(os.path.join(directory, fname), arr, allow_pickle=False)
+        nbytes += arr.nbytes
+    return {"rows": len(df), "columns": columns, "files": files, "bytes": nbytes}
+
+
+def read_dataset_header(path: str) -> List[str]:
+    """Column names of a dataset, from its manifest only."""
+    return list(read_manifest(dataset_dir(path) or path)["columns"])
+
+
+def load_dataset_columns(path: str, columns: Optional[Sequence[str]] = None, mmap: bool = True) -> pd.DataFrame:
+    """
+    Columns of a dataset as a float64 DataFrame backed by memory maps,
+    restricted to `columns` when given; raises ValueError for missing
+    columns or truncated files.
+    """
+    directory = dataset_dir(path) or path
+    manifest = read_manifest(directory)
+    arrays = read_columns(directory, manifest, columns, mmap)
+    if arrays is None:
+        have = set(manifest["columns"])
+        missing = [c for c in columns if c not in have]
+        raise ValueError(f"{directory}: 数据集中缺少 {len(missing)} 列（如 {missing[0]!r}）")
+    rows = manifest.get("rows")
+    for col, arr in arrays.items():
+        if arr.ndim != 1 or (rows is not None and len(arr) != rows):
+            raise ValueError(f"{directory}: 列 {col!r} 的长度与 {MANIFEST} 中的 rows 不一致")
+        if arr.dtype != np.float64:
+            arrays[col] = arr.astype(np.float64)
+    return pd.DataFrame(arrays, copy=False)
@@ -0,0 +1,94 @@
+"""
+Plot decimation that keeps extremes.
+
+Waveforms are reduced to the first, min and max sample of each x bucket
+(about one bucket per pixel), so every peak and limit crossing stays
+visible. Point clouds such as the SOA trajectory keep one point per
+occupied screen cell.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def _first_hits(hits: np.ndarray, starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """First element of sorted `hits` inside each [start, stop); buckets without one are dropped."""
+    pos = np.searchsorted(hits, starts)
+    ok = pos < len(hits)
+    found = hits[pos[ok]]
+    return found[found < stops[ok]]
+
+
+def minmax_indices(
+    x: np.ndarray, y: np.ndarray, buckets: int, x_range: Optional[Tuple[float, float]] = None
+) -> np.ndarray:
+    """
+    Sorted sample indices that reproduce the line (x, y) at `buckets` x resolution.
+
+    `x` must be ascending (simulation time). With `x_range` only samples in
+    the range, plus one neighbour on each side, are considered so the line
+    still reaches the plot edges. Each equal-width x bucket contributes its
+    min and max sample; ranges with few samples are returned unchanged.
+    """
+    n = len(x)
+    lo, hi = 0, n
+    if x_range is not None and n:
+        lo = max(int(np.searchsorted(x, x_range[0], side="left")) - 1, 0)
+        hi = min(int(np.searchsorted(x, x_range[1], side="right")) + 1, n)
+    count = hi - lo
+    if count <= 2 * buckets + 2:
+        return np.arange(lo, hi)
+
+    xs = x[lo:hi]
+    ys = y[lo:hi]
+    edges = np.linspace(xs[0], xs[-1], buckets + 1)[:-1]
+    # Empty buckets give repeated start positions; reduceat needs them unique.
+    starts = np.unique(np.searchsorted(xs, edges, side="left"))
+    stops = np.append(starts[1:], count)
+    lengths = stops - starts
+
+    mins = np.fmin.reduceat(ys, starts)
+    maxs = np.fmax.reduceat(ys, starts)
+    imin = _first_hits(np.flatnonzero(ys == np.repeat(mins, lengths)), starts, stops)
+    imax = _first_hits(np.flatnonzero(ys == np.repeat(maxs, lengths)), starts, stops)
+    idx = np.concatenate(([0, count - 1], imin, imax))
+    return np.unique(idx) + lo
+
+
+def grid_indices(
+    x: np.ndarray,
+    y: np.ndarray,
+    cells: Tuple[int, int],
+    x_range: Optional[Tuple[float, float]] = None,
+    y_range: Optional[Tuple[float, float]] = None,
+    max_points: int = 0,
+) -> np.ndarray:
+    """
+    Sorted indices keeping the first point in each occupied cell of a
+    cells[0] x cells[1] grid over the visible ranges (the data extent when
+    not given). Points outside the ranges or non-finite are dropped. If at
+    most `max_points` points are visible they are all returned.
+    """
+    ok = np.isfinite(x) & np.isfinite(y)
+    if not ok.any():
+        return np.flatnonzero(ok)
+    x0, x1 = x_range if x_range is not None else (np.min(x[ok]), np.max(x[ok]))
+    y0, y1 = y_range if y_range is not None else (np.min(y[ok]), np.max(y[ok]))
+    x0, x1 = min(x0, x1), max(x0, x1)
+    y0, y1 = min(y0, y1), max(y0, y1)
+    if x_range is not None or y_range is not None:
+        ok &= (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+    visible = np.flatnonzero(ok)
+    if len(visible) <= max_points:
+        return visible
+
+    nx, ny = max(int(cells[0]), 1), max(int(cells[1]), 1)
+    ix = ((x[visible] - x0) * (nx / ((x1 - x0) or 1.0))).astype(np.int64)
+    iy = ((y[visible] - y0) * (ny / ((y1 - y0) or 1.0))).astype(np.int64)
+    np.clip(ix, 0, nx - 1, out=ix)
+    np.clip(iy, 0, ny - 1, out=iy)
+    _, first = np.unique(ix * ny + iy, return_index=True)
+    return visible[np.sort(first)]
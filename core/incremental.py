@@ -0,0 +1,177 @@
+"""Incremental re-analysis of the same data when only the limits change."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .analysis import (
+    BLOCK_ELEMENTS,
+    PARAMETERS,
+    CheckBlock,
+    ColumnData,
+    _bjt_checks,
+    _episode_parts,
+    _resistor_checks,
+    _sample_parts,
+    assemble_violations,
+    bjt_signals,
+    device_summary,
+    resistor_signals,
+    summary_part,
+)
+from .catalog import DeviceCatalog
+from .models import BJTDevice, ResistorDevice
+from .parser import ProgressCallback
+
+DEFAULT_SIGNAL_CACHE_BYTES = 512 * 1024**2
+
+
+class IncrementalAnalyzer:
+    """
+    Keeps device discovery, derived signals (VCE, VBE, VBC, power, ...) and
+    per-device results between runs on the same data. After a limits change
+    only devices whose merged BJTLimits/ResistorLimits differ from the previous
+    run are re-evaluated; the others reuse their stored violation records.
+
+    Per-device peaks and limits are collected in the same pass, and
+    `self.summary` holds the device_summary frame of the last analyze().
+    """
+
+    def __init__(self, signal_cache_bytes: int = DEFAULT_SIGNAL_CACHE_BYTES) -> None:
+        self.signal_cache_bytes = signal_cache_bytes
+        self.reset()
+
+    def reset(self) -> None:
+        self._data = None
+        self._columns: List[str] = []
+        self._discovered = DeviceCatalog("time")
+        self.catalog = self._discovered
+        self._bjt: List[BJTDevice] = []
+        self._res: List[ResistorDevice] = []
+        self._episodes = False
+        self._results: Dict[int, dict] = {}
+        # (n_devices, len(PARAMETERS)) peaks and limits, rows filled as devices are checked.
+        self._peaks = np.empty((0, len(PARAMETERS)))
+        self._limits = np.empty((0, len(PARAMETERS)))
+        self.summary: Optional[pd.DataFrame] = None
+        self._signals: "OrderedDict[int, Dict[str, np.ndarray]]" = OrderedDict()
+        self._signal_bytes = 0
+        self.last_reanalyzed = 0
+
+    def analyze(
+        self,
+        data: ColumnData,
+        defaults: Dict,
+        overrides: Dict,
+        episodes: bool = False,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Tuple[pd.DataFrame, List[BJTDevice], List[ResistorDevice], str]:
+        """
+        Analyze `data` with the given limits. Passing the same data object as
+        the previous call reuses everything that the new limits leave intact.
+        Returns (violations_df, bjt_devices, resistor_devices, time_col); the
+        devices are also indexed in `self.catalog`.
+
+        `progress(stage, done, total)` is called per stage and after each
+        device block. If it raises, the analysis stops and results stored
+        during this call are dropped, so the next call redoes those devices.
+        """
+        report = progress or (lambda stage, done, total: None)
+        columns = [str(c) for c in data.columns] if isinstance(data, pd.DataFrame) else list(data)
+        if data is not self._data or columns != self._columns:
+            self.reset()
+            report("Discovering devices", 0, 1)
+            self._data = data
+            self._columns = columns
+            self._discovered = DeviceCatalog.from_columns(columns)
+        if episodes != self._episodes:
+            self._results.clear()
+            self._episodes = episodes
+
+        self.catalog = self._discovered.with_limits(defaults, overrides)
+        bjt, res, time_col = self.catalog.bjts, self.catalog.resistors, self.catalog.time_col
+        n_bjt = len(bjt)
+        if len(self._peaks) != n_bjt + len(res):
+            self._peaks = np.full((n_bjt + len(res), len(PARAMETERS)), np.nan)
+            self._limits = np.full((n_bjt + len(res), len(PARAMETERS)), np.nan)
+        changed_bjt = [i for i, dev in enumerate(bjt) if i not in self._results or self._bjt[i].limits != dev.limits]
+        changed_res = [
+            j for j, dev in enumerate(res) if n_bjt + j not in self._results or self._res[j].limits != dev.limits
+        ]
+
+        t = np.asarray(data[time_col])
+        n = len(t)
+        block = max(1, BLOCK_ELEMENTS // max(n, 1))
+        build = _episode_parts if episodes else _sample_parts
+        total = len(changed_bjt) + len(changed_res)
+        try:
+            report("Analyzing devices", 0, total)
+            for start in range(0, len(changed_bjt), block):
+                ids = changed_bjt[start : start + block]
+                devs = [bjt[i] for i in ids]
+                signals = self._block_signals(data, ids, devs, n)
+                self._store(_bjt_checks(signals, devs, np.array(ids), t), build, t, ids)
+                report("Analyzing devices", start + len(ids), total)
+            for start in range(0, len(changed_res), block):
+                ids = changed_res[start : start + block]
+                devs = [res[j] for j in ids]
+                idx = [n_bjt + j for j in ids]
+                self._store(_resistor_checks(resistor_signals(data, devs, n), devs, np.array(idx)), build, t, idx)
+                report("Analyzing devices", len(changed_bjt) + start + len(ids), total)
+        except BaseException:
+            # Records of devices re-checked with the new limits must not be mistaken for the old ones.
+            for i in changed_bjt + [n_bjt + j for j in changed_res]:
+                self._results.pop(i, None)
+            raise
+
+        self._bjt, self._res = bjt, res
+        self.last_reanalyzed = len(changed_bjt) + len(changed_res)
+
+        parts = [self._results[i] for i in range(n_bjt + len(res))]
+        names = [d.name for d in bjt] + [d.name for d in res]
+        report("Assembling results", 0, 1)
+        violations = assemble_violations(parts, names, n_bjt, episodes)
+        # Names need not be unique, so rows are counted per stored device slice.
+        counts = np.fromiter((len(p["dev"]) for p in parts), dtype=np.int64, count=len(parts))
+        self.summary = device_summary(self._peaks, self._limits, counts, names, n_bjt)
+        return violations, bjt, res, time_col
+
+    def _store(self, blocks: List[CheckBlock], build, t: np.ndarray, ids: Sequence[int]) -> None:
+        """Build the block's records and split them (sorted by device) into per-device slices."""
+        summary = summary_part(blocks)
+        self._peaks[summary["dev"]] = summary["peaks"]
+        self._limits[summary["dev"]] = summary["limits"]
+        parts = build(blocks, t)
+        lo = np.searchsorted(parts["dev"], ids, side="left")
+        hi = np.searchsorted(parts["dev"], ids, side="right")
+        for dev, a, b in zip(ids, lo, hi):
+            self._results[dev] = {key: val[a:b] for key, val in parts.items()}
+
+    def _block_signals(self, data: ColumnData, ids: List[int], devs: List[BJTDevice], n: int) -> Dict[str, np.ndarray]:
+        """Derived BJT signals for `ids`, served from the LRU cache where possible."""
+        cached = {i: self._signals[i] for i in ids if i in self._signals}
+        for i in cached:
+            self._signals.move_to_end(i)
+        missing = [k for k, i in enumerate(ids) if i not in cached]
+        fresh = bjt_signals(data, [devs[k] for k in missing], n) if missing else {}
+        fresh_rows = {ids[k]: {param: arr[row] for param, arr in fresh.items()} for row, k in enumerate(missing)}
+
+        if cached:
+            rows = [cached[i] if i in cached else fresh_rows[i] for i in ids]
+            signals = {param: np.vstack([r[param] for r in rows]) for param in rows[0]}
+        else:
+            signals = fresh
+        for i, row in fresh_rows.items():
+            self._remember(i, row)
+        return signals
+
+    def _remember(self, dev: int, signals: Dict[str, np.ndarray]) -> None:
+        self._signals[dev] = signals
+        self._signal_bytes += sum(arr.nbytes for arr in signals.values())
+        while self._signal_bytes > self.signal_cache_bytes and self._signals:
+            _, old = self._signals.popitem(last=False)
+            self._signal_bytes -= sum(arr.nbytes for arr in old.values())
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
+
+# ((pulse width in s, limit), ...) sorted by width, see core.pulse
+PulseTable = Tuple[Tuple[float, float], ...]
+# ((VCE, IC), ...) breakpoints in increasing VCE, see core.soa
+SoaBoundary = Tuple[Tuple[float, float], ...]
+# Segment shapes between SOA breakpoints: straight on a log-log chart or on linear axes.
+SOA_SCALES = ("loglog", "linear")
 
 
 @dataclass(frozen=True)
@@ -14,6 +21,30 @@ class BJTLimits:
     MAX_IE: Optional[float] = None
     MAX_POWER: Optional[float] = None
     MAX_TEMP: Optional[float] = None
+    # Duration-dependent limits; the MAX_* value of the same quantity is the DC limit.
+    PULSE_VCE: Optional[PulseTable] = None
+    PULSE_IC: Optional[PulseTable] = None
+    PULSE_POWER: Optional[PulseTable] = None
+    # Foster thermal network (K/W and J/K per branch), used for TEMP when no `.t` column is exported.
+    THERMAL_R: Optional[Tuple[float, ...]] = None
+    THERMAL_C: Optional[Tuple[float, ...]] = None
+    T_AMBIENT: float = 25.0
+    # Piecewise VCE-IC boundary with "loglog" or "linear" segments.
+    SOA_BOUNDARY: Optional[SoaBoundary] = None
+    SOA_SCALE: str = "loglog"
+
+    def __post_init__(self) -> None:
+        # Tables may arrive as JSON lists; keep them hashable (limits are used as cache keys).
+        for key in ("PULSE_VCE", "PULSE_IC", "PULSE_POWER"):
+            table = getattr(self, key)
+            if table is not None:
+                object.__setattr__(self, key, tuple(sorted((float(w), float(v)) for w, v in table)))
+        for key in ("THERMAL_R", "THERMAL_C"):
+            values = getattr(self, key)
+            if values is not None:
+                object.__setattr__(self, key, tuple(float(v) for v in values))
+        if self.SOA_BOUNDARY is not None:
+            object.__setattr__(self, "SOA_BOUNDARY", tuple((float(v), float(i)) for v, i in self.SOA_BOUNDARY))
 
 
 @dataclass(frozen=True)
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
-import re
-from typing import Dict, List, Tuple
+import csv
+import os
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
-from .models import BJTDevice, BJTLimits, ResistorDevice, ResistorLimits
+from .catalog import DeviceCatalog, required_columns, short_name
+from .config import bjt_limits, resistor_limits
+from .dataset import is_dataset, load_dataset_columns, read_dataset_header
+from .models import BJTDevice, ResistorDevice
+
+# progress(stage, done, total): called by long-running loaders/analyzers. It may
+# raise to abort the operation (the GUI uses this for cancellation).
+ProgressCallback = Callable[[str, int, int], None]
+PROGRESS_CHUNK_ROWS = 100_000
 
 
 def short_name_from_column(col: str) -> str:
@@ -13,13 +24,25 @@ def short_name_from_column(col: str) -> str:
     Extract a short device name from ADS-like hierarchical column.
     Example: 'Testbench.Q1.Q1.c' -> 'Q1', 'R2.R_contact.i' -> 'R2'
     """
-    parts = col.split(".")
-    for token in reversed(parts):
-        if re.match(r"^[QR]\w*", token):
-            return token
-    if len(parts) >= 2:
-        return parts[-2]
-    return col
+    return short_name(col)
+
+
+def apply_limits(
+    bjt_devices: List[BJTDevice], res_devices: List[ResistorDevice], defaults: Dict, overrides: Dict
+) -> Tuple[List[BJTDevice], List[ResistorDevice]]:
+    """Re-merge limits for already discovered devices without touching the headers."""
+    return (
+        [replace(dev, limits=bjt_limits(dev.name, defaults, overrides)) for dev in bjt_devices],
+        [replace(dev, limits=resistor_limits(dev.name, defaults, overrides)) for dev in res_devices],
+    )
+
+
+def read_csv_header(path: str) -> List[str]:
+    """Read only the header line of a CSV file (or the manifest of a binary dataset, see core.dataset)."""
+    if is_dataset(path):
+        return read_dataset_header(path)
+    with open(path, "r", newline="", encoding="utf-8-sig") as f:
+        return next(csv.reader(f), [])
 
 
 def scan_csv_columns(df: pd.DataFrame, defaults: Dict, overrides: Dict) -> Tuple[List[BJTDevice], List[ResistorDevice], str]:
@@ -27,67 +50,47 @@ def scan_csv_columns(df: pd.DataFrame, defaults: Dict, overrides: Dict) -> Tuple
     Auto-discover BJT and resistor devices based on column suffix rules.
     Returns (bjt_devices, resistor_devices, time_col_name).
     """
-    columns = list(df.columns)
-
-    time_col = None
-    for c in columns:
-        if c.lower() == "time":
-            time_col = c
-            break
-    if not time_col:
-        raise ValueError("CSV 中缺少 'time' 列")
-
-    # Map: base_key -> suffix -> column_name
-    bjt_groups: Dict[str, Dict[str, str]] = {}
-    for col in columns:
-        if col == time_col:
-            continue
-        m = re.search(r"\.(c|b|e|bi|ci|ei|t)$", col)
-        if m:
-            suf = m.group(1)
-            base_key = col[: -len(m.group(0))]  # strip ".c" etc.
-            grp = bjt_groups.setdefault(base_key, {})
-            grp[suf] = col
-
-    bjt_devices: List[BJTDevice] = []
-    for base_key, grp in bjt_groups.items():
-        if not all(k in grp for k in ("c", "b", "e")):
-            continue
-
-        name = short_name_from_column(base_key)
-        merged = {**defaults.get("BJT", {}), **overrides.get(name, {})}
-        limits = BJTLimits(
-            MAX_VCE=merged.get("MAX_VCE", float("inf")),
-            MAX_VBE=merged.get("MAX_VBE", float("inf")),
-            MAX_VBC=merged.get("MAX_VBC"),
-            MAX_IB=merged.get("MAX_IB"),
-            MAX_IC=merged.get("MAX_IC"),
-            MAX_IE=merged.get("MAX_IE"),
-            MAX_POWER=merged.get("MAX_POWER"),
-            MAX_TEMP=merged.get("MAX_TEMP"),
-        )
-
-        bjt_devices.append(
-            BJTDevice(
-                name=name,
-                col_vc=grp["c"],
-                col_vb=grp["b"],
-                col_ve=grp["e"],
-                col_ib=grp.get("bi"),
-                col_ic=grp.get("ci"),
-                col_ie=grp.get("ei"),
-                col_temp=grp.get("t"),
-                limits=limits,
-            )
-        )
-
-    resistor_devices: List[ResistorDevice] = []
-    for col in columns:
-        if col.endswith(".R_contact.i"):
-            name = short_name_from_column(col)
-            merged = {**defaults.get("RESISTOR", {}), **overrides.get(name, {})}
-            limits = ResistorLimits(MAX_RES_CURRENT=merged.get("MAX_RES_CURRENT", float("inf")))
-            resistor_devices.append(ResistorDevice(name=name, col_ir=col, limits=limits))
-
-    return bjt_devices, resistor_devices, time_col
+    return scan_columns(list(df.columns), defaults, overrides)
+
+
+def scan_csv_header(path: str, defaults: Dict, overrides: Dict) -> Tuple[List[BJTDevice], List[ResistorDevice], str]:
+    """Same as scan_csv_columns, but reads nothing beyond the CSV header line."""
+    return scan_columns(read_csv_header(path), defaults, overrides)
+
+
+def scan_columns(columns: Sequence[str], defaults: Dict, overrides: Dict) -> Tuple[List[BJTDevice], List[ResistorDevice], str]:
+    """Device discovery on a plain list of column names."""
+    catalog = DeviceCatalog.from_columns(columns).with_limits(defaults, overrides)
+    return catalog.bjts, catalog.resistors, catalog.time_col
+
+
+def load_csv_columns(
+    path: str, columns: Optional[Sequence[str]] = None, progress: Optional[ProgressCallback] = None, **kwargs
+) -> pd.DataFrame:
+    """
+    Read the CSV as float64, restricted to `columns` when given. Unused ADS
+    columns (.cx/.bx, source currents, tranorder, the index column) are
+    skipped by the parser instead of being converted and thrown away.
+
+    With `progress`, the file is read in row chunks and progress("Reading CSV",
+    bytes_read, file_size) is called after each one.
+
+    Binary datasets (core.dataset) are memory-mapped instead of parsed.
+    """
+    if is_dataset(path):
+        return load_dataset_columns(path, columns)
+    if columns is not None:
+        cols = list(columns)
+        kwargs = {"usecols": cols, "dtype": {c: np.float64 for c in cols}, **kwargs}
+    if progress is None:
+        return pd.read_csv(path, **kwargs)
 
+    total = os.path.getsize(path)
+    chunks: List[pd.DataFrame] = []
+    with open(path, "rb") as f, pd.read_csv(f, chunksize=PROGRESS_CHUNK_ROWS, **kwargs) as reader:
+        for chunk in reader:
+            chunks.append(chunk)
+            progress("Reading CSV", f.tell(), total)
+    if not chunks:
+        return pd.read_csv(path, **kwargs)
+    return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
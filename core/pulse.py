@@ -0,0 +1,138 @@
+"""
+Pulse-duration SOA limits.
+
+Datasheet SOA curves allow more than the DC limit for short pulses. A limit
+table of (pulse width, limit) rows is evaluated over ADS's non-uniform time
+axis in linear time per device, whatever the widths:
+
+- amplitude tables (VCE, IC) bound how long |x| may stay above a level.
+  The time spent above a level is measured from the start of the current
+  run of samples above it (a running maximum over run starts), so no window
+  is ever scanned;
+- power tables bound the mean power over any trailing window of a width,
+  taken as a difference of the cumulative (trapezoidal) energy. Power
+  before the first sample counts as zero, so a pulse is judged the same
+  wherever it falls in the run.
+
+In both cases the DC limit (MAX_*) applies to excursions that last longer
+than the longest tabulated pulse.
+"""
+
+from __future__ import annotations
+
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import PulseTable
+
+
+class PulseRule(NamedTuple):
+    level: float
+    # > 0: the mean over a trailing window of this width must stay below `level`;
+    # otherwise |x| must not stay above `level` for longer than `after` seconds.
+    window: float
+    after: float
+
+
+def pulse_rules(table: PulseTable, dc: Optional[float], mean: bool) -> List[PulseRule]:
+    """
+    Rules of one limit table. An amplitude table allows |x| up to the limit
+    of the shortest pulse at any time and up to the limit of row k + 1 for
+    as long as the width of row k; a power table bounds the window mean of
+    every row. A finite `dc` limit is added for excursions longer than the
+    longest width.
+    """
+    if mean:
+        rules = [PulseRule(level, width, 0.0) for width, level in table]
+    else:
+        afters = [-np.inf] + [width for width, _ in table[:-1]]
+        rules = [PulseRule(level, 0.0, after) for after, (_, level) in zip(afters, table)]
+    if dc is not None and np.isfinite(dc):
+        rules.append(PulseRule(dc, 0.0, table[-1][0]))
+    return rules
+
+
+def table_horizon(tables: Sequence[Optional[PulseTable]]) -> float:
+    """Longest pulse width in `tables`: how much history a chunk needs to be evaluated exactly."""
+    return max((table[-1][0] for table in tables if table), default=0.0)
+
+
+def time_above(t: np.ndarray, above: np.ndarray) -> np.ndarray:
+    """Per sample of a (rows, n) mask, the time since the start of its current run (only meaningful where set)."""
+    n = above.shape[1]
+    first = above.copy()
+    first[:, 1:] &= ~above[:, :-1]
+    start = first * np.arange(n, dtype=np.int32 if n < 2**31 else np.int64)
+    np.maximum.accumulate(start, axis=1, out=start)
+    return t - np.take(t, start)
+
+
+def cumulative_energy(t: np.ndarray, power: np.ndarray) -> np.ndarray:
+    """Trapezoidal running integral of (rows, n) `power` over `t`, starting at 0."""
+    energy = np.zeros_like(power, dtype=float)
+    if power.shape[1] > 1:
+        np.cumsum(0.5 * (power[:, 1:] + power[:, :-1]) * np.diff(t), axis=1, out=energy[:, 1:])
+    return energy
+
+
+def window_mean(t: np.ndarray, energy: np.ndarray, width: float, power: np.ndarray) -> np.ndarray:
+    """
+    Mean power over the window (t - width, t] for every sample, from the
+    cumulative energy of (rows, n) `power`. Power before t[0] is zero, so
+    every window is divided by its full width; with fewer than two samples
+    there is no energy and `power` itself is returned.
+    """
+    n = len(t)
+    if n < 2:
+        return np.array(power, dtype=float)
+    start = np.maximum(t - width, t[0])
+    # One search for all rows; the energy at the window start is interpolated.
+    j = np.clip(np.searchsorted(t, start, side="right") - 1, 0, n - 2)
+    dt = t[j + 1] - t[j]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frac = np.clip(np.where(dt > 0, (start - t[j]) / dt, 0.0), 0.0, 1.0)
+    at_start = np.take(energy, j, axis=1)
+    step = np.take(energy, j + 1, axis=1)
+    step -= at_start
+    step *= frac
+    at_start += step
+    mean = energy - at_start
+    mean /= width
+    return mean
+
+
+def evaluate_pulse(
+    t: np.ndarray, values: np.ndarray, magnitude: np.ndarray, rules: Sequence[PulseRule]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Check (rows, n) `values` against the rules of one table.
+
+    Every sample is attributed to the applicable rule with the largest
+    value / level ratio. Returns (reported value, limit, ratio): the signal
+    value, or the window mean for power rules; the level of that rule (NaN
+    where no rule applies); and the ratio, > 1 where the sample violates.
+    """
+    ratio = np.full(values.shape, -np.inf)
+    limit = np.full(values.shape, np.nan)
+    reported = np.array(values, dtype=float)
+    energy = cumulative_energy(t, magnitude) if any(rule.window > 0 for rule in rules) else None
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for rule in rules:
+            if rule.window > 0:
+                source = window_mean(t, energy, rule.window, magnitude)
+                r = source / rule.level
+            else:
+                source = values
+                r = magnitude / rule.level
+                if np.isfinite(rule.after):
+                    above = r > 1
+                    if not above.any():
+                        continue
+                    above &= time_above(t, above) > rule.after
+                    np.copyto(r, -np.inf, where=~above)
+            better = r > ratio
+            np.copyto(ratio, r, where=better)
+            np.copyto(limit, rule.level, where=better)
+            np.copyto(reported, source, where=better)
+    return reported, limit, ratio
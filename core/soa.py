@@ -0,0 +1,87 @@
+"""
+Piecewise SOA boundary in the VCE-IC plane.
+
+A boundary is a list of (VCE, IC) breakpoints in increasing VCE, as read off
+a datasheet SOA chart: the current limit, the power-limited slope, the
+second-breakdown slope and the voltage limit. IC is allowed up to the first
+breakpoint's current below the first VCE, the segments in between are
+straight lines in either log-log ("loglog", the usual chart) or linear
+coordinates, and nothing is allowed beyond the last VCE. The region is
+symmetric in the sign of VCE and IC.
+
+Distances are measured in the boundary's own coordinates: decades in
+log-log mode, fractions of the largest breakpoint VCE / IC in linear mode.
+They are signed, positive outside the safe region.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from .models import SoaBoundary
+
+# |VCE| and |IC| below this are treated as this in log-log mode (log10(0) is -inf).
+_LOG_FLOOR = 1e-30
+# Points per segment when drawing log-log segments on linear axes.
+_CURVE_POINTS = 32
+
+
+def _coords(points: SoaBoundary, scale: str) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """Breakpoint coordinates in the boundary space plus the (VCE, IC) normalization of linear mode."""
+    vce, ic = np.asarray(points, dtype=float).T
+    if scale == "loglog":
+        return np.log10(vce), np.log10(ic), 1.0, 1.0
+    return vce / vce.max(), ic / ic.max(), float(vce.max()), float(ic.max())
+
+
+def boundary_distance(
+    vce: np.ndarray, ic: np.ndarray, points: SoaBoundary, scale: str = "loglog"
+) -> np.ndarray:
+    """
+    Signed distance of every (|VCE|, |IC|) sample (any array shape) to the
+    boundary, positive outside. The inside test is one interpolation of
+    the boundary at each sample's VCE; the distance is the nearest of the
+    boundary's segments, broadcast over a segment axis for all samples.
+    """
+    us, vs, vce_ref, ic_ref = _coords(points, scale)
+    if scale == "loglog":
+        u = np.log10(np.maximum(np.abs(vce), _LOG_FLOOR))
+        v = np.log10(np.maximum(np.abs(ic), _LOG_FLOOR))
+    else:
+        u = np.abs(vce) / vce_ref
+        v = np.abs(ic) / ic_ref
+    inside = (u <= us[-1]) & (v <= np.interp(u, us, vs))
+
+    # Flat current limit left of the first breakpoint and the voltage limit below the last one.
+    dist = np.hypot(np.maximum(u - us[0], 0.0), v - vs[0])
+    np.minimum(dist, np.hypot(u - us[-1], np.maximum(v - vs[-1], 0.0)), out=dist)
+    # All segments at once along a leading (segments, 1, ...) axis.
+    axis = (-1,) + (1,) * np.ndim(u)
+    u0, v0 = us[:-1].reshape(axis), vs[:-1].reshape(axis)
+    du, dv = np.diff(us).reshape(axis), np.diff(vs).reshape(axis)
+    s = np.clip(((u - u0) * du + (v - v0) * dv) / (du * du + dv * dv), 0.0, 1.0)
+    np.minimum(dist, np.hypot(u - (u0 + s * du), v - (v0 + s * dv)).min(axis=0), out=dist)
+    # NaN samples (no IC column) stay NaN.
+    return np.where(inside, -dist, dist)
+
+
+def boundary_outline(points: SoaBoundary, scale: str = "loglog") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed (VCE, IC) outline of the safe region in all four quadrants for
+    drawing on linear axes; log-log segments are sampled as curves.
+    """
+    vce, ic = np.asarray(points, dtype=float).T
+    if scale == "loglog":
+        k = np.linspace(0.0, 1.0, _CURVE_POINTS)[:, None]
+        xs = (vce[:-1] ** (1 - k) * vce[1:] ** k).T.ravel()
+        ys = (ic[:-1] ** (1 - k) * ic[1:] ** k).T.ravel()
+    else:
+        xs, ys = vce, ic
+    # First quadrant from the IC axis to the VCE axis, then mirrored.
+    x = np.concatenate(([0.0], xs, [vce[-1]]))
+    y = np.concatenate(([ic[0]], ys, [0.0]))
+    qx = np.concatenate((x, x[::-1], -x, -x[::-1]))
+    qy = np.concatenate((y, -y[::-1], -y, y[::-1]))
+    return qx, qy
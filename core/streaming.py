@@ -0,0 +1,136 @@
+"""Chunked (bounded-memory) analysis of large ADS CSV exports."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .analysis import _run_peaks, analysis_parts, assemble_violations, concat_parts
+from .dataset import is_dataset, load_dataset_columns
+from .models import BJTDevice, ResistorDevice
+from .parser import ProgressCallback, required_columns, scan_csv_header
+from .pulse import table_horizon
+from .thermal import ThermalState
+
+DEFAULT_CHUNK_ROWS = 200_000
+
+
+def iter_csv_chunks(
+    path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS, columns: Optional[Sequence[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """Yield the CSV in row chunks of at most `chunk_rows` rows, optionally restricted to `columns` (as float64)."""
+    if is_dataset(path):
+        # Slices of the memory maps: only the chunk being analyzed is paged in.
+        df = load_dataset_columns(path, columns)
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start : start + chunk_rows].reset_index(drop=True)
+        return
+    kwargs = {}
+    if columns is not None:
+        kwargs = {"usecols": list(columns), "dtype": {c: np.float64 for c in columns}}
+    with pd.read_csv(path, chunksize=chunk_rows, **kwargs) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+def merge_episode_parts(parts: List[dict]) -> dict:
+    """
+    Join excursions that were split by chunk boundaries.
+
+    A run from one chunk continues into the next when it belongs to the same
+    device and parameter and starts at the previous run's last sample (each
+    chunk's episodes overlap the previous chunk by one sample, see
+    analysis_parts). Merged runs keep the first start and entry, the last
+    end and exit, the first occurrence of the largest |peak| and the sum of
+    the overshoot integrals, which meet at the shared sample.
+    """
+    merged = concat_parts(parts)
+    order = np.lexsort((merged["start"], merged["param"], merged["dev"]))
+    merged = {key: val[order] for key, val in merged.items()}
+
+    dev, param, start, stop = merged["dev"], merged["param"], merged["start"], merged["stop"]
+    continues = np.zeros(len(dev), dtype=bool)
+    continues[1:] = (dev[1:] == dev[:-1]) & (param[1:] == param[:-1]) & (start[1:] == stop[:-1] - 1)
+    if not continues.any():
+        return merged
+
+    first = np.flatnonzero(~continues)
+    last = np.concatenate((first[1:], [len(dev)])) - 1
+    best = _run_peaks(np.abs(merged["Peak Value"]), first, last + 1)
+
+    out = {key: merged[key][first] for key in ("dev", "param", "start", "Start Time", "Entry Time", "Limit")}
+    out["stop"] = stop[last]
+    out["End Time"] = merged["End Time"][last]
+    out["Exit Time"] = merged["Exit Time"][last]
+    out["Duration"] = out["End Time"] - out["Start Time"]
+    out["Time Above"] = out["Exit Time"] - out["Entry Time"]
+    out["peak"] = merged["peak"][best]
+    out["Peak Value"] = merged["Peak Value"][best]
+    out["Peak Time"] = merged["Peak Time"][best]
+    out["Overshoot Integral"] = np.add.reduceat(merged["Overshoot Integral"], first)
+    # Consecutive pieces share one sample.
+    out["Samples"] = np.add.reduceat(merged["Samples"], first) - (last - first)
+    return {key: out[key] for key in merged}
+
+
+def _merge_sample_parts(parts: List[dict]) -> dict:
+    merged = concat_parts(parts)
+    order = np.lexsort((merged["index"], merged["param"], merged["dev"]))
+    return {key: val[order] for key, val in merged.items()}
+
+
+def analyze_csv_chunked(
+    path: str,
+    defaults: Dict,
+    overrides: Dict,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    episodes: bool = False,
+    progress: Optional[ProgressCallback] = None,
+) -> Tuple[pd.DataFrame, List[BJTDevice], List[ResistorDevice], str]:
+    """
+    Analyze a CSV without loading it whole.
+
+    Devices are discovered once from the header, then every row chunk is run
+    through the batched engine. Excursions that straddle chunk boundaries are
+    stitched back together, so the result equals analyze_all on the full file.
+    Each chunk is preceded by the last row of the previous one (for
+    crossing times), or with pulse limit tables by the rows of the last
+    (longest pulse width) of signal before it, and estimated junction
+    temperatures continue from the previous chunk. Peak memory scales with
+    `chunk_rows` plus that history, not with the file size.
+    progress("Analyzing rows", rows done, 0) is reported after every chunk
+    (the row count is not known in advance).
+    Returns (violations_df, bjt_devices, resistor_devices, time_col).
+    """
+    report = progress or (lambda stage, done, total: None)
+    bjt_devices, res_devices, time_col = scan_csv_header(path, defaults, overrides)
+    columns = required_columns(bjt_devices, res_devices, time_col)
+
+    horizon = table_horizon(
+        [table for d in bjt_devices for table in (d.limits.PULSE_VCE, d.limits.PULSE_IC, d.limits.PULSE_POWER)]
+    )
+
+    parts: List[dict] = []
+    offset = 0
+    history: Optional[pd.DataFrame] = None
+    thermal: Dict[int, ThermalState] = {}
+    for chunk in iter_csv_chunks(path, chunk_rows, columns):
+        if chunk.empty:
+            continue
+        lead = 0 if history is None else len(history)
+        data = chunk if history is None else pd.concat([history, chunk], ignore_index=True)
+        chunk_parts = analysis_parts(data, bjt_devices, res_devices, time_col, episodes, offset, lead, thermal)
+        parts.extend(p for p in chunk_parts if len(p["dev"]))
+        offset += len(chunk)
+        report("Analyzing rows", offset, 0)
+        # Keep the last sample at or before t_end - horizon and everything after it (at least the last row).
+        t = data[time_col].to_numpy()
+        history = data.iloc[max(np.searchsorted(t, t[-1] - horizon, side="right") - 1, 0) :]
+
+    if parts:
+        parts = [merge_episode_parts(parts) if episodes else _merge_sample_parts(parts)]
+    names = [d.name for d in bjt_devices] + [d.name for d in res_devices]
+    violations = assemble_violations(parts, names, len(bjt_devices), episodes)
+    return violations, bjt_devices, res_devices, time_col
@@ -0,0 +1,178 @@
+"""
+Multi-corner (PVT sweep) analysis.
+
+A sweep is a set of CSV exports of the same testbench with identical
+headers, one per corner. Device discovery and limit assignment run once on
+the shared header; every run is then loaded and checked (in a process pool
+when there are several CPUs) and the results are merged into one violation
+table with a `Run` column plus a device x run violation-count matrix.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .analysis import _concat_violations, analysis_parts, assemble_violations, empty_violations
+from .dataset import dataset_dir
+from .models import BJTDevice, ResistorDevice
+from .parser import ProgressCallback, load_csv_columns, read_csv_header, required_columns, scan_columns
+
+RUN_COLUMN = "Run"
+
+
+@dataclass
+class SweepResult:
+    runs: List[str]  # run labels, in the order of `paths`
+    paths: List[str]
+    bjt_devices: List[BJTDevice]
+    res_devices: List[ResistorDevice]
+    time_col: str
+    violations: pd.DataFrame  # violation schema with a leading categorical `Run` column
+    counts: np.ndarray  # (n_devices, n_runs) violation rows; BJTs first, then resistors
+    rows: List[int]  # samples per run
+
+    @property
+    def device_names(self) -> List[str]:
+        return [d.name for d in self.bjt_devices] + [d.name for d in self.res_devices]
+
+    def count_matrix(self) -> pd.DataFrame:
+        """Violation rows per device (index) and run (columns)."""
+        return pd.DataFrame(self.counts, index=pd.Index(self.device_names, name="Device Name"), columns=self.runs)
+
+    def pass_fail_matrix(self) -> pd.DataFrame:
+        """Device Name column plus one categorical PASS/FAIL column per run."""
+        data: Dict[str, object] = {"Device Name": self.device_names}
+        for j, run in enumerate(self.runs):
+            data[run] = pd.Categorical.from_codes((self.counts[:, j] > 0).astype(np.int8), categories=["PASS", "FAIL"])
+        return pd.DataFrame(data)
+
+    def failed_runs(self) -> Dict[str, List[str]]:
+        """Runs in which each failing device has violations."""
+        names = self.device_names
+        return {
+            names[i]: [self.runs[j] for j in np.flatnonzero(self.counts[i])]
+            for i in np.flatnonzero(self.counts.any(axis=1))
+        }
+
+
+def run_labels(paths: Sequence[str]) -> List[str]:
+    """
+    Short unique run names: file names without extension, or, when those
+    collide (e.g. runs/ff/tran.csv and runs/ss/tran.csv), the paths relative
+    to their common directory. Binary datasets are named after their directory.
+    """
+    paths = [dataset_dir(p) or p for p in paths]
+    stems = [os.path.splitext(os.path.basename(p))[0] for p in paths]
+    if len(set(stems)) == len(stems):
+        return stems
+    paths = [os.path.abspath(p) for p in paths]
+    root = os.path.commonpath([os.path.dirname(p) for p in paths])
+    return [os.path.splitext(os.path.relpath(p, root))[0].replace(os.sep, "/") for p in paths]
+
+
+def check_schema(paths: Sequence[str]) -> List[str]:
+    """Header shared by all `paths`; raises ValueError naming the first file whose columns differ."""
+    if not paths:
+        raise ValueError("扫描分析至少需要一个 CSV 文件")
+    header = read_csv_header(paths[0])
+    expected = set(header)
+    for path in paths[1:]:
+        columns = read_csv_header(path)
+        if columns == header:
+            continue
+        got = set(columns)
+        missing = [c for c in header if c not in got]
+        extra = [c for c in columns if c not in expected]
+        if not missing and not extra:
+            continue  # same columns in a different order
+        detail = []
+        if missing:
+            detail.append(f"缺少 {len(missing)} 列（如 {next((c for c in missing if c), missing[0])!r}）")
+        if extra:
+            detail.append(f"多出 {len(extra)} 列（如 {next((c for c in extra if c), extra[0])!r}）")
+        raise ValueError(f"{path} 的列与 {paths[0]} 不一致：{'，'.join(detail)}")
+    return header
+
+
+def _run_worker(args: Tuple[str, List[str], List[BJTDevice], List[ResistorDevice], str, bool]) -> Tuple[List[dict], int]:
+    """Load one run's columns and return its record parts plus its sample count."""
+    path, columns, bjt_devices, res_devices, time_col, episodes = args
+    df = load_csv_columns(path, columns)
+    return analysis_parts(df, bjt_devices, res_devices, time_col, episodes), len(df)
+
+
+def analyze_sweep(
+    paths: Sequence[str],
+    defaults: Dict,
+    overrides: Dict,
+    episodes: bool = False,
+    workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> SweepResult:
+    """
+    Check every run of a sweep against the same limits.
+
+    The header is validated across all files (check_schema) and devices are
+    discovered once; each worker only reads the required columns of its run
+    and runs the batched checks. `workers` defaults to the CPU count.
+    progress("Analyzing runs", done, total) is reported as runs finish.
+    """
+    paths = list(dict.fromkeys(paths))
+    report = progress or (lambda stage, done, total: None)
+    report("Checking headers", 0, len(paths))
+    header = check_schema(paths)
+    bjt_devices, res_devices, time_col = scan_columns(header, defaults, overrides)
+    columns = required_columns(bjt_devices, res_devices, time_col)
+
+    jobs = [(path, columns, bjt_devices, res_devices, time_col, episodes) for path in paths]
+    results: List[Optional[Tuple[List[dict], int]]] = [None] * len(jobs)
+    workers = min(workers or os.cpu_count() or 1, max(len(jobs), 1))
+    report("Analyzing runs", 0, len(jobs))
+    if workers <= 1:
+        for i, job in enumerate(jobs):
+            results[i] = _run_worker(job)
+            report("Analyzing runs", i + 1, len(jobs))
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {pool.submit(_run_worker, job): i for i, job in enumerate(jobs)}
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                report("Analyzing runs", done, len(jobs))
+        finally:
+            # Drop queued runs when a run fails or the caller cancels through `progress`.
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    report("Assembling results", 0, 1)
+    names = [d.name for d in bjt_devices] + [d.name for d in res_devices]
+    runs = run_labels(paths)
+    counts = np.zeros((len(names), len(paths)), dtype=np.int64)
+    frames: List[pd.DataFrame] = []
+    run_codes: List[np.ndarray] = []
+    for j, (parts, _) in enumerate(results):  # type: ignore[misc]
+        for p in parts:
+            counts[:, j] += np.bincount(p["dev"], minlength=len(names))
+        frame = assemble_violations(parts, names, len(bjt_devices), episodes)
+        if len(frame):
+            frames.append(frame)
+            run_codes.append(np.full(len(frame), j, dtype=np.int32))
+
+    violations = _concat_violations(frames) if frames else empty_violations(episodes)
+    codes = np.concatenate(run_codes) if run_codes else np.zeros(0, dtype=np.int32)
+    violations.insert(0, RUN_COLUMN, pd.Categorical.from_codes(codes, categories=runs))
+    return SweepResult(
+        runs=runs,
+        paths=paths,
+        bjt_devices=bjt_devices,
+        res_devices=res_devices,
+        time_col=time_col,
+        violations=violations,
+        counts=counts,
+        rows=[n for _, n in results],  # type: ignore[misc]
+    )
@@ -0,0 +1,233 @@
+"""
+Persistent plot views for the device tabs.
+
+Each view creates its axes, traces, limit lines and labels once per canvas.
+Showing another device only replaces artist data, limit positions and
+labels, then rescales; the figure is never cleared or re-laid out.
+
+Views take their data through a `load()` callable rather than arrays, so a
+hidden view can release() its full-resolution waveforms and load them again
+when it is zoomed next (see gui.mpl_canvas).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+from gui.mpl_canvas import DataSource, DecimatedLine, DecimatedScatter, deferred
+
+_EMPTY = np.empty(0)
+_HIDDEN = "_nolegend_"
+
+# (t, one array or None per trace) and (VCE, IC or None, violation marks or None)
+TimeData = Tuple[np.ndarray, Sequence[Optional[np.ndarray]]]
+SoaData = Tuple[np.ndarray, Optional[np.ndarray], Optional[Tuple[np.ndarray, np.ndarray]]]
+
+
+def _enabled(limit: Optional[float]) -> bool:
+    return bool(limit) and math.isfinite(limit)
+
+
+class LimitLines:
+    """Dashed horizontal limit line(s) at +limit (and -limit when `signed`), hidden while disabled."""
+
+    def __init__(self, ax: Axes, color: str, signed: bool = True) -> None:
+        self.upper = ax.axhline(0.0, color=color, linestyle="--", linewidth=1.5, visible=False, label=_HIDDEN)
+        self.lower = ax.axhline(0.0, color=color, linestyle="--", linewidth=1.5, visible=False) if signed else None
+
+    def set_limit(self, limit: Optional[float], label: str = "") -> None:
+        shown = _enabled(limit)
+        value = float(limit) if shown else 0.0
+        self.upper.set_ydata([value, value])
+        self.upper.set_visible(shown)
+        self.upper.set_label(label if shown else _HIDDEN)
+        if self.lower is not None:
+            self.lower.set_ydata([-value, -value])
+            self.lower.set_visible(shown)
+
+
+class _DevicePlot:
+    def __init__(self, fig: Figure) -> None:
+        self.fig = fig
+        self.ax = fig.add_subplot(111)
+        self.ax.grid(True, alpha=0.3)
+        self._laid_out = False
+
+    def _finish(self, scatters: Sequence[DecimatedScatter] = ()) -> None:
+        """Rescale to the new data, refresh the legend and lay the figure out once."""
+        ax = self.ax
+        ax.relim(visible_only=True)
+        # relim() ignores collections, so scatter extents are added explicitly.
+        for scatter in scatters:
+            corners = scatter.extent()
+            if corners is not None:
+                ax.update_datalim(corners)
+        ax.autoscale_view()
+        ax.legend()
+        if not self._laid_out:
+            self.fig.tight_layout()
+            self._laid_out = True
+
+
+class TimePlot(_DevicePlot):
+    """Waveforms over time plus limit lines, e.g. VCE/VBE with their limits."""
+
+    def __init__(
+        self,
+        fig: Figure,
+        ylabel: str,
+        traces: Sequence[Tuple[str, float]],
+        limits: Sequence[Tuple[str, bool]],
+    ) -> None:
+        super().__init__(fig)
+        self.ax.set_xlabel("Time")
+        self.ax.set_ylabel(ylabel)
+        self.traces = [
+            (label, DecimatedLine(self.ax, _EMPTY, _EMPTY, label=label, linewidth=width)) for label, width in traces
+        ]
+        self.limits = [LimitLines(self.ax, color, signed) for color, signed in limits]
+
+    def update(
+        self,
+        title: str,
+        load: Callable[[], TimeData],
+        limits: Sequence[Tuple[Optional[float], str]],
+    ) -> None:
+        """
+        `load()` returns (t, ys) with `ys` pairing with the traces (None
+        hides one); `limits` pairs with the limit lines as (value, label).
+        """
+        self.ax.set_title(title)
+        t, ys = load()
+        with deferred([trace for _, trace in self.traces]):
+            for k, ((label, trace), y) in enumerate(zip(self.traces, ys)):
+                shown = y is not None and len(y) > 0
+                # Lines are decimated right away: relim() reads the line data.
+                if shown:
+                    trace.set_data(t, y, _trace_source(load, k))
+                else:
+                    trace.set_data(_EMPTY, _EMPTY)
+                trace.line.set_visible(shown)
+                trace.line.set_label(label if shown else _HIDDEN)
+            for lines, (value, label) in zip(self.limits, limits):
+                lines.set_limit(value, label)
+            self._finish()
+
+    def release(self) -> None:
+        for _, trace in self.traces:
+            trace.release()
+
+
+def _trace_source(load: Callable[[], TimeData], k: int) -> DataSource:
+    def source() -> Tuple[np.ndarray, np.ndarray]:
+        t, ys = load()
+        return t, ys[k]
+
+    return source
+
+
+class SoaPlot(_DevicePlot):
+    """VCE-IC trajectory with violation markers, the SOA rectangle and the piecewise SOA boundary."""
+
+    DATA_STYLE = {"sizes": [28], "color": "tab:blue", "alpha": 0.75}
+    # Without an IC column VCE is drawn against the sample index instead.
+    INDEX_STYLE = {"sizes": [5], "color": "blue", "alpha": 0.6}
+
+    def __init__(self, fig: Figure) -> None:
+        super().__init__(fig)
+        self.ax.set_xlabel("VCE (V)")
+        self.ax.margins(x=0.08, y=0.10)
+        self.data = DecimatedScatter(self.ax, _EMPTY, _EMPTY, s=28, c="tab:blue", alpha=0.75, label="Data", zorder=3)
+        self.marks = DecimatedScatter(
+            self.ax, _EMPTY, _EMPTY, s=60, c="red", marker="x", label="Violations", zorder=5
+        )
+        (self.rect,) = self.ax.plot([], [], "r--", linewidth=2, label="SOA limits")
+        (self.boundary,) = self.ax.plot([], [], color="darkorange", linewidth=2, label="SOA boundary")
+
+    def update(
+        self,
+        title: str,
+        load: Callable[[], SoaData],
+        max_vce: Optional[float],
+        max_ic: Optional[float],
+        boundary: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> None:
+        """
+        `load()` returns (vce, ic, marks), with violation `marks` as (VCE, IC)
+        arrays; `boundary` is the closed (VCE, IC) outline of
+        core.soa.boundary_outline, or None to hide it.
+        """
+        with deferred((self.data, self.marks)):
+            self._set_data(title, load, max_vce, max_ic, boundary)
+
+    def release(self) -> None:
+        self.data.release()
+        self.marks.release()
+
+    def _set_data(self, title, load, max_vce, max_ic, boundary) -> None:
+        self.ax.set_title(title)
+        vce, ic, marks = load()
+        self.data.set_data(*_soa_points(vce, ic), lambda: _soa_points(*load()[:2]))
+        if ic is not None and len(ic) > 0:
+            self.data.collection.set(**self.DATA_STYLE, label="Data")
+            self.ax.set_ylabel("IC (A)")
+        else:
+            self.data.collection.set(**self.INDEX_STYLE, label="VCE only (no IC column)")
+            self.ax.set_ylabel("Index")
+            marks = None
+
+        has_marks = marks is not None and len(marks[0]) > 0
+        if has_marks:
+            self.marks.set_data(*marks, lambda: load()[2])
+        else:
+            self.marks.set_data(_EMPTY, _EMPTY)
+        self.marks.collection.set_visible(has_marks)
+        self.marks.collection.set_label("Violations" if has_marks else _HIDDEN)
+
+        has_rect = _enabled(max_vce) and _enabled(max_ic)
+        if has_rect:
+            self.rect.set_data([-max_vce, max_vce, max_vce, -max_vce, -max_vce], [-max_ic, -max_ic, max_ic, max_ic, -max_ic])
+        self.rect.set_visible(has_rect)
+        self.rect.set_label("SOA limits" if has_rect else _HIDDEN)
+
+        self.boundary.set_data(*(boundary if boundary is not None else (_EMPTY, _EMPTY)))
+        self.boundary.set_visible(boundary is not None)
+        self.boundary.set_label("SOA boundary" if boundary is not None else _HIDDEN)
+        self._finish((self.data, self.marks) if has_marks else (self.data,))
+
+
+def _soa_points(vce: np.ndarray, ic: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Scatter coordinates: (VCE, IC), or VCE against the sample index without IC."""
+    if ic is not None and len(ic) > 0:
+        return vce, ic
+    return vce, np.arange(len(vce))
+
+
+# ---------------- Views per tab ----------------
+def soa_plot(fig: Figure) -> SoaPlot:
+    return SoaPlot(fig)
+
+
+def voltage_plot(fig: Figure) -> TimePlot:
+    return TimePlot(fig, "V (V)", [("VCE", 1.8), ("VBE", 1.8)], [("r", True), ("g", True)])
+
+
+def current_plot(fig: Figure) -> TimePlot:
+    return TimePlot(fig, "I (A)", [("IC", 1.8), ("IB", 1.8)], [("r", True), ("g", True)])
+
+
+def power_plot(fig: Figure) -> TimePlot:
+    return TimePlot(fig, "Power (W)", [("Power (W)", 1.8)], [("r", False)])
+
+
+def temperature_plot(fig: Figure) -> TimePlot:
+    return TimePlot(fig, "Temp (°C)", [("Temp (°C)", 1.8)], [("g", False)])
+
+
+def resistor_plot(fig: Figure) -> TimePlot:
+    return TimePlot(fig, "Current (A)", [("IR", 1.5)], [("r", True)])
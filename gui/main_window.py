@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
-import numpy as np
-import pandas as pd
 from PyQt6 import QtCore, QtWidgets
 
-from core.analysis import analyze_all, violated_device_names
+from core.catalog import DeviceCatalog
 from core.config import load_limits
 from core.models import BJTDevice, ResistorDevice
-from core.parser import scan_csv_columns
-from gui.mpl_canvas import MplCanvas
+from gui.plot_stack import PlotStack
+from gui.workers import Worker
+
+# pandas, NumPy, Matplotlib and the modules built on them are imported on
+# first use (or by preload_modules() once the window is up), not at startup.
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    from matplotlib.figure import Figure
+
+    from core.analysis import ViolationIndex
+    from core.cache import DataCache
+    from core.incremental import IncrementalAnalyzer
+    from core.sweep import SweepResult
+    from gui.device_plots import SoaPlot, TimePlot
+    from gui.violation_model import ViolationTableModel
+
+# Imported in the background by preload_modules(), heaviest first.
+PRELOAD_MODULES = ("pandas", "core.incremental", "core.cache", "core.sweep", "gui.violation_model", "gui.mpl_canvas")
 
 
 @dataclass
@@ -23,8 +39,58 @@ class AppState:
     res_devices: List[ResistorDevice] = None  # type: ignore[assignment]
     time_col: str = "time"
     violations_df: Optional[pd.DataFrame] = None
+    violation_index: Optional[ViolationIndex] = None
     limits_path: Optional[str] = None
     csv_path: Optional[str] = None
+    catalog: Optional[DeviceCatalog] = None
+    # Per-device peaks, worst margin and violation count (see core.analysis.device_summary); None for sweeps.
+    device_summary: Optional[pd.DataFrame] = None
+    # Multi-corner results; while set, the table and tree show all runs and no single-run waveforms are loaded.
+    sweep: Optional[SweepResult] = None
+
+
+# Binary datasets (core.dataset) are opened through their manifest file.
+DATA_FILE_FILTER = "CSV Files (*.csv);;Binary Datasets (manifest.json);;All Files (*)"
+
+# Device tree columns after Device/Status: (header, summary column, format).
+TREE_SUMMARY_COLUMNS = [
+    ("Violations", "Violations", "{:d}"),
+    ("Worst Margin", "Worst Margin", "{:+.1%}"),
+    ("Worst Param", "Worst Parameter", "{}"),
+    ("|VCE| max", "Peak |VCE|", "{:.4g}"),
+    ("|VBE| max", "Peak |VBE|", "{:.4g}"),
+    ("|IC| max", "Peak |IC|", "{:.4g}"),
+    ("P max", "Peak Power", "{:.4g}"),
+    ("T max", "Max Temp", "{:.4g}"),
+    ("SOA dist", "SOA Distance", "{:+.3g}"),
+    ("|IR| max", "Peak |IR|", "{:.4g}"),
+]
+
+
+def _plot_view(name: str) -> Callable[[Figure], object]:
+    """Factory for the view `name` of gui.device_plots, imported when its first canvas is created."""
+
+    def create(fig: Figure) -> object:
+        from gui import device_plots
+
+        return getattr(device_plots, name)(fig)
+
+    return create
+
+
+class DeviceTreeItem(QtWidgets.QTreeWidgetItem):
+    """Tree item that sorts on raw values (numbers, NaN last) instead of the displayed text."""
+
+    def __init__(self, texts: List[str], sort_keys: Optional[List] = None) -> None:
+        super().__init__(texts)
+        self.sort_keys = sort_keys
+
+    def __lt__(self, other: QtWidgets.QTreeWidgetItem) -> bool:
+        col = self.treeWidget().sortColumn() if self.treeWidget() is not None else 0
+        mine, theirs = self.sort_keys, getattr(other, "sort_keys", None)
+        if mine is None or theirs is None or col >= len(mine):
+            return super().__lt__(other)
+        return mine[col] < theirs[col]
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -34,8 +100,53 @@ class MainWindow(QtWidgets.QMainWindow):
         self.resize(1200, 800)
 
         self.state = AppState(defaults={}, overrides={}, bjt_devices=[], res_devices=[])
+        self._data_cache: Optional[DataCache] = None
+        self._analyzer: Optional[IncrementalAnalyzer] = None
+        self.violation_model: Optional[ViolationTableModel] = None
+        self.matrix_model: Optional[ViolationTableModel] = None
+        # One worker thread: jobs share the analyzer and must not overlap.
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._job: Optional[Worker] = None
+        # Devices whose plots the BJT/resistor tabs show, and a counter that invalidates cached plots.
+        self._plot_bjt: Optional[str] = None
+        self._plot_res: Optional[str] = None
+        self._plot_version = 0
+        self._plot_episodes = False
         self._build_ui()
 
+    @property
+    def data_cache(self) -> DataCache:
+        if self._data_cache is None:
+            from core.cache import DataCache
+
+            self._data_cache = DataCache()
+        return self._data_cache
+
+    @property
+    def analyzer(self) -> IncrementalAnalyzer:
+        if self._analyzer is None:
+            from core.incremental import IncrementalAnalyzer
+
+            self._analyzer = IncrementalAnalyzer()
+        return self._analyzer
+
+    def preload_modules(self) -> threading.Thread:
+        """Import the analysis and plotting modules in a background thread so the first load/plot does not wait."""
+
+        def run() -> None:
+            import importlib
+
+            for name in PRELOAD_MODULES:
+                try:
+                    importlib.import_module(name)
+                except Exception:
+                    return
+
+        thread = threading.Thread(target=run, name="preload-modules", daemon=True)
+        thread.start()
+        return thread
+
     def _build_ui(self) -> None:
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
@@ -51,23 +162,52 @@ class MainWindow(QtWidgets.QMainWindow):
         left_layout = QtWidgets.QVBoxLayout(left_widget)
 
         btn_load_csv = QtWidgets.QPushButton("Load CSV Data")
+        btn_load_sweep = QtWidgets.QPushButton("Load Sweep (CSVs)")
+        btn_load_sweep.setToolTip("Analyze several runs with identical headers (e.g. PVT corners) together")
         btn_load_json = QtWidgets.QPushButton("Load Limit Config (JSON)")
         btn_analyze = QtWidgets.QPushButton("Analyze")
         btn_analyze.setEnabled(False)  # Initially disabled until CSV and JSON are loaded
         btn_load_csv.clicked.connect(self.on_load_csv)
+        btn_load_sweep.clicked.connect(self.on_load_sweep)
         btn_load_json.clicked.connect(self.on_load_json)
         btn_analyze.clicked.connect(self.on_analyze)
 
         left_layout.addWidget(btn_load_csv)
+        left_layout.addWidget(btn_load_sweep)
         left_layout.addWidget(btn_load_json)
         left_layout.addWidget(btn_analyze)
         self.btn_analyze = btn_analyze  # Store reference for enabling/disabling
+        self.btn_load_csv = btn_load_csv
+        self.btn_load_sweep = btn_load_sweep
+        self.btn_load_json = btn_load_json
+
+        btn_clear_cache = QtWidgets.QPushButton("Clear Data Cache")
+        btn_clear_cache.setToolTip("Remove cached binary copies of previously loaded CSV files")
+        btn_clear_cache.clicked.connect(self.on_clear_cache)
+        left_layout.addWidget(btn_clear_cache)
+
+        self.chk_episodes = QtWidgets.QCheckBox("Group violations into episodes")
+        self.chk_episodes.setToolTip("Report one row per contiguous excursion instead of one row per sample")
+        left_layout.addWidget(self.chk_episodes)
 
         self.lbl_status = QtWidgets.QLabel("Ready")
         left_layout.addWidget(self.lbl_status)
 
+        progress_layout = QtWidgets.QHBoxLayout()
+        self.progress_bar = QtWidgets.QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.btn_cancel = QtWidgets.QPushButton("Cancel")
+        self.btn_cancel.setVisible(False)
+        self.btn_cancel.clicked.connect(self.on_cancel_job)
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.btn_cancel)
+        left_layout.addLayout(progress_layout)
+
         self.tree_devices = QtWidgets.QTreeWidget()
-        self.tree_devices.setHeaderLabels(["Device", "Status"])
+        self.tree_devices.setHeaderLabels(["Device", "Status"] + [header for header, _, _ in TREE_SUMMARY_COLUMNS])
+        # Click a column header to rank devices, e.g. by worst margin; discovery order until then.
+        self.tree_devices.header().setSortIndicator(-1, QtCore.Qt.SortOrder.AscendingOrder)
+        self.tree_devices.setSortingEnabled(True)
         self.tree_devices.itemSelectionChanged.connect(self.on_device_selected)
         left_layout.addWidget(self.tree_devices)
 
@@ -84,10 +224,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tab_bjt_results = QtWidgets.QWidget()
         self.tab_res = QtWidgets.QWidget()
         self.tab_results = QtWidgets.QWidget()
+        self.tab_sweep = QtWidgets.QWidget()
 
         self.tabs.addTab(self.tab_bjt_results, "BJT Results")
         self.tabs.addTab(self.tab_res, "Resistor Results")
         self.tabs.addTab(self.tab_results, "Result Table")
+        self.tabs.addTab(self.tab_sweep, "Sweep Matrix")
 
         # --- BJT Results: nested tabs ---
         bjt_results_layout = QtWidgets.QVBoxLayout(self.tab_bjt_results)
@@ -106,30 +248,41 @@ class MainWindow(QtWidgets.QMainWindow):
         self.bjt_tabs.addTab(self.tab_bjt_p, "P (Time)")
         self.bjt_tabs.addTab(self.tab_bjt_t, "T (Time)")
 
+        # Each tab holds a stack of cached canvases with persistent artists; only the visible tab is rendered.
         bjt_soa_layout = QtWidgets.QVBoxLayout(self.tab_bjt_soa)
-        self.canvas_soa = MplCanvas()
-        bjt_soa_layout.addWidget(self.canvas_soa)
+        self.plots_soa = PlotStack(_plot_view("soa_plot"))
+        bjt_soa_layout.addWidget(self.plots_soa)
 
         bjt_v_layout = QtWidgets.QVBoxLayout(self.tab_bjt_v)
-        self.canvas_v = MplCanvas()
-        bjt_v_layout.addWidget(self.canvas_v)
+        self.plots_v = PlotStack(_plot_view("voltage_plot"))
+        bjt_v_layout.addWidget(self.plots_v)
 
         bjt_i_layout = QtWidgets.QVBoxLayout(self.tab_bjt_i)
-        self.canvas_i = MplCanvas()
-        bjt_i_layout.addWidget(self.canvas_i)
+        self.plots_i = PlotStack(_plot_view("current_plot"))
+        bjt_i_layout.addWidget(self.plots_i)
 
         bjt_p_layout = QtWidgets.QVBoxLayout(self.tab_bjt_p)
-        self.canvas_p = MplCanvas()
-        bjt_p_layout.addWidget(self.canvas_p)
+        self.plots_p = PlotStack(_plot_view("power_plot"))
+        bjt_p_layout.addWidget(self.plots_p)
 
         bjt_t_layout = QtWidgets.QVBoxLayout(self.tab_bjt_t)
-        self.canvas_t = MplCanvas()
-        bjt_t_layout.addWidget(self.canvas_t)
+        self.plots_t = PlotStack(_plot_view("temperature_plot"))
+        bjt_t_layout.addWidget(self.plots_t)
 
         # --- Resistor Results ---
         res_layout = QtWidgets.QVBoxLayout(self.tab_res)
-        self.canvas_res = MplCanvas()
-        res_layout.addWidget(self.canvas_res)
+        self.plots_res = PlotStack(_plot_view("resistor_plot"))
+        res_layout.addWidget(self.plots_res)
+
+        self._bjt_plot_tabs = {
+            self.tab_bjt_soa: (self.plots_soa, self._update_bjt_soa),
+            self.tab_bjt_v: (self.plots_v, self._update_bjt_v),
+            self.tab_bjt_i: (self.plots_i, self._update_bjt_i),
+            self.tab_bjt_p: (self.plots_p, self._update_bjt_p),
+            self.tab_bjt_t: (self.plots_t, self._update_bjt_t),
+        }
+        self.tabs.currentChanged.connect(self._render_visible_plot)
+        self.bjt_tabs.currentChanged.connect(self._render_visible_plot)
 
         # Results tab: table + export
         results_layout = QtWidgets.QVBoxLayout(self.tab_results)
@@ -137,13 +290,54 @@ class MainWindow(QtWidgets.QMainWindow):
         results_title.setStyleSheet("font-weight: 600;")
         results_layout.addWidget(results_title)
 
-        self.table = QtWidgets.QTableWidget()
+        # Filter bar: device substring, parameter, time range
+        filter_layout = QtWidgets.QHBoxLayout()
+        self.edit_filter_device = QtWidgets.QLineEdit()
+        self.edit_filter_device.setPlaceholderText("Device contains...")
+        self.combo_filter_param = QtWidgets.QComboBox()
+        self.combo_filter_param.addItem("All parameters")
+        self.edit_filter_tmin = QtWidgets.QLineEdit()
+        self.edit_filter_tmin.setPlaceholderText("Time from")
+        self.edit_filter_tmax = QtWidgets.QLineEdit()
+        self.edit_filter_tmax.setPlaceholderText("Time to")
+        self.edit_filter_device.textChanged.connect(self.apply_violation_filter)
+        self.combo_filter_param.currentIndexChanged.connect(self.apply_violation_filter)
+        self.edit_filter_tmin.editingFinished.connect(self.apply_violation_filter)
+        self.edit_filter_tmax.editingFinished.connect(self.apply_violation_filter)
+        filter_layout.addWidget(self.edit_filter_device, 2)
+        filter_layout.addWidget(self.combo_filter_param, 1)
+        filter_layout.addWidget(self.edit_filter_tmin, 1)
+        filter_layout.addWidget(self.edit_filter_tmax, 1)
+        results_layout.addLayout(filter_layout)
+
+        # Virtualized table: cells are formatted on demand from the DataFrame columns.
+        # The model (and pandas with it) is created with the first results.
+        self.table = QtWidgets.QTableView()
+        self.table.horizontalHeader().setSortIndicator(-1, QtCore.Qt.SortOrder.AscendingOrder)
+        self.table.setSortingEnabled(True)
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
         results_layout.addWidget(self.table)
 
         btn_export = QtWidgets.QPushButton("Export Violations as CSV")
         btn_export.clicked.connect(self.on_export_csv)
         results_layout.addWidget(btn_export)
 
+        # Sweep tab: device x run pass/fail matrix (model created with the first sweep)
+        sweep_layout = QtWidgets.QVBoxLayout(self.tab_sweep)
+        self.lbl_sweep = QtWidgets.QLabel("Load a sweep to compare runs.")
+        sweep_layout.addWidget(self.lbl_sweep)
+        self.edit_matrix_device = QtWidgets.QLineEdit()
+        self.edit_matrix_device.setPlaceholderText("Device contains...")
+        self.edit_matrix_device.textChanged.connect(self.apply_matrix_filter)
+        sweep_layout.addWidget(self.edit_matrix_device)
+        self.matrix_table = QtWidgets.QTableView()
+        self.matrix_table.setSortingEnabled(True)
+        self.matrix_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        sweep_layout.addWidget(self.matrix_table)
+        btn_export_matrix = QtWidgets.QPushButton("Export Matrix as CSV")
+        btn_export_matrix.clicked.connect(self.on_export_matrix)
+        sweep_layout.addWidget(btn_export_matrix)
+
         splitter.addWidget(right_widget)
         splitter.setStretchFactor(0, 1)
         splitter.setStretchFactor(1, 2)
@@ -151,18 +345,34 @@ class MainWindow(QtWidgets.QMainWindow):
     # ---------------- File operations ----------------
     def on_load_csv(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Open CSV Data", "", "CSV Files (*.csv);;All Files (*)"
+            self, "Open CSV Data", "", DATA_FILE_FILTER
         )
         if not path:
             return
-        try:
-            df = pd.read_csv(path)
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to read CSV:\n{e}")
-            return
-
+        self._start_job(self._load_csv_job, path, on_done=self._on_csv_loaded, error="Failed to read CSV")
+
+    def _load_csv_job(self, path: str, progress) -> Tuple[str, pd.DataFrame, DeviceCatalog]:
+        # Discovery only needs the header; limits are applied at analysis time.
+        # Binary datasets are memory-mapped by load_csv_cached without a cache entry.
+        progress("Discovering devices", 0, 1)
+        from core.cache import load_csv_cached
+        from core.parser import read_csv_header
+
+        catalog = self.data_cache.load_catalog(path)
+        if catalog is None:
+            catalog = DeviceCatalog.from_columns(read_csv_header(path))
+        df = load_csv_cached(path, catalog.columns(), self.data_cache, catalog, progress=progress)
+        return path, df, catalog
+
+    def _on_csv_loaded(self, result: Tuple[str, pd.DataFrame, DeviceCatalog]) -> None:
+        path, df, catalog = result
         self.state.csv_path = path
         self.state.df = df
+        if self.state.sweep is not None:
+            self.state.sweep = None
+            self.populate_sweep_matrix()
+        self._clear_results()
+        self.lbl_status.setText(f"CSV loaded: {len(df)} rows")
 
         # If no limits loaded yet, try default example file in current directory
         if not self.state.defaults:
@@ -175,12 +385,93 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Show success message
         QtWidgets.QMessageBox.information(
-            self, "Success", f"CSV loaded successfully!\nRows: {len(df)}\nColumns: {len(df.columns)}"
+            self,
+            "Success",
+            f"CSV loaded successfully!\nRows: {len(df)}\nColumns used: {len(df.columns)}\nDevices: {len(catalog)}",
         )
 
         # Update button state
         self._update_analyze_button_state()
 
+    def _clear_results(self) -> None:
+        """
+        Drop the analysis of the previous data: its sample indices and
+        devices do not apply to a newly loaded frame until it is analyzed.
+        """
+        self.state.bjt_devices, self.state.res_devices = [], []
+        self.state.violations_df = None
+        self.state.violation_index = None
+        self.state.device_summary = None
+        self.state.catalog = None
+        self._plot_bjt = self._plot_res = None
+        self.clear_plot_cache()
+        self.populate_device_tree()
+        self.populate_violation_table()
+
+    def on_load_sweep(self) -> None:
+        paths, _ = QtWidgets.QFileDialog.getOpenFileNames(
+            self, "Open Sweep CSVs", "", DATA_FILE_FILTER
+        )
+        if not paths:
+            return
+        if not self.state.defaults:
+            try:
+                self.state.defaults, self.state.overrides = load_limits("soa_limits_ex.json")
+                self.state.limits_path = "soa_limits_ex.json"
+            except Exception:
+                QtWidgets.QMessageBox.warning(self, "Warning", "Please load JSON config first.")
+                return
+        self._start_sweep(paths)
+
+    def _start_sweep(self, paths: List[str]) -> None:
+        self._start_job(
+            self._sweep_job,
+            paths,
+            self.state.defaults,
+            self.state.overrides,
+            episodes=self.chk_episodes.isChecked(),
+            on_done=self._on_sweep_done,
+            error="Failed to analyze sweep",
+        )
+
+    def _sweep_job(
+        self, paths: List[str], defaults: Dict, overrides: Dict, episodes: bool, progress
+    ) -> Tuple[SweepResult, ViolationIndex]:
+        from core.analysis import ViolationIndex
+        from core.sweep import analyze_sweep
+
+        result = analyze_sweep(paths, defaults, overrides, episodes=episodes, progress=progress)
+        progress("Indexing violations", 0, 1)
+        return result, ViolationIndex(result.violations)
+
+    def _on_sweep_done(self, result: Tuple[SweepResult, ViolationIndex]) -> None:
+        sweep, violation_index = result
+        # Runs are not kept in memory, so there are no waveforms to plot in sweep mode.
+        self.state.sweep = sweep
+        self.state.df = None
+        self.state.csv_path = None
+        self.state.catalog = None
+        self.state.bjt_devices = sweep.bjt_devices
+        self.state.res_devices = sweep.res_devices
+        self.state.time_col = sweep.time_col
+        self.state.violations_df = sweep.violations
+        self.state.violation_index = violation_index
+        self.state.device_summary = None
+        self._plot_bjt = self._plot_res = None
+        self.clear_plot_cache()
+
+        self.populate_device_tree()
+        self.populate_violation_table()
+        self.populate_sweep_matrix()
+        self.tabs.setCurrentWidget(self.tab_sweep)
+
+        failed = int((sweep.counts.sum(axis=0) > 0).sum())
+        self.lbl_status.setText(
+            f"Sweep: {len(sweep.runs)} runs ({failed} failing) | BJTs: {len(sweep.bjt_devices)} | "
+            f"Resistors: {len(sweep.res_devices)} | Violations: {len(sweep.violations)}"
+        )
+        self._update_analyze_button_state()
+
     def on_load_json(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, "Open JSON Config", "", "JSON Files (*.json);;All Files (*)"
@@ -208,15 +499,96 @@ class MainWindow(QtWidgets.QMainWindow):
         # Update button state
         self._update_analyze_button_state()
 
+        # Limits changed after an analysis: re-check only the affected devices
+        if self.state.violations_df is not None:
+            self.refresh_devices_and_analysis()
+
+    def on_clear_cache(self) -> None:
+        try:
+            self.data_cache.invalidate()
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to clear cache:\n{e}")
+            return
+        self.lbl_status.setText("Data cache cleared")
+
     def _update_analyze_button_state(self) -> None:
         """Enable Analyze button only if both CSV and JSON are loaded."""
-        has_csv = self.state.df is not None
+        has_csv = self.state.df is not None or self.state.sweep is not None
         has_json = bool(self.state.defaults)
-        self.btn_analyze.setEnabled(has_csv and has_json)
+        self.btn_analyze.setEnabled(has_csv and has_json and self._job is None)
+
+    # ---------------- Background jobs ----------------
+    def _start_job(self, fn, *args, on_done, error: str, **kwargs) -> None:
+        """
+        Run fn(*args, progress=..., **kwargs) on the worker thread. Current
+        results stay visible and usable until `on_done(result)` replaces them.
+        """
+        if self._job is not None:
+            self._job.cancel()
+        worker = Worker(fn, *args, **kwargs)
+        worker.signals.progress.connect(self._on_job_progress)
+        worker.signals.finished.connect(lambda result: self._end_job(worker) and on_done(result))
+        worker.signals.failed.connect(lambda msg: self._end_job(worker) and self._on_job_failed(error, msg))
+        worker.signals.cancelled.connect(lambda: self._end_job(worker) and self.lbl_status.setText("Cancelled"))
+        self._job = worker
+        self._set_busy(True)
+        self.pool.start(worker)
+
+    def _end_job(self, worker: Worker) -> bool:
+        """Clear the busy state; False when `worker` is no longer the current job."""
+        if worker is not self._job:
+            return False
+        self._job = None
+        self._set_busy(False)
+        return True
+
+    def _set_busy(self, busy: bool) -> None:
+        for widget in (self.btn_load_csv, self.btn_load_sweep, self.btn_load_json, self.chk_episodes):
+            widget.setEnabled(not busy)
+        self.btn_cancel.setVisible(busy)
+        self.btn_cancel.setEnabled(busy)
+        self.progress_bar.setVisible(busy)
+        self.progress_bar.setRange(0, 0)
+        self._update_analyze_button_state()
+
+    def _on_job_progress(self, stage: str, done: int, total: int) -> None:
+        if total > 1:
+            self.progress_bar.setRange(0, 1000)
+            self.progress_bar.setValue(int(1000 * done / total))
+        else:
+            self.progress_bar.setRange(0, 0)
+        if stage == "Reading CSV" and total > 0:
+            self.lbl_status.setText(f"{stage}: {100 * done // total}%")
+        elif total > 1:
+            self.lbl_status.setText(f"{stage}: {done}/{total}")
+        else:
+            self.lbl_status.setText(f"{stage}...")
+
+    def _on_job_failed(self, title: str, msg: str) -> None:
+        self.lbl_status.setText("Failed")
+        QtWidgets.QMessageBox.critical(self, "Error", f"{title}:\n{msg}")
+
+    def on_cancel_job(self) -> None:
+        if self._job is not None:
+            self._job.cancel()
+            self.btn_cancel.setEnabled(False)
+            self.lbl_status.setText("Cancelling...")
+
+    def wait_for_jobs(self) -> None:
+        """Block until the current job is done and its result has been applied."""
+        self.pool.waitForDone()
+        QtCore.QCoreApplication.sendPostedEvents()
+        QtCore.QCoreApplication.processEvents()
+
+    def closeEvent(self, event) -> None:
+        if self._job is not None:
+            self._job.cancel()
+        self.pool.waitForDone()
+        super().closeEvent(event)
 
     def on_analyze(self) -> None:
         """Manually trigger analysis after CSV and JSON are loaded."""
-        if self.state.df is None:
+        if self.state.df is None and self.state.sweep is None:
             QtWidgets.QMessageBox.warning(self, "Warning", "Please load CSV data first.")
             return
         if not self.state.defaults:
@@ -226,26 +598,57 @@ class MainWindow(QtWidgets.QMainWindow):
         self.refresh_devices_and_analysis()
 
     def refresh_devices_and_analysis(self) -> None:
+        if self.state.sweep is not None:
+            self._start_sweep(self.state.sweep.paths)
+            return
         if self.state.df is None:
             return
 
-        try:
-            bjt_devices, res_devices, time_col = scan_csv_columns(self.state.df, self.state.defaults, self.state.overrides)
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to parse CSV headers:\n{e}")
-            return
+        self._start_job(
+            self._analysis_job,
+            self.state.df,
+            self.state.defaults,
+            self.state.overrides,
+            episodes=self.chk_episodes.isChecked(),
+            on_done=self._on_analysis_done,
+            error="Failed to analyze CSV",
+        )
+
+    def _analysis_job(
+        self, df: pd.DataFrame, defaults: Dict, overrides: Dict, episodes: bool, progress
+    ) -> Tuple[pd.DataFrame, List[BJTDevice], List[ResistorDevice], str, ViolationIndex, pd.DataFrame]:
+        from core.analysis import ViolationIndex
 
+        # Re-uses discovery and per-device results for unchanged limits on the same data.
+        violations_df, bjt_devices, res_devices, time_col = self.analyzer.analyze(
+            df, defaults, overrides, episodes=episodes, progress=progress
+        )
+        progress("Indexing violations", 0, 1)
+        return violations_df, bjt_devices, res_devices, time_col, ViolationIndex(violations_df), self.analyzer.summary
+
+    def _on_analysis_done(
+        self, result: Tuple[pd.DataFrame, List[BJTDevice], List[ResistorDevice], str, ViolationIndex, pd.DataFrame]
+    ) -> None:
+        violations_df, bjt_devices, res_devices, time_col, violation_index, summary = result
+        # Violation markers differ between per-sample and episode results.
+        episodes = "Peak Time" in violations_df.columns
+        if episodes != self._plot_episodes:
+            self._plot_episodes = episodes
+            self.clear_plot_cache()
         self.state.bjt_devices = bjt_devices
         self.state.res_devices = res_devices
         self.state.time_col = time_col
-
-        self.state.violations_df = analyze_all(self.state.df, self.state.bjt_devices, self.state.res_devices, self.state.time_col)
+        self.state.violations_df = violations_df
+        self.state.violation_index = violation_index
+        self.state.device_summary = summary
+        self.state.catalog = self.analyzer.catalog
 
         self.populate_device_tree()
         self.populate_violation_table()
 
         self.lbl_status.setText(
-            f"CSV: {len(self.state.df)} rows | BJTs: {len(bjt_devices)} | Resistors: {len(res_devices)} | Violations: {len(self.state.violations_df)}"
+            f"CSV: {len(self.state.df)} rows | BJTs: {len(bjt_devices)} | Resistors: {len(res_devices)} | "
+            f"Violations: {len(self.state.violations_df)} | Re-analyzed: {self.analyzer.last_reanalyzed}"
         )
 
         # Auto-select first device if available to show plots
@@ -283,47 +686,121 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # ---------------- Tree + table ----------------
     def populate_device_tree(self) -> None:
+        # Sorting is suspended while filling so children are not re-sorted on every insert.
+        self.tree_devices.setSortingEnabled(False)
         self.tree_devices.clear()
 
-        bjt_root = QtWidgets.QTreeWidgetItem(["BJTs"])
-        res_root = QtWidgets.QTreeWidgetItem(["Resistors"])
-
-        violated = violated_device_names(self.state.violations_df)
-
-        for dev in self.state.bjt_devices:
-            status = "FAIL" if dev.name in violated else "OK"
-            item = QtWidgets.QTreeWidgetItem([dev.name, status])
-            item.setData(0, QtCore.Qt.ItemDataRole.UserRole, ("BJT", dev.name))
-            bjt_root.addChild(item)
-
-        for dev in self.state.res_devices:
-            status = "FAIL" if dev.name in violated else "OK"
-            item = QtWidgets.QTreeWidgetItem([dev.name, status])
-            item.setData(0, QtCore.Qt.ItemDataRole.UserRole, ("RES", dev.name))
-            res_root.addChild(item)
+        bjt_root = DeviceTreeItem(["BJTs"])
+        res_root = DeviceTreeItem(["Resistors"])
+
+        violated = self.state.violation_index.devices() if self.state.violation_index is not None else set()
+        sweep = self.state.sweep
+        failed_runs = sweep.failed_runs() if sweep is not None else {}
+
+        def status_of(name: str) -> str:
+            if name not in violated:
+                return "OK"
+            if sweep is not None:
+                return f"FAIL ({len(failed_runs.get(name, []))}/{len(sweep.runs)} runs)"
+            return "FAIL"
+
+        cells = self._summary_cells(len(self.state.bjt_devices) + len(self.state.res_devices))
+        devices = [("BJT", dev, bjt_root) for dev in self.state.bjt_devices]
+        devices += [("RES", dev, res_root) for dev in self.state.res_devices]
+        for (kind, dev, root), (texts, keys) in zip(devices, cells):
+            status = status_of(dev.name)
+            item = DeviceTreeItem([dev.name, status] + texts, [(0, dev.name), (0, status)] + keys)
+            item.setData(0, QtCore.Qt.ItemDataRole.UserRole, (kind, dev.name))
+            root.addChild(item)
 
         self.tree_devices.addTopLevelItem(bjt_root)
         self.tree_devices.addTopLevelItem(res_root)
         self.tree_devices.expandAll()
+        self.tree_devices.setSortingEnabled(True)
+
+    def _summary_cells(self, n_devices: int) -> List[Tuple[List[str], List[Tuple]]]:
+        """Display texts and sort keys of the summary columns per device (BJTs, then resistors); NaN sorts last."""
+        summary = self.state.device_summary
+        if summary is None or len(summary) != n_devices:
+            blank = ([""] * len(TREE_SUMMARY_COLUMNS), [(1, 0)] * len(TREE_SUMMARY_COLUMNS))
+            return [blank] * n_devices
+
+        columns = []
+        for _, col, fmt in TREE_SUMMARY_COLUMNS:
+            values = summary[col].astype(object).where(summary[col].notna(), None).to_list()
+            texts = ["" if v is None else fmt.format(v) for v in values]
+            keys = [(1, 0) if v is None else (0, v) for v in values]
+            columns.append((texts, keys))
+        return [
+            ([texts[i] for texts, _ in columns], [keys[i] for _, keys in columns])
+            for i in range(n_devices)
+        ]
 
     def populate_violation_table(self) -> None:
         df = self.state.violations_df
-        if df is None:
-            self.table.setRowCount(0)
-            self.table.setColumnCount(0)
-            return
+        if self.violation_model is None:
+            from gui.violation_model import ViolationTableModel
+
+            self.violation_model = ViolationTableModel(self)
+            self.table.setModel(self.violation_model)
+        self.violation_model.set_frame(df)
+
+        # Parameter choices follow the current results; keep the selection if still present
+        current = self.combo_filter_param.currentText()
+        self.combo_filter_param.blockSignals(True)
+        self.combo_filter_param.clear()
+        self.combo_filter_param.addItem("All parameters")
+        self.combo_filter_param.addItems(self.violation_model.column_values("Parameter"))
+        idx = self.combo_filter_param.findText(current)
+        self.combo_filter_param.setCurrentIndex(max(idx, 0))
+        self.combo_filter_param.blockSignals(False)
+
+        self.apply_violation_filter()
+        if df is not None:
+            self.table.resizeColumnsToContents()
+
+    def apply_violation_filter(self) -> None:
+        def parse(edit: QtWidgets.QLineEdit) -> Optional[float]:
+            text = edit.text().strip()
+            try:
+                return float(text) if text else None
+            except ValueError:
+                return None
 
-        self.table.setColumnCount(len(df.columns))
-        self.table.setHorizontalHeaderLabels(list(df.columns))
-        self.table.setRowCount(len(df))
+        if self.violation_model is None:
+            return
+        param = self.combo_filter_param.currentText() if self.combo_filter_param.currentIndex() > 0 else None
+        self.violation_model.set_filter(
+            device=self.edit_filter_device.text(),
+            parameter=param,
+            t_min=parse(self.edit_filter_tmin),
+            t_max=parse(self.edit_filter_tmax),
+        )
 
-        for row in range(len(df)):
-            for col, col_name in enumerate(df.columns):
-                val = str(df.iloc[row][col_name])
-                item = QtWidgets.QTableWidgetItem(val)
-                self.table.setItem(row, col, item)
+    def populate_sweep_matrix(self) -> None:
+        sweep = self.state.sweep
+        if self.matrix_model is None:
+            if sweep is None:
+                return
+            from gui.violation_model import ViolationTableModel
+
+            self.matrix_model = ViolationTableModel(self)
+            self.matrix_table.setModel(self.matrix_model)
+        self.matrix_model.set_frame(sweep.pass_fail_matrix() if sweep is not None else None)
+        self.apply_matrix_filter()
+        if sweep is None:
+            self.lbl_sweep.setText("Load a sweep to compare runs.")
+            return
+        self.matrix_table.resizeColumnsToContents()
+        failing = sweep.counts.any(axis=1)
+        self.lbl_sweep.setText(
+            f"{len(sweep.runs)} runs x {len(failing)} devices | failing in any run: {int(failing.sum())} | "
+            f"in every run: {int(sweep.counts.all(axis=1).sum())}"
+        )
 
-        self.table.resizeColumnsToContents()
+    def apply_matrix_filter(self) -> None:
+        if self.matrix_model is not None:
+            self.matrix_model.set_filter(device=self.edit_matrix_device.text())
 
     # ---------------- Device selection and plots ----------------
     def on_device_selected(self) -> None:
@@ -341,24 +818,59 @@ class MainWindow(QtWidgets.QMainWindow):
             self.show_res_plots(name)
 
     def _find_bjt(self, name: str) -> Optional[BJTDevice]:
-        for dev in self.state.bjt_devices:
-            if dev.name == name:
-                return dev
-        return None
+        return self.state.catalog.bjt(name) if self.state.catalog is not None else None
 
     def _find_res(self, name: str) -> Optional[ResistorDevice]:
-        for dev in self.state.res_devices:
-            if dev.name == name:
-                return dev
-        return None
+        return self.state.catalog.resistor(name) if self.state.catalog is not None else None
 
     def show_bjt_plots(self, name: str) -> None:
+        if self.state.df is None or self._find_bjt(name) is None:
+            return
+        self._plot_bjt = name
+
+        # Default to BJT Results -> BJT SOA tab when selecting a BJT
+        self.tabs.setCurrentWidget(self.tab_bjt_results)
+        self.bjt_tabs.setCurrentWidget(self.tab_bjt_soa)
+        self._render_visible_plot()
+
+    def show_res_plots(self, name: str) -> None:
+        if self.state.df is None or self._find_res(name) is None:
+            return
+        self._plot_res = name
+
+        self.tabs.setCurrentWidget(self.tab_res)
+        self._render_visible_plot()
+
+    def _render_visible_plot(self) -> None:
+        """
+        Draw the plot of the visible tab for the selected device. Rendered
+        canvases are cached per tab by (device, limits, data version), so
+        revisiting a device or tab only switches pages; other devices reuse a
+        canvas and only replace its artists' data.
+        """
         if self.state.df is None:
             return
-        dev = self._find_bjt(name)
+        current = self.tabs.currentWidget()
+        if current is self.tab_bjt_results and self._plot_bjt is not None:
+            dev = self._find_bjt(self._plot_bjt)
+            stack, update = self._bjt_plot_tabs[self.bjt_tabs.currentWidget()]
+        elif current is self.tab_res and self._plot_res is not None:
+            dev = self._find_res(self._plot_res)
+            stack, update = self.plots_res, self._update_res
+        else:
+            return
         if dev is None:
             return
+        stack.display((dev.name, dev.limits, self._plot_version), lambda view: update(view, dev))
 
+    def clear_plot_cache(self) -> None:
+        """Drop all rendered plots, e.g. after new data or a different violation mode."""
+        self._plot_version += 1
+        for stack in (*[s for s, _ in self._bjt_plot_tabs.values()], self.plots_res):
+            stack.clear()
+
+    def _bjt_waveforms(self, dev: BJTDevice) -> Tuple[np.ndarray, ...]:
+        # Derived waveforms are new arrays; plots call this again instead of keeping them (see PlotStack).
         df = self.state.df
         t = df[self.state.time_col].to_numpy()
         vc = df[dev.col_vc].to_numpy()
@@ -369,168 +881,95 @@ class MainWindow(QtWidgets.QMainWindow):
 
         ic = df[dev.col_ic].to_numpy() if dev.col_ic and dev.col_ic in df.columns else None
         ib = df[dev.col_ib].to_numpy() if dev.col_ib and dev.col_ib in df.columns else None
+        return t, vce, vbe, ic, ib
+
+    def _update_bjt_soa(self, view: SoaPlot, dev: BJTDevice) -> None:
+        def load():
+            t, vce, vbe, ic, ib = self._bjt_waveforms(dev)
+            marks = None
+            # Violation markers straight from their recorded sample positions
+            if ic is not None and self.state.violation_index is not None:
+                violation_indices = self.state.violation_index.sample_indices(dev.name, ("VCE", "IC", "SOA"))
+                marks = (vce[violation_indices], ic[violation_indices])
+            return vce, ic, marks
+
+        from core.soa import boundary_outline
+
+        lim = dev.limits
+        boundary = boundary_outline(lim.SOA_BOUNDARY, lim.SOA_SCALE) if lim.SOA_BOUNDARY else None
+        view.update(f"{dev.name} BJT SOA", load, lim.MAX_VCE, lim.MAX_IC, boundary)
+
+    def _update_bjt_v(self, view: TimePlot, dev: BJTDevice) -> None:
+        def load():
+            t, vce, vbe, ic, ib = self._bjt_waveforms(dev)
+            return t, [vce, vbe]
+
+        lim = dev.limits
+        view.update(
+            f"{dev.name} Voltage (Time)",
+            load,
+            [(lim.MAX_VCE, f"VCE limit: ±{lim.MAX_VCE}V"), (lim.MAX_VBE, f"VBE limit: ±{lim.MAX_VBE}V")],
+        )
 
-        # SOA trajectory: VCE vs IC
-        self.canvas_soa.fig.clear()
-        ax = self.canvas_soa.fig.add_subplot(111)
-        ax.set_title(f"{name} BJT SOA")
-        ax.set_xlabel("VCE (V)")
-        ax.set_ylabel("IC (A)")
-
-        if ic is not None and len(ic) > 0:
-            # Make data clearly visible (size + zorder)
-            ax.scatter(vce, ic, s=28, c="tab:blue", alpha=0.75, label="Data", zorder=3)
-            # Mark violations if any
-            if self.state.violations_df is not None:
-                dev_violations = self.state.violations_df[
-                    (self.state.violations_df["Device Name"] == name) & 
-                    (self.state.violations_df["Parameter"].isin(["VCE", "IC"]))
-                ]
-                if not dev_violations.empty:
-                    violation_indices = []
-                    for _, row in dev_violations.iterrows():
-                        time_val = row["Time"]
-                        idx = np.argmin(np.abs(t - time_val))
-                        violation_indices.append(idx)
-                    if violation_indices:
-                        vce_viol = vce[violation_indices]
-                        ic_viol = ic[violation_indices]
-                        ax.scatter(vce_viol, ic_viol, s=60, c="red", marker="x", label="Violations", zorder=5)
-        else:
-            # If no IC data, show VCE vs time-like index
-            ax.scatter(vce, np.arange(len(vce)), s=5, c="blue", alpha=0.6, label="VCE only (no IC column)")
-            ax.set_ylabel("Index")
-
-        # Draw SOA limits rectangle
-        if dev.limits.MAX_VCE and np.isfinite(dev.limits.MAX_VCE) and dev.limits.MAX_IC and np.isfinite(dev.limits.MAX_IC):
-            max_vce = dev.limits.MAX_VCE
-            max_ic = dev.limits.MAX_IC
-            rect_x = [-max_vce, max_vce, max_vce, -max_vce, -max_vce]
-            rect_y = [-max_ic, -max_ic, max_ic, max_ic, -max_ic]
-            ax.plot(rect_x, rect_y, "r--", linewidth=2, label="SOA limits")
-
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        ax.margins(x=0.08, y=0.10)
-        self.canvas_soa.fig.tight_layout()
-        self.canvas_soa.draw()
-
-        # --- V(t) ---
-        self.canvas_v.fig.clear()
-        axv = self.canvas_v.fig.add_subplot(111)
-        axv.set_title(f"{name} Voltage (Time)")
-        if len(t) > 0:
-            axv.plot(t, vce, label="VCE", linewidth=1.8)
-            axv.plot(t, vbe, label="VBE", linewidth=1.8)
-        if dev.limits.MAX_VCE and np.isfinite(dev.limits.MAX_VCE):
-            axv.axhline(dev.limits.MAX_VCE, color="r", linestyle="--", linewidth=1.5, label=f"VCE limit: ±{dev.limits.MAX_VCE}V")
-            axv.axhline(-dev.limits.MAX_VCE, color="r", linestyle="--", linewidth=1.5)
-        if dev.limits.MAX_VBE and np.isfinite(dev.limits.MAX_VBE):
-            axv.axhline(dev.limits.MAX_VBE, color="g", linestyle="--", linewidth=1.5, label=f"VBE limit: ±{dev.limits.MAX_VBE}V")
-            axv.axhline(-dev.limits.MAX_VBE, color="g", linestyle="--", linewidth=1.5)
-        axv.set_xlabel("Time")
-        axv.set_ylabel("V (V)")
-        axv.grid(True, alpha=0.3)
-        axv.legend()
-        self.canvas_v.fig.tight_layout()
-        self.canvas_v.draw()
-
-        # --- I(t) ---
-        self.canvas_i.fig.clear()
-        axi = self.canvas_i.fig.add_subplot(111)
-        axi.set_title(f"{name} Current (Time)")
-        if ic is not None and len(ic) > 0:
-            axi.plot(t, ic, label="IC", linewidth=1.8)
-            if dev.limits.MAX_IC and np.isfinite(dev.limits.MAX_IC):
-                axi.axhline(dev.limits.MAX_IC, color="r", linestyle="--", linewidth=1.5, label=f"IC limit: ±{dev.limits.MAX_IC}A")
-                axi.axhline(-dev.limits.MAX_IC, color="r", linestyle="--", linewidth=1.5)
-        if ib is not None and len(ib) > 0:
-            axi.plot(t, ib, label="IB", linewidth=1.8)
-            if dev.limits.MAX_IB and np.isfinite(dev.limits.MAX_IB):
-                axi.axhline(dev.limits.MAX_IB, color="g", linestyle="--", linewidth=1.5, label=f"IB limit: ±{dev.limits.MAX_IB}A")
-                axi.axhline(-dev.limits.MAX_IB, color="g", linestyle="--", linewidth=1.5)
-        axi.set_xlabel("Time")
-        axi.set_ylabel("I (A)")
-        axi.grid(True, alpha=0.3)
-        axi.legend()
-        self.canvas_i.fig.tight_layout()
-        self.canvas_i.draw()
-
-        # --- P(t) ---
-        self.canvas_p.fig.clear()
-        axp = self.canvas_p.fig.add_subplot(111)
-        axp.set_title(f"{name} Power (Time)")
-        if ic is not None and ib is not None and len(ic) > 0 and len(ib) > 0:
-            p = np.abs(vce * ic) + np.abs(vbe * ib)
-            axp.plot(t, p, label="Power (W)", linewidth=1.8)
-            if dev.limits.MAX_POWER and np.isfinite(dev.limits.MAX_POWER):
-                axp.axhline(
-                    dev.limits.MAX_POWER,
-                    color="r",
-                    linestyle="--",
-                    linewidth=1.5,
-                    label=f"Power limit: {dev.limits.MAX_POWER}W",
-                )
-        axp.set_xlabel("Time")
-        axp.set_ylabel("Power (W)")
-        axp.grid(True, alpha=0.3)
-        axp.legend()
-        self.canvas_p.fig.tight_layout()
-        self.canvas_p.draw()
-
-        # --- T(t) ---
-        self.canvas_t.fig.clear()
-        axt = self.canvas_t.fig.add_subplot(111)
-        axt.set_title(f"{name} Temperature (Time)")
-        temp = df[dev.col_temp].to_numpy() if dev.col_temp and dev.col_temp in df.columns else None
-        if temp is not None and len(temp) > 0:
-            axt.plot(t, temp, label="Temp (°C)", linewidth=1.8)
-            if dev.limits.MAX_TEMP and np.isfinite(dev.limits.MAX_TEMP):
-                axt.axhline(
-                    dev.limits.MAX_TEMP,
-                    color="g",
-                    linestyle="--",
-                    linewidth=1.5,
-                    label=f"Temp limit: {dev.limits.MAX_TEMP}°C",
-                )
-        axt.set_xlabel("Time")
-        axt.set_ylabel("Temp (°C)")
-        axt.grid(True, alpha=0.3)
-        axt.legend()
-        self.canvas_t.fig.tight_layout()
-        self.canvas_t.draw()
+    def _update_bjt_i(self, view: TimePlot, dev: BJTDevice) -> None:
+        def load():
+            t, vce, vbe, ic, ib = self._bjt_waveforms(dev)
+            return t, [ic, ib]
+
+        lim = dev.limits
+        has_ic = bool(dev.col_ic and dev.col_ic in self.state.df.columns)
+        has_ib = bool(dev.col_ib and dev.col_ib in self.state.df.columns)
+        # A limit line is only drawn together with its current.
+        view.update(
+            f"{dev.name} Current (Time)",
+            load,
+            [
+                (lim.MAX_IC if has_ic else None, f"IC limit: ±{lim.MAX_IC}A"),
+                (lim.MAX_IB if has_ib else None, f"IB limit: ±{lim.MAX_IB}A"),
+            ],
+        )
 
-        # Default to BJT Results -> BJT SOA tab when selecting a BJT
-        self.tabs.setCurrentWidget(self.tab_bjt_results)
-        self.bjt_tabs.setCurrentWidget(self.tab_bjt_soa)
+    def _update_bjt_p(self, view: TimePlot, dev: BJTDevice) -> None:
+        import numpy as np
 
-    def show_res_plots(self, name: str) -> None:
-        if self.state.df is None:
-            return
-        dev = self._find_res(name)
-        if dev is None:
-            return
+        def load():
+            t, vce, vbe, ic, ib = self._bjt_waveforms(dev)
+            power = np.abs(vce * ic) + np.abs(vbe * ib) if ic is not None and ib is not None else None
+            return t, [power]
 
         df = self.state.df
-        t = df[self.state.time_col].to_numpy()
-        ir = df[dev.col_ir].to_numpy()
-
-        self.canvas_res.fig.clear()
-        ax = self.canvas_res.fig.add_subplot(111)
-        ax.set_title(f"{name} Current")
-        if len(t) > 0 and len(ir) > 0:
-            ax.plot(t, ir, label="IR", linewidth=1.5)
-        if dev.limits.MAX_RES_CURRENT and np.isfinite(dev.limits.MAX_RES_CURRENT):
-            ax.axhline(dev.limits.MAX_RES_CURRENT, color="r", linestyle="--", linewidth=1.5, label=f"Imax: ±{dev.limits.MAX_RES_CURRENT}A")
-            ax.axhline(-dev.limits.MAX_RES_CURRENT, color="r", linestyle="--", linewidth=1.5)
-        ax.set_xlabel("Time")
-        ax.set_ylabel("Current (A)")
-        ax.grid(True, alpha=0.3)
-        ax.legend()
-        self.canvas_res.fig.tight_layout()
-        self.canvas_res.draw()
+        has_power = all(col and col in df.columns for col in (dev.col_ic, dev.col_ib))
+        lim = dev.limits.MAX_POWER
+        view.update(
+            f"{dev.name} Power (Time)", load, [(lim if has_power else None, f"Power limit: {lim}W")]
+        )
 
-        self.tabs.setCurrentWidget(self.tab_res)
+    def _update_bjt_t(self, view: TimePlot, dev: BJTDevice) -> None:
+        from core.analysis import device_temperature
+
+        def load():
+            df = self.state.df
+            # Without a `.t` column this is the Foster-network estimate from the limits, if any.
+            return df[self.state.time_col].to_numpy(), [device_temperature(df, dev, self.state.time_col)]
+
+        # The estimate is computed once for the title and handed to the view, later reloads recompute it.
+        first = [load()]
+        shown = first[0][1][0] is not None
+        source = "Time, Foster estimate" if shown and not dev.col_temp else "Time"
+        lim = dev.limits.MAX_TEMP
+        view.update(
+            f"{dev.name} Temperature ({source})",
+            lambda: first.pop() if first else load(),
+            [(lim if shown else None, f"Temp limit: {lim}°C")],
+        )
+
+    def _update_res(self, view: TimePlot, dev: ResistorDevice) -> None:
+        def load():
+            df = self.state.df
+            return df[self.state.time_col].to_numpy(), [df[dev.col_ir].to_numpy()]
+
+        lim = dev.limits.MAX_RES_CURRENT
+        view.update(f"{dev.name} Current", load, [(lim, f"Imax: ±{lim}A")])
 
     # ---------------- Export ----------------
     def on_export_csv(self) -> None:
@@ -549,3 +988,18 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to save CSV:\n{e}")
 
+    def on_export_matrix(self) -> None:
+        sweep = self.state.sweep
+        if sweep is None:
+            QtWidgets.QMessageBox.information(self, "Info", "No sweep results to export.")
+            return
+
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Save Sweep Matrix CSV", "soa_sweep_matrix.csv", "CSV Files (*.csv);;All Files (*)"
+        )
+        if not path:
+            return
+        try:
+            sweep.pass_fail_matrix().to_csv(path, index=False)
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to save CSV:\n{e}")
@@ -1,11 +1,172 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib.axes import Axes
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+from core.decimation import grid_indices, minmax_indices
+
+# Lower bounds so traces stay detailed before the canvas has its final size.
+MIN_BUCKETS = 1000
+MIN_CELLS = 400
+# Scatter markers span several pixels, so one point per 2x2 pixel cell is lossless.
+CELL_PIXELS = 2
+
 
 class MplCanvas(FigureCanvas):
     def __init__(self, width: float = 5.0, height: float = 4.0, dpi: int = 100) -> None:
         self.fig = Figure(figsize=(width, height), dpi=dpi)
         super().__init__(self.fig)
 
+
+# Returns the full-resolution (x, y) of a decimated artist again after release().
+DataSource = Callable[[], Tuple[np.ndarray, np.ndarray]]
+
+
+class _Decimated:
+    """
+    Full-resolution data behind a decimated artist. With a `source`,
+    release() drops the arrays (the artist keeps its decimated points) and
+    the next zoom/pan loads them again, so hidden cached plots do not pin
+    full copies of derived waveforms.
+    """
+
+    ax: Axes
+    paused: bool
+    x: Optional[np.ndarray]
+    y: Optional[np.ndarray]
+    source: Optional[DataSource] = None
+
+    def release(self) -> None:
+        if self.source is not None:
+            self.x = self.y = None
+
+    def _data(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self.x is None or self.y is None:
+            x, y = self.source()
+            self.x, self.y = np.asarray(x), np.asarray(y)
+        return self.x, self.y
+
+    def _update(self, ax: Axes) -> None:
+        raise NotImplementedError
+
+
+class DecimatedLine(_Decimated):
+    """
+    Line plot of a long waveform that only hands Matplotlib the min/max
+    samples per pixel column of the visible x range, recomputed on zoom/pan.
+    """
+
+    def __init__(self, ax: Axes, x: np.ndarray, y: np.ndarray, **kwargs) -> None:
+        self.ax = ax
+        self.paused = False
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        idx = minmax_indices(self.x, self.y, self._buckets(ax))
+        (self.line,) = ax.plot(self.x[idx], self.y[idx], **kwargs)
+        # Bound methods are held weakly by Matplotlib; the lambda keeps this object alive with the axes.
+        ax.callbacks.connect("xlim_changed", lambda a: self._update(a))
+
+    @staticmethod
+    def _buckets(ax: Axes) -> int:
+        return max(int(ax.bbox.width), MIN_BUCKETS)
+
+    def set_data(self, x: np.ndarray, y: np.ndarray, source: Optional[DataSource] = None) -> None:
+        """Replace the waveform; decimated over its full range until the axes are rescaled."""
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.source = source
+        idx = minmax_indices(self.x, self.y, self._buckets(self.ax))
+        self.line.set_data(self.x[idx], self.y[idx])
+
+    def _update(self, ax: Axes) -> None:
+        if self.paused:
+            return
+        x, y = self._data()
+        idx = minmax_indices(x, y, self._buckets(ax), ax.get_xlim())
+        self.line.set_data(x[idx], y[idx])
+
+
+class DecimatedScatter(_Decimated):
+    """
+    Scatter plot that draws one point per occupied screen cell of the
+    visible area, recomputed on zoom/pan.
+    """
+
+    def __init__(self, ax: Axes, x: np.ndarray, y: np.ndarray, **kwargs) -> None:
+        self.ax = ax
+        self.paused = False
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        idx = grid_indices(self.x, self.y, self._cells(ax), max_points=self._max_points(ax))
+        self.collection = ax.scatter(self.x[idx], self.y[idx], **kwargs)
+        ax.callbacks.connect("xlim_changed", lambda a: self._update(a))
+        ax.callbacks.connect("ylim_changed", lambda a: self._update(a))
+
+    @staticmethod
+    def _cells(ax: Axes):
+        return (
+            max(int(ax.bbox.width) // CELL_PIXELS, MIN_CELLS),
+            max(int(ax.bbox.height) // CELL_PIXELS, MIN_CELLS),
+        )
+
+    def _max_points(self, ax: Axes) -> int:
+        nx, ny = self._cells(ax)
+        return nx + ny
+
+    def set_data(self, x: np.ndarray, y: np.ndarray, source: Optional[DataSource] = None) -> None:
+        """Replace the points; decimated over their full extent (later, under deferred(), for the final view)."""
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.source = source
+        if not self.paused:
+            idx = grid_indices(self.x, self.y, self._cells(self.ax), max_points=self._max_points(self.ax))
+            self.collection.set_offsets(np.column_stack((self.x[idx], self.y[idx])))
+
+    def extent(self) -> Optional[np.ndarray]:
+        """[[xmin, ymin], [xmax, ymax]] of the finite points, None when there are none."""
+        x, y = self._data()
+        ok = np.isfinite(x) & np.isfinite(y)
+        if not ok.any():
+            return None
+        x, y = x[ok], y[ok]
+        return np.array([[x.min(), y.min()], [x.max(), y.max()]])
+
+    def _update(self, ax: Axes) -> None:
+        if self.paused:
+            return
+        x, y = self._data()
+        idx = grid_indices(x, y, self._cells(ax), ax.get_xlim(), ax.get_ylim(), self._max_points(ax))
+        self.collection.set_offsets(np.column_stack((x[idx], y[idx])))
+
+
+@contextmanager
+def deferred(artists: Sequence[_Decimated]) -> Iterator[None]:
+    """
+    Suspend zoom re-decimation of `artists` while data and limits are
+    swapped (autoscaling fires one callback per axis), then decimate each
+    once for the final view.
+    """
+    for artist in artists:
+        artist.paused = True
+    try:
+        yield
+    finally:
+        for artist in artists:
+            artist.paused = False
+            artist._update(artist.ax)
+
+
+def plot_decimated(ax: Axes, x: np.ndarray, y: np.ndarray, **kwargs) -> DecimatedLine:
+    """Drop-in for ax.plot(x, y, **kwargs) on time-ordered data."""
+    return DecimatedLine(ax, x, y, **kwargs)
+
+
+def scatter_decimated(ax: Axes, x: np.ndarray, y: np.ndarray, **kwargs) -> DecimatedScatter:
+    """Drop-in for ax.scatter(x, y, **kwargs) with a single marker size/colour."""
+    return DecimatedScatter(ax, x, y, **kwargs)
+
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Hashable, List, NamedTuple, Optional
+
+from PyQt6 import QtWidgets
+
+if TYPE_CHECKING:
+    from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
+    from matplotlib.figure import Figure
+
+    from gui.mpl_canvas import MplCanvas
+
+# Rendered plots kept per tab; hidden ones hold an Agg buffer plus their decimated traces only.
+DEFAULT_PLOT_CACHE = 12
+
+
+class _Page(NamedTuple):
+    pane: QtWidgets.QWidget
+    canvas: MplCanvas
+    toolbar: NavigationToolbar2QT
+    view: Any  # built by the stack's factory from canvas.fig
+
+
+class PlotStack(QtWidgets.QStackedWidget):
+    """
+    One canvas (with navigation toolbar) per rendered plot, kept in LRU order
+    and shown one at a time. Redisplaying a cached key only switches pages,
+    so nothing is rebuilt or re-laid out.
+
+    Every canvas holds a persistent view made by factory(figure) (axes,
+    artists, labels). A new key reuses the least recently used canvas once
+    the cache is full, or one released by clear(), and only passes its view
+    to update(view) to swap in new data. Matplotlib is imported when the
+    first canvas is created, so empty stacks cost nothing at startup.
+
+    Views must provide release(), called when their page is hidden, so only
+    the shown page keeps full-resolution data (see gui.device_plots).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Figure], Any],
+        max_entries: int = DEFAULT_PLOT_CACHE,
+        parent: Optional[QtWidgets.QWidget] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.factory = factory
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, _Page]" = OrderedDict()
+        self._spare: List[_Page] = []
+        self._shown: Optional[_Page] = None
+        # Shown while nothing is displayed, e.g. after clear().
+        self._blank = QtWidgets.QWidget()
+        self.addWidget(self._blank)
+
+    def display(self, key: Hashable, update: Callable[[Any], None]) -> MplCanvas:
+        """Show the canvas cached under `key`, calling update(view) on a free canvas first if there is none."""
+        page = self._entries.get(key)
+        if page is not None:
+            self._entries.move_to_end(key)
+            self._show(page)
+            return page.canvas
+
+        if self._spare:
+            page = self._spare.pop()
+        elif len(self._entries) >= self.max_entries:
+            _, page = self._entries.popitem(last=False)
+        else:
+            page = self._new_page()
+        self._show(page)
+        update(page.view)
+        # New data: the toolbar's home/back history belongs to the previous plot.
+        page.toolbar.update()
+        page.canvas.draw()
+        self._entries[key] = page
+        return page.canvas
+
+    def _show(self, page: Optional[_Page]) -> None:
+        if self._shown is not None and self._shown is not page:
+            self._shown.view.release()
+        self._shown = page
+        self.setCurrentWidget(page.pane if page is not None else self._blank)
+
+    def _new_page(self) -> _Page:
+        from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
+
+        from gui.mpl_canvas import MplCanvas
+
+        pane = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(pane)
+        layout.setContentsMargins(0, 0, 0, 0)
+        canvas = MplCanvas()
+        toolbar = NavigationToolbar2QT(canvas, pane)
+        layout.addWidget(canvas)
+        layout.addWidget(toolbar)
+        self.addWidget(pane)
+        return _Page(pane, canvas, toolbar, self.factory(canvas.fig))
+
+    def current_canvas(self) -> Optional[MplCanvas]:
+        for page in self._entries.values():
+            if page.pane is self.currentWidget():
+                return page.canvas
+        return None
+
+    def clear(self) -> None:
+        """Forget all cached plots; their canvases are kept for reuse."""
+        self._spare.extend(self._entries.values())
+        self._entries.clear()
+        self._show(None)
@@ -0,0 +1,107 @@
+"""
+Startup profiling for `python main.py --profile-startup`.
+
+Module import times are measured by wrapping each loader's exec_module, so
+the report lists every module imported after install() with its own
+("self") and total ("cumulative", including nested imports) time. Startup
+stages such as creating the QApplication or the main window are timed with
+stage(). Imports in other threads (the background preload of
+MainWindow.preload_modules) are timed on their own per-thread stack, so
+the report also shows what they cost while competing with the first paint.
+Standard library only, so installing it imports nothing heavy.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+
+class StartupProfiler:
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.modules: Dict[str, Tuple[float, float]] = {}  # name -> (self, cumulative) seconds
+        self.stages: List[Tuple[str, float, float]] = []  # (name, seconds, finished at)
+        self._local = threading.local()  # .stack: child time accumulated per active import, per thread
+        self._finder: Optional[_TimingFinder] = None
+
+    def install(self) -> None:
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        if self._finder is not None and self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.stages.append((name, end - start, end - self.origin))
+
+    def mark(self, name: str) -> None:
+        """Record a zero-length stage, e.g. the moment the first window was painted."""
+        self.stages.append((name, 0.0, time.perf_counter() - self.origin))
+
+    def _timed(self, name: str, fn, arg):
+        """Call fn(arg) as part of importing `name`; create_module and exec_module times add up."""
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return fn(arg)
+        finally:
+            total = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += total
+            own, cumulative = self.modules.get(name, (0.0, 0.0))
+            self.modules[name] = (own + total - children, cumulative + total)
+
+    def report(self, stream: TextIO = sys.stderr, top: int = 30, min_ms: float = 1.0) -> None:
+        out = stream.write
+        out("Startup stages:\n")
+        for name, seconds, at in self.stages:
+            out(f"  {name:<32} {seconds * 1e3:9.1f} ms   (t = {at * 1e3:8.1f} ms)\n")
+
+        rows = sorted(self.modules.items(), key=lambda kv: kv[1][1], reverse=True)
+        shown = [(n, st, cum) for n, (st, cum) in rows if cum * 1e3 >= min_ms][:top]
+        out(f"\nSlowest imports ({len(self.modules)} modules imported, top {len(shown)} by cumulative time):\n")
+        out(f"  {'self ms':>9} {'cumul ms':>9}  module\n")
+        for name, self_s, cum_s in shown:
+            out(f"  {self_s * 1e3:9.1f} {cum_s * 1e3:9.1f}  {name}\n")
+        stream.flush()
+
+
+class _TimingFinder:
+    """Meta path entry that defers to the other finders and times the loaders they return."""
+
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self.profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            loader = spec.loader
+            # Built-in and frozen importers are shared classes; only per-module loader instances are wrapped.
+            # Extension modules do their work in create_module, Python modules in exec_module.
+            if loader is not None and not isinstance(loader, type) and hasattr(loader, "exec_module"):
+                timed = self.profiler._timed
+                create, execute = getattr(loader, "create_module", None), loader.exec_module
+                if create is not None:
+                    loader.create_module = lambda spec, _f=create: timed(fullname, _f, spec)
+                loader.exec_module = lambda module, _f=execute: timed(fullname, _f, module)
+            return spec
+        return None
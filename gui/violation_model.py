@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from PyQt6 import QtCore
+
+
+class ViolationTableModel(QtCore.QAbstractTableModel):
+    """
+    Read-only table model over a violations DataFrame.
+
+    Columns are held as NumPy arrays (categorical columns as codes plus
+    categories) and only the cells Qt asks for are formatted. Sorting and
+    filtering are vectorized and only reorder `self._rows`, the positions
+    of the visible rows in the frame.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._set_frame(None)
+
+    def _set_frame(self, df: Optional[pd.DataFrame]) -> None:
+        self._df = df
+        self._headers: List[str] = [str(c) for c in df.columns] if df is not None else []
+        self._values: List[np.ndarray] = []
+        self._labels: Dict[int, np.ndarray] = {}
+        self._sort_keys: Dict[int, np.ndarray] = {}
+        if df is not None:
+            for col, name in enumerate(df.columns):
+                s = df[name]
+                if isinstance(s.dtype, pd.CategoricalDtype):
+                    self._values.append(s.cat.codes.to_numpy())
+                    self._labels[col] = s.cat.categories.astype(str).to_numpy(dtype=object)
+                else:
+                    self._values.append(s.to_numpy())
+        self._filter_mask: Optional[np.ndarray] = None
+        self._sort_column = -1
+        self._sort_order = QtCore.Qt.SortOrder.AscendingOrder
+        self._rows = np.arange(len(df) if df is not None else 0)
+
+    def set_frame(self, df: Optional[pd.DataFrame]) -> None:
+        self.beginResetModel()
+        self._set_frame(df)
+        self.endResetModel()
+
+    def frame(self) -> Optional[pd.DataFrame]:
+        return self._df
+
+    def visible_frame(self) -> Optional[pd.DataFrame]:
+        """Rows currently shown, in display order."""
+        if self._df is None:
+            return None
+        return self._df.iloc[self._rows]
+
+    def column_values(self, name: str) -> List[str]:
+        """Distinct labels of a categorical column (e.g. the parameters present), sorted."""
+        if name not in self._headers:
+            return []
+        col = self._headers.index(name)
+        if col in self._labels:
+            used = np.unique(self._values[col])
+            return sorted(self._labels[col][used[used >= 0]].tolist())
+        return sorted({str(v) for v in np.unique(self._values[col])})
+
+    # ---------------- Qt model interface ----------------
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        col = index.column()
+        val = self._values[col][self._rows[index.row()]]
+        labels = self._labels.get(col)
+        if labels is not None:
+            return labels[val] if val >= 0 else ""
+        return str(val)
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Orientation.Horizontal:
+            return self._headers[section] if 0 <= section < len(self._headers) else None
+        return str(section + 1)
+
+    def sort(self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.SortOrder.AscendingOrder) -> None:
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column, self._sort_order = column, order
+        self._rows = self._ordered(self._visible_positions())
+        self.layoutChanged.emit()
+
+    # ---------------- Filtering and sorting ----------------
+    def set_filter(
+        self,
+        device: str = "",
+        parameter: Optional[str] = None,
+        t_min: Optional[float] = None,
+        t_max: Optional[float] = None,
+    ) -> None:
+        """
+        Show only rows whose device name contains `device` (case-insensitive),
+        whose parameter equals `parameter` and whose time lies in [t_min, t_max].
+        Episode rows match the time range when [Start Time, End Time] overlaps it.
+        Empty/None arguments disable that part of the filter.
+        """
+        mask: Optional[np.ndarray] = None
+
+        def both(m: np.ndarray) -> np.ndarray:
+            return m if mask is None else mask & m
+
+        if self._df is not None:
+            device = device.strip().lower()
+            if device and "Device Name" in self._headers:
+                mask = both(self._label_mask("Device Name", lambda labels: np.char.find(np.char.lower(labels.astype(str)), device) >= 0))
+            if parameter and "Parameter" in self._headers:
+                mask = both(self._label_mask("Parameter", lambda labels: labels == parameter))
+            if t_min is not None or t_max is not None:
+                lo = -np.inf if t_min is None else t_min
+                hi = np.inf if t_max is None else t_max
+                if "Time" in self._headers:
+                    t = self._values[self._headers.index("Time")]
+                    mask = both((t >= lo) & (t <= hi))
+                elif "Start Time" in self._headers and "End Time" in self._headers:
+                    start = self._values[self._headers.index("Start Time")]
+                    end = self._values[self._headers.index("End Time")]
+                    mask = both((end >= lo) & (start <= hi))
+
+        self.beginResetModel()
+        self._filter_mask = mask
+        self._rows = self._ordered(self._visible_positions())
+        self.endResetModel()
+
+    def _label_mask(self, name: str, match) -> np.ndarray:
+        """Row mask of a column tested once per distinct label, then broadcast through the codes."""
+        col = self._headers.index(name)
+        values = self._values[col]
+        labels = self._labels.get(col)
+        if labels is None:
+            return np.asarray(match(values.astype(str).astype(object)), dtype=bool)
+        hit = np.append(np.asarray(match(labels), dtype=bool), False)
+        # Code -1 (missing) indexes the trailing False.
+        return hit[values]
+
+    def _visible_positions(self) -> np.ndarray:
+        n = len(self._df) if self._df is not None else 0
+        return np.arange(n) if self._filter_mask is None else np.flatnonzero(self._filter_mask)
+
+    def _ordered(self, rows: np.ndarray) -> np.ndarray:
+        col = self._sort_column
+        if col < 0 or col >= len(self._values) or len(rows) == 0:
+            return rows
+        key = self._sort_key(col)[rows]
+        order = np.argsort(key, kind="stable")
+        if self._sort_order == QtCore.Qt.SortOrder.DescendingOrder:
+            order = order[::-1]
+        return rows[order]
+
+    def _sort_key(self, col: int) -> np.ndarray:
+        """Per-row sort key; categorical codes are mapped to the alphabetical rank of their label."""
+        key = self._sort_keys.get(col)
+        if key is None:
+            values = self._values[col]
+            labels = self._labels.get(col)
+            if labels is not None:
+                rank = np.empty(len(labels) + 1, dtype=np.int64)
+                rank[np.argsort(labels, kind="stable")] = np.arange(len(labels))
+                rank[-1] = -1
+                key = rank[values]
+            elif values.dtype == object:
+                key = pd.factorize(values, sort=True)[0]
+            else:
+                key = values
+            self._sort_keys[col] = key
+        return key
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from PyQt6 import QtCore
+
+# Minimum interval between progress signals, so per-device updates do not flood the event loop.
+PROGRESS_INTERVAL_S = 0.05
+
+
+class Cancelled(Exception):
+    """Raised from a job's progress callback once the job has been cancelled."""
+
+
+class WorkerSignals(QtCore.QObject):
+    # object rather than int: byte counts of large files overflow a C++ int.
+    progress = QtCore.pyqtSignal(str, object, object)
+    finished = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+    cancelled = QtCore.pyqtSignal()
+
+
+class Worker(QtCore.QRunnable):
+    """
+    Runs fn(*args, progress=callback, **kwargs) on a thread pool.
+
+    The callback forwards (stage, done, total) to `signals.progress`, rate
+    limited, and raises Cancelled after cancel() so the job stops at its next
+    progress report. The outcome arrives on the GUI thread as exactly one of
+    `signals.finished(result)`, `signals.failed(message)` or `signals.cancelled()`.
+    """
+
+    def __init__(self, fn: Callable, *args, **kwargs) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancelled = False
+        self._last_report = 0.0
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def report(self, stage: str, done: int, total: int) -> None:
+        if self._cancelled:
+            raise Cancelled()
+        now = time.monotonic()
+        if done == 0 or done >= total or now - self._last_report >= PROGRESS_INTERVAL_S:
+            self._last_report = now
+            self.signals.progress.emit(stage, int(done), int(total))
+
+    def run(self) -> None:
+        try:
+            result = self.fn(*self.args, progress=self.report, **self.kwargs)
+        except Cancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            if self._cancelled:
+                self.signals.cancelled.emit()
+            else:
+                self.signals.finished.emit(result)
@@ -1,6 +1,25 @@
+import sys
+from contextlib import nullcontext
+
+
 def main() -> int:
+    # Headless batch mode: core only, PyQt6/Matplotlib are never imported.
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from core.batch import main as batch_main
+
+        return batch_main(sys.argv[2:])
+
+    profiler = None
+    if "--profile-startup" in sys.argv[1:]:
+        from gui.startup_profile import StartupProfiler
+
+        profiler = StartupProfiler()
+        profiler.install()
+    stage = profiler.stage if profiler else nullcontext
+
     try:
-        from PyQt6 import QtWidgets
+        with stage("import PyQt6"):
+            from PyQt6 import QtCore, QtWidgets
     except ModuleNotFoundError as e:  # pragma: no cover
         raise SystemExit(
             "缺少依赖：PyQt6。\n"
@@ -8,14 +27,30 @@ def main() -> int:
             "  pip install -r requirements.txt\n"
         ) from e
 
-    from gui.main_window import MainWindow
+    with stage("create QApplication"):
+        app = QtWidgets.QApplication([])
+    with stage("import gui.main_window"):
+        from gui.main_window import MainWindow
+    with stage("construct MainWindow"):
+        win = MainWindow()
+    with stage("show MainWindow"):
+        win.show()
+    # The first CSV load and plot would otherwise import pandas/Matplotlib on demand. Started
+    # before the profile is reported, so it includes the preload competing with the first paint.
+    with stage("start preload thread"):
+        win.preload_modules()
 
-    app = QtWidgets.QApplication([])
-    win = MainWindow()
-    win.show()
+    if profiler is not None:
+        # Report once the event loop has painted the first window, then exit.
+        def first_window() -> None:
+            profiler.mark("first window (event loop)")
+            profiler.uninstall()
+            profiler.report()
+            app.quit()
+
+        QtCore.QTimer.singleShot(0, first_window)
     return app.exec()
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
@@ -0,0 +1,34 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from core.batch import EXIT_VIOLATIONS, exit_status, run_batch
+
+
+def test_streamed_files_match_whole_files(tmp_path):
+    n = 1000
+    t = np.linspace(0.0, 1e-3, n)
+    df = pd.DataFrame(
+        {
+            "time": t,
+            "X.Q1.c": 4.0 * np.sin(2e4 * t),
+            "X.Q1.b": np.full(n, 0.7),
+            "X.Q1.e": np.zeros(n),
+            "X.Q1.ic": np.full(n, 0.1),
+            "X.Q1.ib": np.full(n, 1e-3),
+        }
+    )
+    df.to_csv(tmp_path / "run.csv", index=False)
+    limits = tmp_path / "limits.json"
+    limits.write_text(json.dumps({"defaults": {"BJT": {"MAX_VCE": 3.0, "PULSE_POWER": [[1e-4, 0.3]]}}}))
+
+    reports = {}
+    for name, stream_bytes in (("whole", 1 << 40), ("streamed", 0)):
+        records = run_batch([str(tmp_path / "run.csv")], str(limits), str(tmp_path / name), workers=1, stream_bytes=stream_bytes)
+        assert records[0]["status"] == "FAIL"
+        assert records[0]["rows"] == n
+        assert exit_status(records) == EXIT_VIOLATIONS
+        reports[name] = pd.read_csv(tmp_path / name / "run_violations.csv")
+    assert len(reports["whole"]) > 0
+    pd.testing.assert_frame_equal(reports["streamed"], reports["whole"])
@@ -0,0 +1,103 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.dataset import (
+    MANIFEST,
+    dataset_dir,
+    is_dataset,
+    load_dataset_columns,
+    read_columns,
+    read_manifest,
+    write_columns,
+)
+from core.parser import load_csv_columns, read_csv_header
+
+
+def _write(directory, df, **extra):
+    manifest = write_columns(str(directory), df)
+    manifest.update(extra)
+    (directory / MANIFEST).write_text(json.dumps(manifest))
+    return manifest
+
+
+@pytest.fixture
+def frame():
+    t = np.linspace(0.0, 1e-3, 11)
+    return pd.DataFrame({"time": t, "X.Q1.c": np.sin(t * 1e4), "X.Q1.b": np.arange(11, dtype=np.int64)})
+
+
+def test_write_columns_describes_files(tmp_path, frame):
+    manifest = _write(tmp_path, frame)
+    assert manifest == {
+        "rows": 11,
+        "columns": ["time", "X.Q1.c", "X.Q1.b"],
+        "files": ["c0.npy", "c1.npy", "c2.npy"],
+        "bytes": 3 * 11 * 8,
+    }
+    assert all((tmp_path / name).is_file() for name in manifest["files"])
+
+
+def test_read_columns_round_trip(tmp_path, frame):
+    _write(tmp_path, frame)
+    manifest = read_manifest(str(tmp_path))
+    arrays = read_columns(str(tmp_path), manifest)
+    assert list(arrays) == list(frame.columns)
+    for col in frame.columns:
+        np.testing.assert_array_equal(arrays[col], frame[col].to_numpy())
+        assert arrays[col].dtype == frame[col].dtype
+    assert isinstance(arrays["time"], np.memmap)
+    assert not arrays["time"].flags.writeable
+
+    loaded = read_columns(str(tmp_path), manifest, ["X.Q1.b", "time"], mmap=False)
+    assert list(loaded) == ["X.Q1.b", "time"]
+    assert not isinstance(loaded["time"], np.memmap)
+    assert read_columns(str(tmp_path), manifest, ["time", "X.Q2.c"]) is None
+
+
+def test_dataset_is_found_by_directory_or_manifest(tmp_path, frame):
+    _write(tmp_path, frame)
+    manifest_path = str(tmp_path / MANIFEST)
+    assert dataset_dir(str(tmp_path)) == str(tmp_path)
+    assert dataset_dir(manifest_path) == str(tmp_path)
+    assert is_dataset(manifest_path)
+    frame.to_csv(tmp_path / "data.csv", index=False)
+    assert not is_dataset(str(tmp_path / "data.csv"))
+    assert not is_dataset(str(tmp_path / "missing"))
+
+
+def test_load_dataset_columns_as_float(tmp_path, frame):
+    _write(tmp_path, frame)
+    for path in (str(tmp_path), str(tmp_path / MANIFEST)):
+        df = load_dataset_columns(path, ["X.Q1.b", "time"])
+        assert list(df.columns) == ["X.Q1.b", "time"]
+        assert (df.dtypes == np.float64).all()
+        np.testing.assert_array_equal(df["X.Q1.b"], np.arange(11.0))
+    pd.testing.assert_frame_equal(load_dataset_columns(str(tmp_path)), frame.astype(float))
+
+
+def test_load_dataset_columns_errors(tmp_path, frame):
+    _write(tmp_path, frame)
+    with pytest.raises(ValueError, match="X.Q2.c"):
+        load_dataset_columns(str(tmp_path), ["time", "X.Q2.c"])
+
+    _write(tmp_path, frame, rows=12)
+    with pytest.raises(ValueError):
+        load_dataset_columns(str(tmp_path), ["time"])
+
+    (tmp_path / MANIFEST).write_text(json.dumps({"rows": 11, "columns": ["time"], "files": []}))
+    with pytest.raises(ValueError):
+        read_manifest(str(tmp_path))
+
+
+def test_parser_dispatches_datasets(tmp_path, frame):
+    _write(tmp_path, frame)
+    frame.to_csv(tmp_path / "data.csv", index=False)
+    assert read_csv_header(str(tmp_path / MANIFEST)) == list(frame.columns)
+    assert read_csv_header(str(tmp_path / "data.csv")) == list(frame.columns)
+    columns = ["time", "X.Q1.c"]
+    from_dataset = load_csv_columns(str(tmp_path), columns)
+    from_csv = load_csv_columns(str(tmp_path / "data.csv"), columns)
+    pd.testing.assert_frame_equal(from_dataset, from_csv, check_like=True)
@@ -0,0 +1,99 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.analysis import _excursion_crossings, analyze_all, find_runs
+from core.config import load_limits
+from core.parser import read_csv_header, scan_columns
+from core.streaming import analyze_csv_chunked
+
+
+def _crossings(t, magnitude, limit):
+    magnitude = np.atleast_2d(np.asarray(magnitude, dtype=float))
+    limit = np.broadcast_to(np.asarray(limit, dtype=float), magnitude.shape)
+    runs = [(row, *find_runs(mask)) for row, mask in enumerate(magnitude > limit)]
+    rows = np.concatenate([np.full(len(starts), row) for row, starts, _ in runs])
+    starts = np.concatenate([starts for _, starts, _ in runs])
+    stops = np.concatenate([stops for _, _, stops in runs])
+    return _excursion_crossings(np.asarray(t, dtype=float), magnitude, limit, rows, starts, stops)
+
+
+def test_triangle_crossings_and_overshoot():
+    # Excess over 1: -1, 1, 3, 1, -1; crossings halfway into the edge steps.
+    entry, exit_time, overshoot = _crossings([0, 1, 2, 3, 4], [0, 2, 4, 2, 0], 1.0)
+    np.testing.assert_allclose(entry, [0.5])
+    np.testing.assert_allclose(exit_time, [3.5])
+    # Two end triangles of 0.25 and two trapezoids of 2.
+    np.testing.assert_allclose(overshoot, [4.5])
+
+
+def test_run_at_data_start_has_no_entry_crossing():
+    entry, exit_time, overshoot = _crossings([0, 1, 2], [3, 3, 0], 1.0)
+    np.testing.assert_allclose(entry, [0.0])
+    np.testing.assert_allclose(exit_time, [1.0 + 2.0 / 3.0])
+    np.testing.assert_allclose(overshoot, [2.0 + 2.0 / 3.0])
+
+
+def test_run_at_data_end_and_single_sample_run():
+    entry, exit_time, overshoot = _crossings([0, 1, 2, 4], [0, 2, 0, 3], 1.0)
+    # Sample 1 alone: excess 1 between neighbours at -1, a triangle of base 1.
+    np.testing.assert_allclose(entry, [0.5, 2.0 + 2.0 / 3.0])
+    np.testing.assert_allclose(exit_time, [1.5, 4.0])
+    np.testing.assert_allclose(overshoot, [0.5, 0.5 * 2.0 * (4.0 / 3.0)])
+
+
+def test_neighbour_not_below_edge_limit_starts_at_sample():
+    # Pulse rules: the limit drops from 5 to 1 at sample 1 while the value stays at 2.
+    entry, _, overshoot = _crossings([0, 1, 2, 3], [[2, 2, 2, 0]], [[5, 1, 1, 1]])
+    np.testing.assert_allclose(entry, [1.0])
+    # Trapezoid of 1 over [1, 2] plus the exit triangle out to 2.5.
+    np.testing.assert_allclose(overshoot, [1.25])
+
+
+def test_several_rows_and_runs():
+    t = [0, 1, 2, 3, 4, 5]
+    magnitude = [[0, 2, 0, 0, 2, 0], [2, 2, 0, 0, 0, 0]]
+    entry, exit_time, overshoot = _crossings(t, magnitude, 1.0)
+    np.testing.assert_allclose(entry, [0.5, 3.5, 0.0])
+    np.testing.assert_allclose(exit_time, [1.5, 4.5, 1.5])
+    np.testing.assert_allclose(overshoot, [0.5, 0.5, 1.25])
+
+
+def test_no_runs():
+    entry, exit_time, overshoot = _crossings([0, 1], [0, 0], 1.0)
+    assert len(entry) == len(exit_time) == len(overshoot) == 0
+
+
+@pytest.fixture
+def triangle_wave(tmp_path):
+    """VCE rising and falling linearly between 0 and 4 V, limit 3 V, on an irregular grid."""
+    rng = np.random.default_rng(0)
+    t = np.sort(np.concatenate(([0.0, 2.0], rng.uniform(0, 2, 500), [0.375, 0.5, 0.625, 1.375, 1.5, 1.625])))
+    vce = 4.0 - 16.0 * np.abs((t % 1.0) - 0.5)
+    vce = np.clip(vce, 0.0, None)
+    df = pd.DataFrame({"time": t, "X.Q0.c": vce, "X.Q0.b": np.full(len(t), 0.5), "X.Q0.e": np.zeros(len(t))})
+    csv = tmp_path / "tri.csv"
+    df.to_csv(csv, index=False)
+    limits = tmp_path / "limits.json"
+    limits.write_text(json.dumps({"defaults": {"BJT": {"MAX_VCE": 3.0}}}))
+    return str(csv), str(limits), df
+
+
+def test_episodes_of_piecewise_linear_signal(triangle_wave):
+    csv, limits, df = triangle_wave
+    defaults, overrides = load_limits(limits)
+    bjt, res, time_col = scan_columns(read_csv_header(csv), defaults, overrides)
+    episodes = analyze_all(df, bjt, res, time_col, episodes=True)
+    # Above 3 V from 0.4375 to 0.5625 in every period: linear interpolation is exact.
+    np.testing.assert_allclose(episodes["Entry Time"], [0.4375, 1.4375])
+    np.testing.assert_allclose(episodes["Exit Time"], [0.5625, 1.5625])
+    np.testing.assert_allclose(episodes["Time Above"], [0.125, 0.125])
+    # A triangle of height 1 V over 0.125 s.
+    np.testing.assert_allclose(episodes["Overshoot Integral"], [0.0625, 0.0625])
+
+    obj = lambda f: f.astype({c: object for c in f.select_dtypes("category")}).reset_index(drop=True)
+    for chunk in (1, 3, 97):
+        streamed, *_ = analyze_csv_chunked(csv, defaults, overrides, chunk_rows=chunk, episodes=True)
+        pd.testing.assert_frame_equal(obj(streamed), obj(episodes), check_dtype=False, rtol=1e-12)
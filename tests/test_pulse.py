@@ -0,0 +1,157 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.analysis import analyze_batched, analyze_bjt
+from core.config import load_limits
+from core.models import BJTDevice, BJTLimits
+from core.pulse import cumulative_energy, evaluate_pulse, pulse_rules, time_above, window_mean
+from core.streaming import analyze_csv_chunked
+
+
+def test_time_above_measures_from_run_start():
+    t = np.array([0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    above = np.array([[False, True, True, False, True, True]])
+    got = time_above(t, above)
+    np.testing.assert_array_equal(got[above], [0.0, 1.0, 0.0, 1.0])
+
+
+def test_time_above_run_at_first_sample():
+    t = np.array([0.0, 0.5, 2.0])
+    above = np.array([[True, True, False]])
+    np.testing.assert_array_equal(time_above(t, above)[0, :2], [0.0, 0.5])
+
+
+def test_cumulative_energy_is_trapezoidal():
+    t = np.array([0.0, 1.0, 3.0])
+    power = np.array([[0.0, 2.0, 2.0]])
+    np.testing.assert_allclose(cumulative_energy(t, power), [[0.0, 1.0, 5.0]])
+
+
+def test_window_mean_full_and_interpolated_windows():
+    t = np.array([0.0, 1.0, 2.0, 3.0])
+    power = np.array([[0.0, 2.0, 2.0, 2.0]])
+    energy = cumulative_energy(t, power)  # [0, 1, 3, 5]
+    mean = window_mean(t, energy, 2.0, power)
+    # (1, 3]: (5 - 1) / 2; (0, 2]: 3 / 2
+    assert mean[0, 3] == pytest.approx(2.0)
+    assert mean[0, 2] == pytest.approx(1.5)
+    # Window start 1.5 falls between samples: E(1.5) = 1 + 0.5 * 2 = 2.
+    assert window_mean(t, energy, 1.5, power)[0, 3] == pytest.approx(2.0)
+
+
+def test_window_mean_counts_power_before_start_as_zero():
+    t = np.array([0.0, 1.0, 2.0, 3.0])
+    power = np.array([[4.0, 2.0, 2.0, 2.0]])
+    energy = cumulative_energy(t, power)  # [0, 3, 5, 7]
+    # Every window reaches back before t = 0 and is divided by its full width.
+    np.testing.assert_allclose(window_mean(t, energy, 10.0, power), [[0.0, 0.3, 0.5, 0.7]])
+
+
+def test_window_mean_without_energy():
+    empty = np.empty((2, 0))
+    assert window_mean(np.empty(0), empty, 1.0, empty).shape == (2, 0)
+    one = np.array([[3.0], [4.0]])
+    np.testing.assert_array_equal(window_mean(np.array([0.0]), np.zeros((2, 1)), 1.0, one), one)
+
+
+def test_amplitude_table_allows_short_pulses():
+    # 4 V at any time, 3 V for up to 1 s, DC 2 V for up to 5 s (binary-exact times).
+    table = ((1.0, 4.0), (5.0, 3.0))
+    t = np.arange(50) * 0.5
+    x = np.zeros(50)
+    x[10:15] = 3.5
+    reported, limit, ratio = evaluate_pulse(t, x[None], np.abs(x)[None], pulse_rules(table, 2.0, mean=False))
+    # Time above 3 V: 0, 0.5, 1, 1.5, 2 s; only samples past 1 s violate.
+    np.testing.assert_array_equal(np.flatnonzero(ratio[0] > 1), [13, 14])
+    np.testing.assert_array_equal(limit[0, 13:15], 3.0)
+    np.testing.assert_array_equal(reported[0, 13:15], 3.5)
+
+
+def test_amplitude_table_above_shortest_level():
+    table = ((1.0, 4.0), (5.0, 3.0))
+    t = np.arange(10) * 0.5
+    x = np.zeros(10)
+    x[4] = 5.0
+    _, _, ratio = evaluate_pulse(t, x[None], x[None], pulse_rules(table, None, mean=False))
+    np.testing.assert_array_equal(np.flatnonzero(ratio[0] > 1), [4])
+    assert ratio[0, 4] == pytest.approx(5.0 / 4.0)
+
+
+def test_amplitude_table_dc_limit_after_longest_pulse():
+    table = ((1.0, 4.0), (5.0, 3.0))
+    t = np.arange(50) * 0.5
+    x = np.full(50, 2.5)
+    _, limit, ratio = evaluate_pulse(t, x[None], x[None], pulse_rules(table, 2.0, mean=False))
+    # Above the 2 V DC limit for more than 5 s from sample 11 on.
+    np.testing.assert_array_equal(np.flatnonzero(ratio[0] > 1), np.arange(11, 50))
+    np.testing.assert_array_equal(limit[0, 11:], 2.0)
+
+
+def _power_pulse(n, first):
+    """10 W over samples first..first + 8 of a 1 s grid."""
+    p = np.zeros(n)
+    p[first : first + 9] = 10.0
+    return p
+
+
+def test_power_pulse_judged_the_same_wherever_it_starts():
+    # 5 W mean over 10 s. Rising from the sample before it, E = 5 + 10 k at
+    # sample first + k up to 85, then 90; means (E(t) - E(t - 10)) / 10.
+    rules = pulse_rules(((10.0, 5.0),), None, mean=True)
+    t = np.arange(100.0)
+    expected = [5.5, 6.5, 7.5, 8.5, 9.0, 8.5, 7.5, 6.5, 5.5]
+    for first in (1, 51):
+        p = _power_pulse(100, first)[None]
+        reported, _, ratio = evaluate_pulse(t, p, p, rules)
+        np.testing.assert_array_equal(np.flatnonzero(ratio[0] > 1), np.arange(first + 5, first + 14))
+        np.testing.assert_allclose(reported[0, first + 5 : first + 14], expected)
+
+
+def test_power_pulse_at_first_sample():
+    # No rising edge in the data: E = 10 k, then 85; windows before t = 0 add nothing.
+    rules = pulse_rules(((10.0, 5.0),), None, mean=True)
+    p = _power_pulse(100, 0)[None]
+    reported, _, ratio = evaluate_pulse(np.arange(100.0), p, p, rules)
+    np.testing.assert_array_equal(np.flatnonzero(ratio[0] > 1), np.arange(6, 14))
+    np.testing.assert_allclose(reported[0, :6], [0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    np.testing.assert_allclose(reported[0, 6:14], [6.0, 7.0, 8.0, 8.5, 8.5, 7.5, 6.5, 5.5])
+
+
+def _bjt_frame(ic):
+    n = len(ic)
+    zeros = np.zeros(n)
+    return pd.DataFrame({"time": np.arange(float(n)), "q.c": np.full(n, 2.0), "q.b": zeros, "q.e": zeros, "q.ib": zeros, "q.ic": ic})
+
+
+def _power_device():
+    limits = BJTLimits(MAX_VCE=float("inf"), MAX_VBE=float("inf"), PULSE_POWER=((10.0, 5.0),))
+    return BJTDevice("Q", "q.c", "q.b", "q.e", col_ib="q.ib", col_ic="q.ic", limits=limits)
+
+
+def test_power_pulse_position_in_both_engines():
+    dev = _power_device()
+    for first in (1, 51):
+        # 2 V * 5 A = 10 W, as in _power_pulse.
+        df = _bjt_frame(_power_pulse(100, first) / 2.0)
+        for violations in (analyze_bjt(df, dev, "time"), analyze_batched(df, [dev], [], "time")):
+            power = violations[violations["Parameter"] == "POWER"]
+            assert list(power["Sample Index"]) == list(range(first + 5, first + 14))
+            np.testing.assert_array_equal(power["Limit"], 5.0)
+
+
+def test_power_table_on_empty_data(tmp_path):
+    dev = _power_device()
+    df = _bjt_frame(np.empty(0))
+    assert analyze_bjt(df, dev, "time").empty
+    assert analyze_batched(df, [dev], [], "time").empty
+
+    csv = tmp_path / "empty.csv"
+    pd.DataFrame(columns=["time", "X.Q0.c", "X.Q0.b", "X.Q0.e", "X.Q0.ib", "X.Q0.ic"]).to_csv(csv, index=False)
+    limits = tmp_path / "limits.json"
+    limits.write_text(json.dumps({"defaults": {"BJT": {"PULSE_POWER": [[10.0, 5.0]]}}}))
+    violations, bjt, _, _ = analyze_csv_chunked(str(csv), *load_limits(str(limits)), chunk_rows=4)
+    assert [d.name for d in bjt] == ["Q0"]
+    assert violations.empty
@@ -0,0 +1,85 @@
+import math
+
+import numpy as np
+import pytest
+
+from core.config import soa_boundary
+from core.soa import boundary_distance, boundary_outline
+
+# 1 A up to 1 V, then the 1 W hyperbola (a straight line of slope -1 in log-log) to 10 V.
+HYPERBOLA = ((1.0, 1.0), (10.0, 0.1))
+LOG2 = math.log10(2.0)
+
+
+@pytest.mark.parametrize(
+    "vce, ic, expected",
+    [
+        (0.1, 0.5, -LOG2),  # below the flat current limit: 0.301 decades under IC = 1 A
+        (2.0, 0.5, 0.0),  # on the hyperbola
+        (2.0, 1.0, LOG2 / math.sqrt(2.0)),  # above the slope, nearest point on it
+        (-2.0, -1.0, LOG2 / math.sqrt(2.0)),  # mirrored quadrant
+        (20.0, 0.01, LOG2),  # beyond the last VCE, nearest to the voltage limit
+        (0.1, 2.0, LOG2),  # above the flat current limit
+        (10.0, 0.01, 0.0),  # on the voltage limit
+        (5.0, 0.01, -LOG2),  # inside, nearest the voltage limit 0.301 decades to the right
+    ],
+)
+def test_loglog_distance(vce, ic, expected):
+    got = boundary_distance(np.array([vce]), np.array([ic]), HYPERBOLA)
+    assert got[0] == pytest.approx(expected, abs=1e-12)
+
+
+def test_loglog_zero_current_is_inside():
+    got = boundary_distance(np.array([5.0]), np.array([0.0]), HYPERBOLA)
+    assert got[0] < 0
+
+
+def test_linear_distance_in_normalized_units():
+    # Normalized by (3 V, 2 A): breakpoints (1/3, 1) and (1, 1/2).
+    points = ((1.0, 2.0), (3.0, 1.0))
+    vce = np.array([2.0, 3.0, 0.0, 1.5])
+    ic = np.array([2.0, 0.0, 1.0, 1.5])
+    got = boundary_distance(vce, ic, points, scale="linear")
+    # (2/3, 1) is 0.2 above the line through the breakpoints; (1, 0) lies on
+    # the voltage limit; (0, 1/2) is 1/2 under the current limit.
+    np.testing.assert_allclose(got[:3], [0.2, 0.0, -0.5], atol=1e-12)
+    assert got[3] < 0
+
+
+def test_distance_keeps_shape_and_nan():
+    vce = np.array([[2.0, 2.0], [20.0, 0.1]])
+    ic = np.array([[1.0, np.nan], [0.01, 0.5]])
+    got = boundary_distance(vce, ic, HYPERBOLA)
+    assert got.shape == (2, 2)
+    assert np.isnan(got[0, 1])
+    np.testing.assert_allclose(got[[0, 1, 1], [0, 0, 1]], [LOG2 / math.sqrt(2.0), LOG2, -LOG2], atol=1e-12)
+
+
+def test_outline_is_closed_and_symmetric():
+    for scale in ("loglog", "linear"):
+        x, y = boundary_outline(HYPERBOLA, scale)
+        assert (x[0], y[0]) == (0.0, 1.0)
+        assert (abs(x[-1]), y[-1]) == (0.0, 1.0)
+        assert x.max() == 10.0 and x.min() == -10.0
+        assert y.max() == 1.0 and y.min() == -1.0
+
+
+def test_outline_samples_loglog_segments_on_the_curve():
+    x, y = boundary_outline(HYPERBOLA, "loglog")
+    on_slope = (x > 1.0) & (x < 10.0) & (y > 0)
+    assert on_slope.any()
+    np.testing.assert_allclose(x[on_slope] * y[on_slope], 1.0)
+
+
+def test_config_rejects_malformed_boundaries():
+    assert soa_boundary(None, None) == (None, "loglog")
+    assert soa_boundary([[1, 2], [3, 1]], "linear") == (((1.0, 2.0), (3.0, 1.0)), "linear")
+    for points, scale in (
+        ([[1, 1]], None),
+        ([[2, 1], [1, 0.5]], None),
+        ([[1, 1], [2, 0]], None),
+        ("1,1", None),
+        ([[1, 1], [2, 0.5]], "semilog"),
+    ):
+        with pytest.raises(ValueError):
+            soa_boundary(points, scale)
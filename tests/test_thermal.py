@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from core.thermal import SPAN, foster_temperature
+
+
+def _grid(end, n, seed=0):
+    """Sorted nonuniform time axis on [0, end] with both ends included."""
+    inner = np.sort(np.random.default_rng(seed).uniform(0.0, end, n - 2))
+    return np.concatenate(([0.0], inner, [end]))
+
+
+def _naive(t, power, r, tau):
+    """Step-by-step recurrence of one branch, the form quoted in core.thermal."""
+    theta = np.zeros(len(t))
+    for k in range(len(t) - 1):
+        h = t[k + 1] - t[k]
+        a = np.exp(-h / tau)
+        g = (1 - a) * tau / h
+        theta[k + 1] = a * theta[k] + r * (power[k + 1] * (1 - g) + power[k] * (g - a))
+    return theta
+
+
+def test_constant_power_step_response():
+    t = _grid(5e-3, 200)
+    r, c, p = 2.0, 5e-4, 3.0  # tau = 1 ms
+    temp, _ = foster_temperature(t, np.full((1, len(t)), p), [r], [c], np.array([25.0]))
+    np.testing.assert_allclose(temp[0], 25.0 + r * p * (1 - np.exp(-t / (r * c))), rtol=1e-12, atol=1e-12)
+
+
+def test_branches_add_above_ambient():
+    t = _grid(1e-2, 300)
+    r, c, p = [0.5, 1.5], [2e-3, 4e-3], 4.0
+    temp, state = foster_temperature(t, np.full((2, len(t)), p), r, c, np.array([25.0, 40.0]))
+    branches = np.array([ri * p * (1 - np.exp(-t / (ri * ci))) for ri, ci in zip(r, c)])
+    np.testing.assert_allclose(temp, np.array([25.0, 40.0])[:, None] + branches.sum(axis=0), rtol=1e-12)
+    assert state[0] == t[-1]
+    np.testing.assert_allclose(state[2], np.tile(branches[:, -1], (2, 1)), rtol=1e-12)
+
+
+def test_linear_power_is_exact_across_rebased_blocks():
+    # Ramp P = k * t over 2000 time constants: four rebased blocks of SPAN.
+    tau, r = 1e-3, 2.0
+    t = _grid(4 * SPAN * tau, 5000)
+    k = 10.0
+    temp, _ = foster_temperature(t, (k * t)[None], [r], [tau / r], np.zeros(1))
+    expected = r * k * (t - tau * (1 - np.exp(-t / tau)))
+    np.testing.assert_allclose(temp[0], expected, rtol=1e-10, atol=1e-12)
+
+
+def test_long_run_matches_recurrence_and_settles():
+    tau, r, p = 1e-3, 2.0, 3.0
+    t = _grid(3 * SPAN * tau, 4000, seed=1)
+    power = np.where(t < 1.2, p, 0.0)
+    temp, _ = foster_temperature(t, power[None], [r], [tau / r], np.zeros(1))
+    np.testing.assert_allclose(temp[0], _naive(t, power, r, tau), rtol=1e-9, atol=1e-12)
+    # Steady state R * P before the power is removed, back to ambient well after.
+    assert temp[0][np.searchsorted(t, 1.1)] == pytest.approx(r * p, rel=1e-12)
+    assert temp[0, -1] == pytest.approx(0.0, abs=1e-12)
+
+
+def test_chunks_continue_from_state():
+    tau, r = 1e-3, 2.0
+    t = _grid(1.5, 3000, seed=2)
+    power = np.vstack((np.abs(np.sin(t * 40.0)), np.where(t < 0.7, 1.0, 0.25)))
+    whole, _ = foster_temperature(t, power, [r, 0.3], [tau / r, 0.1], np.array([25.0, 30.0]))
+    parts, state = [], None
+    for lo, hi in ((0, 1), (1, 700), (700, 701), (701, 3000)):
+        part, state = foster_temperature(t[lo:hi], power[:, lo:hi], [r, 0.3], [tau / r, 0.1], np.array([25.0, 30.0]), state)
+        parts.append(part)
+    np.testing.assert_allclose(np.hstack(parts), whole, rtol=1e-12, atol=1e-12)
+
+
+def test_empty_chunk_keeps_state():
+    t = np.array([0.0, 1e-3])
+    _, state = foster_temperature(t, np.ones((1, 2)), [1.0], [1e-3], np.zeros(1))
+    temp, again = foster_temperature(np.empty(0), np.empty((1, 0)), [1.0], [1e-3], np.zeros(1), state)
+    assert temp.shape == (1, 0)
+    np.testing.assert_array_equal(again[2], state[2])
+
+
+def test_serial_temperature_check_matches_batched():
+    import pandas as pd
+
+    from core.analysis import analyze_batched, analyze_bjt, device_temperature
+    from core.models import BJTDevice, BJTLimits
+
+    n = 400
+    t = np.arange(n) * 1e-4
+    zeros = np.zeros(n)
+    # 2 V * 5 A = 10 W for the first half: 25 + 10 * 10 * (1 - exp(-t / 1 ms)) reaches 125 C.
+    ic = np.where(t < 0.02, 5.0, 0.0)
+    df = pd.DataFrame({"time": t, "q.c": np.full(n, 2.0), "q.b": zeros, "q.e": zeros, "q.ib": zeros, "q.ic": ic})
+    limits = BJTLimits(MAX_VCE=float("inf"), MAX_VBE=float("inf"), MAX_TEMP=100.0, THERMAL_R=(10.0,), THERMAL_C=(1e-4,))
+    dev = BJTDevice("Q", "q.c", "q.b", "q.e", col_ib="q.ib", col_ic="q.ic", limits=limits)
+
+    temp = device_temperature(df, dev, "time", power=2.0 * ic)
+    np.testing.assert_allclose(temp, device_temperature(df, dev, "time"))
+    serial = analyze_bjt(df, dev, "time")
+    batched = analyze_batched(df, [dev], [], "time")
+    expected = np.flatnonzero(temp > 100.0)
+    assert len(expected) > 0
+    assert list(serial["Sample Index"]) == list(expected) == list(batched["Sample Index"])
+    np.testing.assert_allclose(serial["Value"], temp[expected])